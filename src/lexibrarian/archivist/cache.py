@@ -0,0 +1,160 @@
+"""Content-addressed cache of archivist LLM responses.
+
+Design file generation is a pure function of the prompt templates, the
+selected client and the request fields.  :class:`CachedArchivistService`
+keys each successful response by a SHA-256 over all of those and stores it
+under ``.lexibrary/.llm_cache/<key[:2]>/<key>.json``, so regenerating a
+design file for content that has been seen before (a reverted edit, a
+deleted design file, a re-run on the same commit) replays the stored
+response instead of calling the LLM.
+
+Failed generations are never cached.  Replaying is opt-in
+(``llm.response_cache``), and :meth:`CachedArchivistService.prune` keeps the
+cache to ``llm.response_cache_max_entries`` entries, evicting the least
+recently used first.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+from dataclasses import asdict
+from functools import cache
+from pathlib import Path
+
+from pydantic import ValidationError
+
+from lexibrarian.archivist.service import (
+    ArchivistService,
+    DesignFileRequest,
+    DesignFileResult,
+)
+from lexibrarian.baml_client.inlinedbaml import get_baml_files
+from lexibrarian.baml_client.types import DesignFileOutput
+from lexibrarian.config.schema import LLMConfig
+from lexibrarian.llm.rate_limiter import RateLimiter
+from lexibrarian.utils.atomic import atomic_write
+
+logger = logging.getLogger(__name__)
+
+LLM_CACHE_DIRNAME = ".llm_cache"
+
+_CACHE_VERSION = 1
+
+
+@cache
+def _prompt_fingerprint() -> str:
+    """Return a digest of the BAML sources the archivist prompts are built from."""
+    digest = hashlib.sha256()
+    for name, source in sorted(get_baml_files().items()):  # type: ignore[no-untyped-call]
+        digest.update(f"{name}\0{source}\0".encode())
+    return digest.hexdigest()
+
+
+def design_file_cache_key(config: LLMConfig, request: DesignFileRequest) -> str:
+    """Return the cache key for a design file *request* under *config*."""
+    payload = {
+        "version": _CACHE_VERSION,
+        "function": "ArchivistGenerateDesignFile",
+        "provider": config.provider,
+        "model": config.model,
+        "prompts": _prompt_fingerprint(),
+        "request": asdict(request),
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+class CachedArchivistService(ArchivistService):
+    """ArchivistService that replays cached design file responses.
+
+    Cache misses fall through to the LLM; successful responses are written
+    back so the next identical request is served from disk.
+    """
+
+    def __init__(
+        self,
+        rate_limiter: RateLimiter,
+        config: LLMConfig,
+        cache_dir: Path,
+    ) -> None:
+        super().__init__(rate_limiter=rate_limiter, config=config)
+        self._cache_dir = cache_dir
+        self._max_entries = config.response_cache_max_entries
+
+    def _entry_path(self, key: str) -> Path:
+        return self._cache_dir / key[:2] / f"{key}.json"
+
+    def _load(self, key: str) -> DesignFileOutput | None:
+        path = self._entry_path(key)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError):
+            logger.warning("Corrupted LLM cache entry at %s, ignoring", path)
+            return None
+        try:
+            output = DesignFileOutput.model_validate(data)
+        except ValidationError:
+            logger.warning("Corrupted LLM cache entry at %s, ignoring", path)
+            return None
+        # Entry mtimes double as last-use times for prune()
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        return output
+
+    def _store(self, key: str, output: DesignFileOutput) -> None:
+        path = self._entry_path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write(path, output.model_dump_json())
+        except OSError:
+            logger.warning("Could not write LLM cache entry to %s", path)
+
+    def prune(self) -> int:
+        """Delete the least recently used entries beyond the configured limit.
+
+        Returns the number of entries removed.
+        """
+        entries: list[tuple[float, str]] = []
+        try:
+            shards = [e.path for e in os.scandir(self._cache_dir) if e.is_dir()]
+        except OSError:
+            return 0
+        for shard in shards:
+            try:
+                with os.scandir(shard) as it:
+                    for entry in it:
+                        if entry.name.endswith(".json"):
+                            with contextlib.suppress(OSError):
+                                entries.append((entry.stat().st_mtime, entry.path))
+            except OSError:
+                continue
+        excess = len(entries) - self._max_entries
+        if excess <= 0:
+            return 0
+        entries.sort()
+        removed = 0
+        for _mtime, path in entries[:excess]:
+            with contextlib.suppress(OSError):
+                os.unlink(path)
+                removed += 1
+        if removed:
+            logger.info("Pruned %d LLM cache entries from %s", removed, self._cache_dir)
+        return removed
+
+    async def generate_design_file(self, request: DesignFileRequest) -> DesignFileResult:
+        """Return a cached design file response, or generate and cache one."""
+        key = design_file_cache_key(self._config, request)
+        cached = self._load(key)
+        if cached is not None:
+            logger.info("Design file for %s served from cache (cached: true)", request.source_path)
+            return DesignFileResult(source_path=request.source_path, design_file_output=cached)
+
+        result = await super().generate_design_file(request)
+        if not result.error and result.design_file_output is not None:
+            self._store(key, result.design_file_output)
+        return result
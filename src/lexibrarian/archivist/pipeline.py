@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 import contextlib
 import hashlib
 import logging
+import os
 from collections.abc import Callable
+from collections.abc import Set as AbstractSet
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
@@ -35,7 +38,7 @@ from lexibrarian.artifacts.design_file_parser import (
 from lexibrarian.artifacts.design_file_serializer import serialize_design_file
 from lexibrarian.ast_parser import compute_hashes, parse_interface, render_skeleton
 from lexibrarian.config.schema import LexibraryConfig
-from lexibrarian.ignore import create_ignore_matcher
+from lexibrarian.ignore import IgnoreMatcher, create_ignore_matcher
 from lexibrarian.utils.atomic import atomic_write
 from lexibrarian.utils.conflict import has_conflict_markers
 from lexibrarian.utils.languages import detect_language
@@ -49,6 +52,9 @@ _GENERATOR_ID = "lexibrarian-v2"
 # Type for an optional progress callback: receives (file_path, change_level)
 ProgressCallback = Callable[[Path, ChangeLevel], None]
 
+# Number of discovered paths handed from the walker thread to the pipeline at once
+_DISCOVERY_BATCH_SIZE = 256
+
 
 @dataclass
 class UpdateStats:
@@ -89,11 +95,81 @@ def _is_within_scope(
         return False
 
 
-def _is_binary(source_path: Path, binary_extensions: set[str]) -> bool:
+def _is_binary(source_path: Path, binary_extensions: AbstractSet[str]) -> bool:
     """Check whether a file has a binary extension."""
     return source_path.suffix.lower() in binary_extensions
 
 
+def _is_oversized(source_path: Path, max_file_size_kb: int) -> bool:
+    """Check whether a file exceeds *max_file_size_kb* (unreadable files count as oversized)."""
+    try:
+        file_size_kb = source_path.stat().st_size / 1024
+    except OSError:
+        return True
+    if file_size_kb > max_file_size_kb:
+        logger.debug("Skipping oversized file: %s (%.1f KB)", source_path, file_size_kb)
+        return True
+    return False
+
+
+def _walk_source_files(
+    scope_abs: Path,
+    project_root: Path,
+    config: LexibraryConfig,
+    ignore_matcher: IgnoreMatcher,
+    emit: Callable[[list[Path]], None],
+) -> None:
+    """Discover processable source files under *scope_abs*, in batches.
+
+    Walks with ``os.scandir`` depth-first, visiting entries in name order,
+    so files are emitted in the same order as ``sorted(scope_abs.rglob("*"))``.
+    Ignored directories and ``.lexibrary/`` are pruned without being listed;
+    symlinked directories are not followed.  Binary, ignored and oversized
+    files are filtered out.  *emit* is called with every batch of
+    ``_DISCOVERY_BATCH_SIZE`` files and once more with any remainder.
+    """
+    lexibrary_abs = str((project_root / LEXIBRARY_DIR).resolve())
+    binary_exts = config.crawl.binary_extensions
+    max_file_size_kb = config.crawl.max_file_size_kb
+    batch: list[Path] = []
+
+    def _walk(directory: str) -> None:
+        try:
+            with os.scandir(directory) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError:
+            return
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+                is_file = not is_dir and entry.is_file()
+            except OSError:
+                continue
+            if is_dir:
+                if entry.path == lexibrary_abs:
+                    continue
+                if ignore_matcher.should_descend(entry.path):
+                    _walk(entry.path)
+                continue
+            if not is_file:
+                continue
+            path = Path(entry.path)
+            if _is_binary(path, binary_exts):
+                continue
+            if ignore_matcher.is_ignored(path):
+                continue
+            if _is_oversized(path, max_file_size_kb):
+                continue
+            batch.append(path)
+            if len(batch) >= _DISCOVERY_BATCH_SIZE:
+                emit(batch.copy())
+                batch.clear()
+
+    _walk(str(scope_abs))
+    if batch:
+        emit(batch)
+
+
 def _estimate_tokens(text: str) -> int:
     """Rough token estimate: split on whitespace."""
     return len(text.split())
@@ -384,25 +460,43 @@ def _accumulate_stats(stats: UpdateStats, file_result: FileResult) -> None:
         stats.token_budget_warnings += 1
 
 
+async def _regenerate_start_here(
+    stats: UpdateStats,
+    project_root: Path,
+    config: LexibraryConfig,
+    archivist: ArchivistService,
+) -> None:
+    """Regenerate START_HERE.md, recording failure on *stats* instead of raising."""
+    try:
+        await generate_start_here(project_root, config, archivist)
+    except Exception:
+        logger.exception("Failed to regenerate START_HERE.md")
+        stats.start_here_failed = True
+
+
 async def update_files(
     file_paths: list[Path],
     project_root: Path,
     config: LexibraryConfig,
     archivist: ArchivistService,
     progress_callback: ProgressCallback | None = None,
+    *,
+    regenerate_start_here: bool = False,
 ) -> UpdateStats:
     """Process a specific list of source files through the pipeline.
 
     Unlike ``update_project()``, this does NOT discover files via rglob and
-    does NOT regenerate ``START_HERE.md``. It is designed for git-hook and
-    ``--changed-only`` usage where the caller already knows which files changed.
+    by default does NOT regenerate ``START_HERE.md``. It is designed for
+    git-hook, ``--changed-only`` and git-diff fast-path usage where the
+    caller already knows which files changed.  Pass
+    ``regenerate_start_here=True`` to finish like ``update_project()``.
 
-    Files that are deleted, binary, ignored, or inside ``.lexibrary/`` are
-    silently skipped.
+    Files that are deleted, binary, ignored, oversized, or inside
+    ``.lexibrary/`` are silently skipped.
     """
     stats = UpdateStats()
     ignore_matcher = create_ignore_matcher(config, project_root)
-    binary_exts = set(config.crawl.binary_extensions)
+    binary_exts = config.crawl.binary_extensions
 
     # Load available concept names for wikilink guidance
     concepts_dir = project_root / LEXIBRARY_DIR / "concepts"
@@ -433,6 +527,10 @@ async def update_files(
             logger.debug("Skipping ignored file: %s", source_path)
             continue
 
+        # Skip files above max_file_size_kb (same rule as update_project)
+        if _is_oversized(source_path, config.crawl.max_file_size_kb):
+            continue
+
         stats.files_scanned += 1
 
         try:
@@ -455,6 +553,9 @@ async def update_files(
         if progress_callback is not None:
             progress_callback(source_path, file_result.change)
 
+    if regenerate_start_here:
+        await _regenerate_start_here(stats, project_root, config, archivist)
+
     return stats
 
 
@@ -468,10 +569,13 @@ async def update_project(
 
     Discovers source files within scope_root, filters ignored and binary
     files, processes each sequentially, then returns accumulated stats.
+
+    Discovery runs on a worker thread and streams batches of paths through
+    an ``asyncio.Queue``, so processing starts as soon as the first batch is
+    found instead of after the whole tree has been walked.
     """
     stats = UpdateStats()
     ignore_matcher = create_ignore_matcher(config, project_root)
-    binary_exts = set(config.crawl.binary_extensions)
     scope_abs = (project_root / config.scope_root).resolve()
 
     # Load available concept names for wikilink guidance
@@ -479,69 +583,51 @@ async def update_project(
     concept_index = ConceptIndex.load(concepts_dir)
     available_concepts = concept_index.names() or None
 
-    # Discover all source files within scope
-    source_files: list[Path] = []
-    for path in sorted(scope_abs.rglob("*")):
-        if not path.is_file():
-            continue
+    # Discover source files within scope on a worker thread; None ends the stream
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue[list[Path] | None] = asyncio.Queue()
 
-        # Skip .lexibrary contents
-        try:
-            path.relative_to(project_root / LEXIBRARY_DIR)
-            continue
-        except ValueError:
-            pass
+    def _emit(batch: list[Path]) -> None:
+        loop.call_soon_threadsafe(queue.put_nowait, batch)
 
-        # Skip binary files
-        if _is_binary(path, binary_exts):
-            continue
-
-        # Skip ignored files
-        if ignore_matcher.is_ignored(path):
-            continue
-
-        # Skip files above max_file_size_kb
+    def _discover() -> None:
         try:
-            file_size_kb = path.stat().st_size / 1024
-            if file_size_kb > config.crawl.max_file_size_kb:
-                logger.debug("Skipping oversized file: %s (%.1f KB)", path, file_size_kb)
+            _walk_source_files(scope_abs, project_root, config, ignore_matcher, _emit)
+        finally:
+            loop.call_soon_threadsafe(queue.put_nowait, None)
+
+    walker = loop.run_in_executor(None, _discover)
+
+    # Process each file sequentially, in discovery order
+    while (batch := await queue.get()) is not None:
+        for source_path in batch:
+            stats.files_scanned += 1
+
+            try:
+                file_result = await update_file(
+                    source_path,
+                    project_root,
+                    config,
+                    archivist,
+                    available_concepts=available_concepts,
+                )
+            except Exception:
+                logger.exception("Unexpected error processing %s", source_path)
+                stats.files_failed += 1
+                if progress_callback is not None:
+                    progress_callback(source_path, ChangeLevel.UNCHANGED)
                 continue
-        except OSError:
-            continue
 
-        source_files.append(path)
+            _accumulate_stats(stats, file_result)
 
-    logger.info("Discovered %d source files for processing", len(source_files))
-
-    # Process each file sequentially
-    for source_path in source_files:
-        stats.files_scanned += 1
-
-        try:
-            file_result = await update_file(
-                source_path,
-                project_root,
-                config,
-                archivist,
-                available_concepts=available_concepts,
-            )
-        except Exception:
-            logger.exception("Unexpected error processing %s", source_path)
-            stats.files_failed += 1
             if progress_callback is not None:
-                progress_callback(source_path, ChangeLevel.UNCHANGED)
-            continue
+                progress_callback(source_path, file_result.change)
 
-        _accumulate_stats(stats, file_result)
-
-        if progress_callback is not None:
-            progress_callback(source_path, file_result.change)
+    # Surface any discovery error
+    await walker
+    logger.info("Discovered and processed %d source files", stats.files_scanned)
 
     # Step 5: Regenerate START_HERE.md after processing all files (pipeline spec §5)
-    try:
-        await generate_start_here(project_root, config, archivist)
-    except Exception:
-        logger.exception("Failed to regenerate START_HERE.md")
-        stats.start_here_failed = True
+    await _regenerate_start_here(stats, project_root, config, archivist)
 
     return stats
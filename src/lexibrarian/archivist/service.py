@@ -9,6 +9,7 @@ from lexibrarian.baml_client.async_client import BamlAsyncClient, b
 from lexibrarian.baml_client.types import DesignFileOutput, StartHereOutput
 from lexibrarian.config.schema import LLMConfig
 from lexibrarian.llm.rate_limiter import RateLimiter
+from lexibrarian.tokenizer.approximate import CHARS_PER_TOKEN
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +19,16 @@ _PROVIDER_CLIENT_MAP: dict[str, str] = {
     "openai": "OpenAIArchivist",
 }
 
+# Clients that drop the prompt-caching marker, used when llm.prompt_cache is off.
+_UNCACHED_CLIENT_MAP: dict[str, str] = {
+    "anthropic": "AnthropicArchivistUncached",
+}
+
+
+def _estimate_prompt_tokens(*parts: str | None) -> int:
+    """Estimate the prompt token cost of *parts* for rate limiting (chars/4)."""
+    return int(sum(len(part) for part in parts if part) / CHARS_PER_TOKEN)
+
 
 @dataclass
 class DesignFileRequest:
@@ -71,6 +82,8 @@ class ArchivistService:
         self._rate_limiter = rate_limiter
         self._config = config
         self._client_name = _PROVIDER_CLIENT_MAP.get(config.provider)
+        if not config.prompt_cache:
+            self._client_name = _UNCACHED_CLIENT_MAP.get(config.provider, self._client_name)
         if self._client_name is None:
             logger.warning(
                 "No archivist client mapped for provider '%s'; falling back to default BAML client",
@@ -95,7 +108,13 @@ class ArchivistService:
             self._config.provider,
         )
 
-        await self._rate_limiter.acquire()
+        await self._rate_limiter.acquire(
+            _estimate_prompt_tokens(
+                request.source_content,
+                request.interface_skeleton,
+                request.existing_design_file,
+            )
+        )
         logger.debug("Rate limiter acquired for %s", request.source_path)
 
         try:
@@ -133,7 +152,13 @@ class ArchivistService:
             self._config.provider,
         )
 
-        await self._rate_limiter.acquire()
+        await self._rate_limiter.acquire(
+            _estimate_prompt_tokens(
+                request.directory_tree,
+                request.aindex_summaries,
+                request.existing_start_here,
+            )
+        )
         logger.debug("Rate limiter acquired for START_HERE generation")
 
         try:
@@ -11,7 +11,31 @@ from lexibrarian.artifacts.design_file import StalenessMetadata
 
 _META_RE = re.compile(r"<!-- lexibrarian:meta\s+(.*?)\s*-->", re.DOTALL)
 _ATTR_RE = re.compile(r'(\w+)="([^"]*)"')
+_META_MARKER = "<!-- lexibrarian:meta"
 _TABLE_ROW_RE = re.compile(r"^\|\s*`(.+?)`\s*\|\s*(file|dir)\s*\|\s*(.*?)\s*\|$")
+_ENTRY_TYPES = frozenset({"file", "dir"})
+
+
+def _parse_table_row(line: str) -> tuple[str, str, str] | None:
+    """Split a stripped Child Map row into (name, entry type, description).
+
+    Rows as the serializer writes them -- ``| `name` | file | description |``
+    -- are split on ``|`` directly; anything else (a description containing
+    ``|``, unusual spacing) goes through the row regex.  Returns None for
+    lines that are not entry rows, such as the header and separator.
+    """
+    if line.startswith("| `"):
+        cells = line.split("|")
+        if len(cells) == 5 and not cells[4]:
+            name_cell = cells[1].strip()
+            entry_type = cells[2].strip()
+            if len(name_cell) > 2 and name_cell[-1] == "`" and entry_type in _ENTRY_TYPES:
+                return name_cell[1:-1], entry_type, cells[3].strip()
+    match = _TABLE_ROW_RE.match(line)
+    if match is None:
+        return None
+    name, entry_type, description = match.groups()
+    return name, entry_type, description
 
 
 def _parse_meta(meta_str: str) -> StalenessMetadata | None:
@@ -54,90 +78,86 @@ def parse_aindex(path: Path) -> AIndexFile | None:
     Returns None if the file does not exist or content is malformed beyond
     recovery (missing H1 heading, empty billboard, or absent metadata footer).
     Tolerant of minor whitespace differences.
+
+    The file is parsed in a single streaming pass, so neither its full text
+    nor a list of its lines is held in memory; only the footer onwards is
+    buffered for the metadata match.
     """
-    if not path.exists():
-        return None
+    directory_path: str | None = None
+    billboard_lines: list[str] = []
+    in_billboard = False
+    section: str | None = None
+    section_done = False
+    entries: list[AIndexEntry] = []
+    local_conventions: list[str] = []
+    # Everything from the first footer marker on; no match can start earlier
+    meta_lines: list[str] | None = None
     try:
-        text = path.read_text(encoding="utf-8")
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if meta_lines is not None:
+                    meta_lines.append(line)
+                elif _META_MARKER in line:
+                    meta_lines = [line]
+
+                stripped = line.strip()
+
+                # --- Section headings end the billboard and switch sections ---
+                if stripped.startswith("## "):
+                    in_billboard = False
+                    section = stripped[3:].strip()
+                    section_done = False
+                    # A repeated heading replaces the earlier section
+                    if section == "Child Map":
+                        entries = []
+                    elif section == "Local Conventions":
+                        local_conventions = []
+                    continue
+
+                # --- H1 heading gives directory_path and opens the billboard ---
+                if directory_path is None and stripped.startswith("# "):
+                    directory_path = stripped[2:].strip().rstrip("/")
+                    in_billboard = True
+                    continue
+
+                if in_billboard and stripped:
+                    billboard_lines.append(stripped)
+
+                if section_done:
+                    continue
+                if section == "Child Map":
+                    if stripped == "(none)":
+                        section_done = True
+                        continue
+                    row = _parse_table_row(stripped)
+                    if row is not None:
+                        name_raw, entry_type, description = row
+                        entries.append(
+                            AIndexEntry(
+                                name=name_raw.rstrip("/"),
+                                entry_type=entry_type,  # type: ignore[arg-type]
+                                description=description,
+                            )
+                        )
+                elif section == "Local Conventions":
+                    if stripped == "(none)":
+                        section_done = True
+                    elif stripped.startswith("- "):
+                        local_conventions.append(stripped[2:])
+
     except OSError:
         return None
 
-    lines = text.splitlines()
-
-    # --- Extract directory_path from H1 heading ---
-    directory_path: str | None = None
-    for line in lines:
-        stripped = line.strip()
-        if stripped.startswith("# "):
-            directory_path = stripped[2:].strip().rstrip("/")
-            break
     if directory_path is None:
         return None
-
-    # --- Extract billboard: non-empty text between H1 and first H2 ---
-    billboard_lines: list[str] = []
-    in_billboard = False
-    for line in lines:
-        stripped = line.strip()
-        if stripped.startswith("# ") and not in_billboard:
-            in_billboard = True
-            continue
-        if in_billboard:
-            if stripped.startswith("## "):
-                break
-            if stripped:
-                billboard_lines.append(stripped)
     billboard = " ".join(billboard_lines).strip()
     if not billboard:
         return None
 
-    # --- Locate section boundaries ---
-    section_starts: dict[str, int] = {}
-    for i, line in enumerate(lines):
-        stripped = line.strip()
-        if stripped.startswith("## "):
-            section_name = stripped[3:].strip()
-            section_starts[section_name] = i
-
-    def _section_lines(name: str) -> list[str]:
-        if name not in section_starts:
-            return []
-        start = section_starts[name]
-        end = len(lines)
-        for _, idx in section_starts.items():
-            if idx > start:
-                end = min(end, idx)
-        return lines[start + 1 : end]
-
-    # --- Parse Child Map table ---
-    entries: list[AIndexEntry] = []
-    for line in _section_lines("Child Map"):
-        stripped = line.strip()
-        if stripped == "(none)":
-            break
-        match = _TABLE_ROW_RE.match(stripped)
-        if match:
-            name_raw, entry_type, description = match.groups()
-            name = name_raw.rstrip("/")
-            entries.append(
-                AIndexEntry(
-                    name=name,
-                    entry_type=entry_type,  # type: ignore[arg-type]
-                    description=description,
-                )
-            )
-
-    # --- Parse Local Conventions ---
-    local_conventions: list[str] = []
-    for line in _section_lines("Local Conventions"):
-        stripped = line.strip()
-        if stripped == "(none)":
-            break
-        if stripped.startswith("- "):
-            local_conventions.append(stripped[2:])
-
     # --- Parse metadata footer ---
-    meta_match = _META_RE.search(text)
+    if meta_lines is None:
+        return None
+    meta_match = _META_RE.search("".join(meta_lines))
     if not meta_match:
         return None
     metadata = _parse_meta(meta_match.group(1))
@@ -2,7 +2,15 @@
 
 from __future__ import annotations
 
-from lexibrarian.artifacts.aindex import AIndexFile
+from lexibrarian.artifacts.aindex import AIndexEntry, AIndexFile
+
+
+def _child_map_row(entry: AIndexEntry) -> str:
+    """Render one Child Map table row; directory names get a trailing /."""
+    name = entry.name
+    if entry.entry_type == "dir" and not name.endswith("/"):
+        name += "/"
+    return f"| `{name}` | {entry.entry_type} | {entry.description} |"
 
 
 def serialize_aindex(data: AIndexFile) -> str:
@@ -24,28 +32,15 @@ def serialize_aindex(data: AIndexFile) -> str:
     parts.append("## Child Map")
     parts.append("")
 
-    files = sorted(
-        [e for e in data.entries if e.entry_type == "file"],
-        key=lambda e: e.name.lower(),
-    )
-    dirs = sorted(
-        [e for e in data.entries if e.entry_type == "dir"],
-        key=lambda e: e.name.lower(),
-    )
-    all_sorted = files + dirs
+    # Files before directories, each group by case-insensitive name
+    all_sorted = sorted(data.entries, key=lambda e: (e.entry_type != "file", e.name.lower()))
 
     if not all_sorted:
         parts.append("(none)")
     else:
         parts.append("| Name | Type | Description |")
         parts.append("| --- | --- | --- |")
-        for entry in all_sorted:
-            if entry.entry_type == "file":
-                name_cell = f"`{entry.name}`"
-            else:
-                name = entry.name if entry.name.endswith("/") else entry.name + "/"
-                name_cell = f"`{name}`"
-            parts.append(f"| {name_cell} | {entry.entry_type} | {entry.description} |")
+        parts.extend(_child_map_row(entry) for entry in all_sorted)
 
     parts.append("")
 
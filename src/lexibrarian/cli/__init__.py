@@ -1,8 +1,34 @@
-"""CLI package for Lexibrarian — two entry points: lexi (agent) and lexictl (maintenance)."""
+"""CLI package for Lexibrarian — two entry points: lexi (agent) and lexictl (maintenance).
+
+The two Typer apps are resolved lazily so that each console script only pays
+the import cost of its own command tree (``lexi --help`` never loads the
+maintenance commands and vice versa).
+"""
 
 from __future__ import annotations
 
-from lexibrarian.cli.lexi_app import lexi_app
-from lexibrarian.cli.lexictl_app import lexictl_app
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from lexibrarian.cli._lexi_app import lexi_app
+    from lexibrarian.cli._lexictl_app import lexictl_app
 
 __all__ = ["lexi_app", "lexictl_app"]
+
+_APP_MODULES = {
+    "lexi_app": "lexibrarian.cli._lexi_app",
+    "lexictl_app": "lexibrarian.cli._lexictl_app",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _APP_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # The submodules are underscore-named so that importing one (directly, or
+    # via mock.patch) binds it under a different name and never shadows the
+    # app attribute resolved here.
+    app = getattr(importlib.import_module(module_name), name)
+    globals()[name] = app
+    return app
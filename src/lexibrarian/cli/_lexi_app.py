@@ -2,13 +2,19 @@
 
 from __future__ import annotations
 
+import functools
+import os
+import re
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
 import typer
 
 from lexibrarian.cli._shared import console, require_project_root
 
+if TYPE_CHECKING:
+    from lexibrarian.stack.index import StackIndex
+
 lexi_app = typer.Typer(
     name="lexi",
     help=(
@@ -52,16 +58,57 @@ def _next_stack_id(stack_dir: Path) -> int:
     return max_num + 1
 
 
+def _stack_dir_signature(stack_dir: Path) -> tuple[tuple[str, int, int], ...]:
+    """Return a cheap ``(name, mtime_ns, size)`` signature of the Stack post files.
+
+    Only ``stat`` data is read, so an unchanged directory can be detected
+    without parsing any post.  Per-file entries are needed (not just the
+    directory mtime) because mutations rewrite posts in place.
+    """
+    entries: list[tuple[str, int, int]] = []
+    try:
+        with os.scandir(stack_dir) as it:
+            for entry in it:
+                if entry.name.startswith("ST-") and entry.name.endswith(".md"):
+                    st = entry.stat()
+                    entries.append((entry.name, st.st_mtime_ns, st.st_size))
+    except OSError:
+        return ()
+    entries.sort()
+    return tuple(entries)
+
+
+@functools.lru_cache(maxsize=4)
+def _cached_stack_index(
+    project_root_str: str, signature: tuple[tuple[str, int, int], ...]
+) -> StackIndex:
+    """Build a :class:`StackIndex`, memoised on the Stack directory signature."""
+    from lexibrarian.stack.index import StackIndex  # noqa: PLC0415
+
+    return StackIndex.build(Path(project_root_str))
+
+
+def _get_stack_index(project_root: Path) -> StackIndex:
+    """Return the Stack index for *project_root*, reusing it while posts are unchanged."""
+    signature = _stack_dir_signature(project_root / ".lexibrary" / "stack")
+    return _cached_stack_index(str(project_root), signature)
+
+
+# ASCII fast path for _slugify: uppercase -> lowercase, every other
+# non-alphanumeric -> "-", applied in a single C-level translate pass.
+_SLUG_TABLE: dict[int, int] = {c: ord("-") for c in range(128) if not chr(c).isalnum()}
+_SLUG_TABLE.update({c: c + 32 for c in range(ord("A"), ord("Z") + 1)})
+_SLUG_HYPHEN_RUN_RE = re.compile(r"-+")
+_SLUG_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+
+
 def _slugify(title: str) -> str:
     """Convert a title to a URL-friendly slug."""
-    import re as _re  # noqa: PLC0415
-
-    slug = title.lower()
-    slug = _re.sub(r"[^a-z0-9]+", "-", slug)
-    slug = slug.strip("-")
-    # Collapse consecutive hyphens
-    slug = _re.sub(r"-+", "-", slug)
-    return slug[:50]
+    if title.isascii():
+        slug = _SLUG_HYPHEN_RUN_RE.sub("-", title.translate(_SLUG_TABLE))
+    else:
+        slug = _SLUG_NON_ALNUM_RE.sub("-", title.lower())
+    return slug.strip("-")[:50]
 
 
 def _find_post_path(project_root: Path, post_id: str) -> Path | None:
@@ -87,10 +134,9 @@ def lookup(
     ],
 ) -> None:
     """Return the design file for a source file."""
-    import hashlib  # noqa: PLC0415
-
     from lexibrarian.artifacts.design_file_parser import parse_design_file_metadata  # noqa: PLC0415
     from lexibrarian.config.loader import load_config  # noqa: PLC0415
+    from lexibrarian.utils.hashing import hash_file  # noqa: PLC0415
     from lexibrarian.utils.paths import mirror_path  # noqa: PLC0415
 
     project_root = require_project_root()
@@ -123,7 +169,7 @@ def lookup(
     metadata = parse_design_file_metadata(design_path)
     if metadata is not None:
         try:
-            current_hash = hashlib.sha256(target.read_bytes()).hexdigest()
+            current_hash = hash_file(target)
             if current_hash != metadata.source_hash:
                 console.print(
                     "[yellow]Warning:[/yellow] Source file has changed since "
@@ -511,10 +557,8 @@ def stack_search(
     """Search Stack posts by query and/or filters."""
     from rich.table import Table  # noqa: PLC0415
 
-    from lexibrarian.stack.index import StackIndex  # noqa: PLC0415
-
     project_root = require_project_root()
-    idx = StackIndex.build(project_root)
+    idx = _get_stack_index(project_root)
 
     # Start with all or query results
     results = idx.search(query) if query else list(idx)
@@ -790,10 +834,8 @@ def stack_list(
     """List Stack posts with optional filters."""
     from rich.table import Table  # noqa: PLC0415
 
-    from lexibrarian.stack.index import StackIndex  # noqa: PLC0415
-
     project_root = require_project_root()
-    idx = StackIndex.build(project_root)
+    idx = _get_stack_index(project_root)
 
     results = list(idx)
 
@@ -2,13 +2,21 @@
 
 from __future__ import annotations
 
+import functools
+import os
+import re
+from collections.abc import Iterator
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated, get_args
 
 import typer
 
 from lexibrarian.cli._shared import console, require_project_root
 
+if TYPE_CHECKING:
+    from lexibrarian.config.schema import LexibraryConfig
+    from lexibrarian.utils.hash_cache import HashCache
+
 lexictl_app = typer.Typer(
     name="lexictl",
     help=(
@@ -19,6 +27,205 @@ lexictl_app = typer.Typer(
 )
 
 
+# ---------------------------------------------------------------------------
+# Update helpers (private, used only by the update command)
+# ---------------------------------------------------------------------------
+
+# Ignore files whose edits can change which unchanged files are in scope
+_IGNORE_FILENAMES = frozenset({".gitignore", ".lexignore"})
+
+
+def _resolve_changed_paths(paths: list[Path]) -> list[Path]:
+    """Resolve ``--changed-only`` paths to absolute paths, dropping duplicates.
+
+    Each distinct parent directory is resolved once (hook-supplied lists
+    tend to share a few directories), and repeated files are kept only at
+    their first position.
+    """
+    resolve_dir = functools.lru_cache(maxsize=None)(os.path.realpath)
+    resolved = (Path(resolve_dir(os.path.abspath(p.parent))) / p.name for p in paths)
+    return list(dict.fromkeys(resolved))
+
+
+def _config_fingerprint(project_root: Path, config: LexibraryConfig) -> str:
+    """Hash the effective config plus ``.lexignore`` rules.
+
+    A change in either can bring previously skipped files into scope, which
+    ``git diff`` alone would not reveal.
+    """
+    from lexibrarian.utils.hashing import hash_string  # noqa: PLC0415
+
+    lexignore_path = project_root / ".lexignore"
+    try:
+        lexignore = lexignore_path.read_text(encoding="utf-8")
+    except OSError:
+        lexignore = ""
+    return hash_string(config.model_dump_json() + "\0" + lexignore)
+
+
+def _git_changed_since_last_update(
+    project_root: Path, config: LexibraryConfig
+) -> list[Path] | None:
+    """Return source files to re-check since the last full update, via git.
+
+    Returns ``None`` when no fast path is possible and the caller must walk
+    the whole project: no recorded commit, config or ignore rules changed,
+    or git failed.  Changed design files under ``.lexibrary/`` are mapped
+    back to their source file so deleted design files are regenerated.
+    """
+    from lexibrarian.utils.git import changed_files_since  # noqa: PLC0415
+    from lexibrarian.utils.paths import LEXIBRARY_DIR  # noqa: PLC0415
+    from lexibrarian.utils.state import load_state  # noqa: PLC0415
+
+    state = load_state(project_root)
+    if state.indexed_head is None:
+        return None
+    if state.config_fingerprint != _config_fingerprint(project_root, config):
+        return None
+
+    changed = changed_files_since(project_root, state.indexed_head)
+    if changed is None:
+        return None
+
+    design_prefix = LEXIBRARY_DIR + "/"
+    rel_paths: set[str] = set(state.dirty_files)
+    for rel in changed:
+        if Path(rel).name in _IGNORE_FILENAMES:
+            return None
+        if rel.startswith(design_prefix):
+            if rel.endswith(".md"):
+                rel_paths.add(rel[len(design_prefix) : -len(".md")])
+            continue
+        rel_paths.add(rel)
+
+    return [project_root / rel for rel in sorted(rel_paths)]
+
+
+def _record_update_state(project_root: Path, config: LexibraryConfig) -> None:
+    """Record the current git ``HEAD`` as fully synced.  No-op outside git."""
+    from lexibrarian.utils.git import dirty_files, head_commit  # noqa: PLC0415
+    from lexibrarian.utils.state import LibraryState, save_state  # noqa: PLC0415
+
+    head = head_commit(project_root)
+    if head is None:
+        return
+    dirty = dirty_files(project_root)
+    if dirty is None:
+        return
+    save_state(
+        project_root,
+        LibraryState(
+            indexed_head=head,
+            dirty_files=dirty,
+            config_fingerprint=_config_fingerprint(project_root, config),
+        ),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Status helpers (private, used only by the status command)
+# ---------------------------------------------------------------------------
+
+# Top-level .lexibrary/ subdirectories that never contain design files
+_NON_DESIGN_DIRS = frozenset({"concepts", "stack"})
+
+# Top-level .lexibrary/ markdown files that are not design files
+_NON_DESIGN_FILES = frozenset({"START_HERE.md", "HANDOFF.md"})
+
+# Sidecar cache of source (mtime_ns, size, sha256) used for staleness checks
+_STATUS_CACHE_FILENAME = ".status_cache.json"
+
+# Below this many sources the thread pool costs more than it saves
+_STATUS_PARALLEL_THRESHOLD = 16
+
+# Concept/stack frontmatter is read from at most this many leading bytes
+_FRONTMATTER_SCAN_BYTES = 4096
+
+# Top-level ``status:`` key inside a YAML frontmatter block
+_STATUS_FIELD_RE = re.compile(rb"""^status:[ \t]*["']?([A-Za-z_]+)["']?[ \t]*\r?$""", re.MULTILINE)
+
+
+def _iter_design_md(lexibrary_dir: Path) -> Iterator[str]:
+    """Yield paths of candidate design files (``*.md``) under *lexibrary_dir*.
+
+    Walks with ``os.scandir`` and an explicit stack, pruning ``concepts/``
+    and ``stack/`` at the top level so their subtrees are never listed.
+    ``START_HERE.md`` and ``HANDOFF.md`` are skipped anywhere in the tree.
+    Symlinked directories are not followed.  Order is unspecified.
+    """
+    pending: list[tuple[str, bool]] = [(str(lexibrary_dir), True)]
+    while pending:
+        current, top_level = pending.pop()
+        try:
+            it = os.scandir(current)
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                name = entry.name
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not (top_level and name in _NON_DESIGN_DIRS):
+                            pending.append((entry.path, False))
+                        continue
+                    if not entry.is_file():
+                        continue
+                except OSError:
+                    continue
+                if name.endswith(".md") and name not in _NON_DESIGN_FILES:
+                    yield entry.path
+
+
+def _scan_status_field(path: Path) -> str | None:
+    """Return the frontmatter ``status`` of a concept or stack post, cheaply.
+
+    Reads only the first few KiB of *path* and matches the top-level
+    ``status:`` line inside the leading ``---`` fence, without YAML parsing
+    or model validation.  Returns ``None`` if the file cannot be read, the
+    fence is missing or too long, or no plain status value is present;
+    callers then fall back to the full parser.
+    """
+    try:
+        with open(path, "rb") as f:
+            head = f.read(_FRONTMATTER_SCAN_BYTES)
+    except OSError:
+        return None
+    if not head.startswith(b"---\n"):
+        return None
+    end = head.find(b"\n---", 3)
+    if end == -1:
+        return None
+    match = _STATUS_FIELD_RE.search(head, 4, end + 1)
+    return match.group(1).decode("ascii") if match else None
+
+
+def _current_source_hashes(
+    hash_cache: HashCache, project_root: Path, sources: list[str]
+) -> list[str | None]:
+    """Return the current SHA-256 of each project-relative source path.
+
+    Sources are stat'ed and (on a cache miss) hashed on a thread pool:
+    ``hashlib`` releases the GIL while digesting, so reads and hashing
+    overlap across files.  Missing or unreadable sources map to ``None``.
+    Results are in the same order as *sources*.
+    """
+
+    def _hash_one(source: str) -> str | None:
+        try:
+            return hash_cache.get_hash(source, project_root / source)
+        except OSError:
+            return None
+
+    if len(sources) < _STATUS_PARALLEL_THRESHOLD:
+        return [_hash_one(source) for source in sources]
+
+    from concurrent.futures import ThreadPoolExecutor  # noqa: PLC0415
+
+    workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_hash_one, sources))
+
+
 # ---------------------------------------------------------------------------
 # init — wizard-based project initialisation
 # ---------------------------------------------------------------------------
@@ -91,21 +298,30 @@ def update(
             help="Only update the specified files (for git hooks / CI).",
         ),
     ] = None,
+    full: Annotated[
+        bool,
+        typer.Option(
+            "--full",
+            help="Walk the whole project even when git can list the changed files.",
+        ),
+    ] = False,
+    no_cache: Annotated[
+        bool,
+        typer.Option(
+            "--no-cache",
+            help="Call the LLM even when a cached response exists for the same request.",
+        ),
+    ] = False,
 ) -> None:
-    """Re-index changed files and regenerate design files."""
-    import asyncio  # noqa: PLC0415
+    """Re-index changed files and regenerate design files.
 
-    from rich.progress import BarColumn, MofNCompleteColumn, Progress, TextColumn  # noqa: PLC0415
+    With no arguments inside a git repository, only files changed since the
+    last successful full update are re-checked; use --full to walk everything.
+    """
+    import asyncio  # noqa: PLC0415
+    import contextlib  # noqa: PLC0415
 
-    from lexibrarian.archivist.pipeline import (  # noqa: PLC0415
-        UpdateStats,
-        update_file,
-        update_files,
-        update_project,
-    )
-    from lexibrarian.archivist.service import ArchivistService  # noqa: PLC0415
     from lexibrarian.config.loader import load_config  # noqa: PLC0415
-    from lexibrarian.llm.rate_limiter import RateLimiter  # noqa: PLC0415
 
     # Mutual exclusivity check
     if path is not None and changed_only is not None:
@@ -117,30 +333,8 @@ def update(
 
     project_root = require_project_root()
     config = load_config(project_root)
-    rate_limiter = RateLimiter()
-    archivist = ArchivistService(rate_limiter=rate_limiter, config=config.llm)
-
-    # --changed-only: batch update specific files
-    if changed_only is not None:
-        resolved_paths = [p.resolve() for p in changed_only]
-        console.print(f"Updating [cyan]{len(resolved_paths)}[/cyan] changed file(s)...")
-
-        stats = asyncio.run(update_files(resolved_paths, project_root, config, archivist))
-
-        console.print()
-        console.print("[bold]Update summary:[/bold]")
-        console.print(f"  Files scanned:       {stats.files_scanned}")
-        console.print(f"  Files unchanged:     {stats.files_unchanged}")
-        console.print(f"  Files created:       {stats.files_created}")
-        console.print(f"  Files updated:       {stats.files_updated}")
-        console.print(f"  Files agent-updated: {stats.files_agent_updated}")
-        if stats.files_failed:
-            console.print(f"  [red]Files failed:       {stats.files_failed}[/red]")
-
-        if stats.files_failed:
-            raise typer.Exit(1)
-        return
 
+    single_file: Path | None = None
     if path is not None:
         target = Path(path).resolve()
 
@@ -159,46 +353,118 @@ def update(
             raise typer.Exit(1) from None
 
         if target.is_file():
-            # Single file update
-            console.print(f"Updating design file for [cyan]{path}[/cyan]...")
-            result = asyncio.run(update_file(target, project_root, config, archivist))
-            if result.failed:
-                console.print(f"[red]Failed[/red] to update design file for {path}")
-                raise typer.Exit(1)
-            console.print(f"[green]Done.[/green] Change level: {result.change.value}")
-            return
-
+            single_file = target
         # Directory update -- update all files in subtree
         # Delegate to update_project but the scope is effectively the whole project;
         # the pipeline already filters by scope_root. We run the full pipeline.
         # For directory-scoped updates we run update_project (it respects scope_root).
 
-    # Project or directory update with progress bar
-    stats = UpdateStats()
+    # Git fast path: re-check only files changed since the last full sync
+    fast_path_files: list[Path] | None = None
+    if path is None and changed_only is None and not full:
+        fast_path_files = _git_changed_since_last_update(project_root, config)
+        if fast_path_files is not None and not fast_path_files:
+            _record_update_state(project_root, config)
+            console.print("[green]Library is up to date.[/green] No changes since last update.")
+            return
+
+    # Nothing to short-circuit: load the pipeline and LLM client
+    from rich.progress import BarColumn, MofNCompleteColumn, Progress, TextColumn  # noqa: PLC0415
+
+    from lexibrarian.archivist.cache import (  # noqa: PLC0415
+        LLM_CACHE_DIRNAME,
+        CachedArchivistService,
+    )
+    from lexibrarian.archivist.change_checker import ChangeLevel  # noqa: PLC0415
+    from lexibrarian.archivist.pipeline import (  # noqa: PLC0415
+        FileResult,
+        UpdateStats,
+        update_file,
+        update_files,
+        update_project,
+    )
+    from lexibrarian.archivist.service import ArchivistService  # noqa: PLC0415
+    from lexibrarian.llm.rate_limiter import RateLimiter  # noqa: PLC0415
 
-    with Progress(
+    rate_limiter = RateLimiter(
+        requests_per_minute=config.llm.rpm_limit,
+        tokens_per_minute=config.llm.tpm_limit,
+    )
+    archivist: ArchivistService
+    if config.llm.response_cache and not no_cache:
+        cached = CachedArchivistService(
+            rate_limiter=rate_limiter,
+            config=config.llm,
+            cache_dir=project_root / ".lexibrary" / LLM_CACHE_DIRNAME,
+        )
+        cached.prune()
+        archivist = cached
+    else:
+        archivist = ArchivistService(rate_limiter=rate_limiter, config=config.llm)
+
+    resolved_paths: list[Path] = []
+    if changed_only is not None:
+        resolved_paths = _resolve_changed_paths(changed_only)
+        console.print(f"Updating [cyan]{len(resolved_paths)}[/cyan] changed file(s)...")
+    elif single_file is not None:
+        console.print(f"Updating design file for [cyan]{path}[/cyan]...")
+    elif fast_path_files is not None:
+        console.print(
+            f"Checking [cyan]{len(fast_path_files)}[/cyan] file(s) changed since last update..."
+        )
+
+    # Project, directory and fast-path updates report progress per file
+    show_progress = changed_only is None and single_file is None
+    progress = Progress(
         TextColumn("[progress.description]{task.description}"),
         BarColumn(),
         MofNCompleteColumn(),
         console=console,
-    ) as progress:
-        task = progress.add_task("Updating design files...", total=None)
+    )
 
-        def _progress_callback(file_path: Path, change_level: object) -> None:
-            progress.update(
-                task,
-                advance=1,
-                description=f"Processing {file_path.name}",
-            )
+    def _progress_callback(file_path: Path, change_level: ChangeLevel) -> None:
+        progress.update(
+            task,
+            advance=1,
+            description=f"Processing {file_path.name}",
+        )
 
-        stats = asyncio.run(
-            update_project(project_root, config, archivist, progress_callback=_progress_callback)
+    async def _run() -> UpdateStats | FileResult:
+        if changed_only is not None:
+            return await update_files(resolved_paths, project_root, config, archivist)
+        if single_file is not None:
+            return await update_file(single_file, project_root, config, archivist)
+        if fast_path_files is not None:
+            return await update_files(
+                fast_path_files,
+                project_root,
+                config,
+                archivist,
+                progress_callback=_progress_callback,
+                regenerate_start_here=True,
+            )
+        return await update_project(
+            project_root, config, archivist, progress_callback=_progress_callback
         )
 
-    if stats.start_here_failed:
-        console.print("[red]Failed to regenerate START_HERE.md.[/red]")
-    else:
-        console.print("[green]START_HERE.md regenerated.[/green]")
+    with progress if show_progress else contextlib.nullcontext():
+        task = progress.add_task("Updating design files...", total=None)
+        outcome = asyncio.run(_run())
+
+    if isinstance(outcome, FileResult):
+        # Single file update
+        if outcome.failed:
+            console.print(f"[red]Failed[/red] to update design file for {path}")
+            raise typer.Exit(1)
+        console.print(f"[green]Done.[/green] Change level: {outcome.change.value}")
+        return
+
+    stats = outcome
+    if changed_only is None:
+        if stats.start_here_failed:
+            console.print("[red]Failed to regenerate START_HERE.md.[/red]")
+        else:
+            console.print("[green]START_HERE.md regenerated.[/green]")
 
     # Print summary stats
     console.print()
@@ -210,14 +476,20 @@ def update(
     console.print(f"  Files agent-updated: {stats.files_agent_updated}")
     if stats.files_failed:
         console.print(f"  [red]Files failed:       {stats.files_failed}[/red]")
-    if stats.aindex_refreshed:
-        console.print(f"  .aindex refreshed:   {stats.aindex_refreshed}")
-    if stats.token_budget_warnings:
-        console.print(f"  [yellow]Token budget warnings: {stats.token_budget_warnings}[/yellow]")
+    if changed_only is None:
+        if stats.aindex_refreshed:
+            console.print(f"  .aindex refreshed:   {stats.aindex_refreshed}")
+        if stats.token_budget_warnings:
+            console.print(
+                f"  [yellow]Token budget warnings: {stats.token_budget_warnings}[/yellow]"
+            )
 
     if stats.files_failed:
         raise typer.Exit(1)
 
+    if path is None and changed_only is None and not stats.start_here_failed:
+        _record_update_state(project_root, config)
+
 
 # ---------------------------------------------------------------------------
 # validate
@@ -248,6 +520,13 @@ def validate(
             help="Output results as JSON instead of Rich tables.",
         ),
     ] = False,
+    no_cache: Annotated[
+        bool,
+        typer.Option(
+            "--no-cache",
+            help="Run every check instead of reusing the cached report.",
+        ),
+    ] = False,
 ) -> None:
     """Run consistency checks on the library."""
     import json as _json  # noqa: PLC0415
@@ -263,6 +542,7 @@ def validate(
             lexibrary_dir,
             severity_filter=severity,
             check_filter=check,
+            use_cache=not no_cache,
         )
     except ValueError as exc:
         console.print(f"[red]Error:[/red] {exc}")
@@ -297,86 +577,33 @@ def status(
     ] = False,
 ) -> None:
     """Show library health and staleness summary."""
-    import hashlib  # noqa: PLC0415
-    from datetime import UTC, datetime  # noqa: PLC0415
+    import time  # noqa: PLC0415
+    from datetime import UTC  # noqa: PLC0415
 
     from lexibrarian.artifacts.design_file_parser import (  # noqa: PLC0415
         parse_design_file_metadata,
     )
+    from lexibrarian.stack.models import StackStatus  # noqa: PLC0415
     from lexibrarian.stack.parser import parse_stack_post  # noqa: PLC0415
+    from lexibrarian.utils.hash_cache import HashCache  # noqa: PLC0415
     from lexibrarian.validator import validate_library  # noqa: PLC0415
     from lexibrarian.wiki.parser import parse_concept_file  # noqa: PLC0415
 
     project_root = require_project_root()
     lexibrary_dir = project_root / ".lexibrary"
 
-    # --- Artifact counts ---
-    # Design files: count .md files in the mirror tree (exclude concepts/ and stack/)
-    design_dir = lexibrary_dir
-    design_files: list[Path] = []
-    stale_count = 0
-    latest_generated: datetime | None = None
-
-    for md_path in sorted(design_dir.rglob("*.md")):
-        # Skip non-design-file directories
-        rel = md_path.relative_to(lexibrary_dir)
-        rel_parts = rel.parts
-        if rel_parts[0] in ("concepts", "stack"):
-            continue
-        # Skip known non-design files
-        if md_path.name in ("START_HERE.md", "HANDOFF.md"):
-            continue
-        meta = parse_design_file_metadata(md_path)
-        if meta is not None:
-            design_files.append(md_path)
-            # Check staleness via source hash
-            source_path = project_root / meta.source
-            if source_path.exists():
-                current_hash = hashlib.sha256(source_path.read_bytes()).hexdigest()
-                if current_hash != meta.source_hash:
-                    stale_count += 1
-            # Track latest generated timestamp
-            if latest_generated is None or meta.generated > latest_generated:
-                latest_generated = meta.generated
-
-    total_designs = len(design_files)
-
-    # Concepts: count by status
-    concepts_dir = lexibrary_dir / "concepts"
-    concept_counts: dict[str, int] = {"active": 0, "deprecated": 0, "draft": 0}
-    if concepts_dir.is_dir():
-        for md_path in sorted(concepts_dir.glob("*.md")):
-            concept = parse_concept_file(md_path)
-            if concept is not None:
-                s = concept.frontmatter.status
-                if s in concept_counts:
-                    concept_counts[s] += 1
-
-    # Stack posts: count by status
-    stack_dir = lexibrary_dir / "stack"
-    stack_counts: dict[str, int] = {"open": 0, "resolved": 0}
-    if stack_dir.is_dir():
-        for md_path in sorted(stack_dir.glob("ST-*-*.md")):
-            post = parse_stack_post(md_path)
-            if post is not None:
-                st = post.frontmatter.status
-                if st in stack_counts:
-                    stack_counts[st] += 1
-                else:
-                    stack_counts[st] = 1
-
-    total_stack = sum(stack_counts.values())
-
     # --- Lightweight validation (errors + warnings only) ---
     report = validate_library(
         project_root,
         lexibrary_dir,
         severity_filter="warning",
+        use_cache=True,
     )
     error_count = report.summary.error_count
     warning_count = report.summary.warning_count
 
     # --- Quiet mode ---
+    # Only the validation counts are shown, so the artifact walk below is skipped
     if quiet:
         if error_count > 0 and warning_count > 0:
             parts: list[str] = []
@@ -397,6 +624,68 @@ def status(
             console.print("lexictl: library healthy")
         raise typer.Exit(report.exit_code())
 
+    # --- Artifact counts ---
+    # Design files: count .md files in the mirror tree (exclude concepts/ and stack/)
+    stale_count = 0
+    # POSIX timestamp of the newest design file; naive datetimes are taken as UTC
+    latest_generated_ts: float | None = None
+
+    # Source hashes are reused while a file's (mtime_ns, size) is unchanged
+    hash_cache = HashCache(lexibrary_dir / _STATUS_CACHE_FILENAME)
+    hash_cache.load()
+    metas = []
+    for design_md in _iter_design_md(lexibrary_dir):
+        meta = parse_design_file_metadata(Path(design_md))
+        if meta is not None:
+            metas.append(meta)
+            # Track latest generated timestamp
+            gen = meta.generated
+            gen_ts = (gen if gen.tzinfo is not None else gen.replace(tzinfo=UTC)).timestamp()
+            if latest_generated_ts is None or gen_ts > latest_generated_ts:
+                latest_generated_ts = gen_ts
+    total_designs = len(metas)
+
+    # Check staleness via source hash
+    current_hashes = _current_source_hashes(
+        hash_cache, project_root, [meta.source for meta in metas]
+    )
+    for meta, current_hash in zip(metas, current_hashes, strict=True):
+        if current_hash is not None and current_hash != meta.source_hash:
+            stale_count += 1
+
+    hash_cache.prune({meta.source for meta in metas})
+    hash_cache.save()
+
+    # Concepts: count by status
+    concepts_dir = lexibrary_dir / "concepts"
+    concept_counts: dict[str, int] = {"active": 0, "deprecated": 0, "draft": 0}
+    if concepts_dir.is_dir():
+        for md_path in concepts_dir.glob("*.md"):
+            s = _scan_status_field(md_path)
+            if s not in concept_counts:
+                concept = parse_concept_file(md_path)
+                s = concept.frontmatter.status if concept is not None else None
+            if s in concept_counts:
+                concept_counts[s] += 1
+
+    # Stack posts: count by status
+    stack_dir = lexibrary_dir / "stack"
+    stack_counts: dict[str, int] = {"open": 0, "resolved": 0}
+    if stack_dir.is_dir():
+        stack_statuses = frozenset(get_args(StackStatus))
+        for md_path in stack_dir.glob("ST-*-*.md"):
+            st = _scan_status_field(md_path)
+            if st not in stack_statuses:
+                post = parse_stack_post(md_path)
+                st = post.frontmatter.status if post is not None else None
+            if st is not None:
+                if st in stack_counts:
+                    stack_counts[st] += 1
+                else:
+                    stack_counts[st] = 1
+
+    total_stack = sum(stack_counts.values())
+
     # --- Full dashboard ---
     console.print()
     console.print("[bold]Lexibrarian Status[/bold]")
@@ -440,13 +729,8 @@ def status(
     )
 
     # Last updated
-    if latest_generated is not None:
-        now = datetime.now(tz=UTC)
-        gen = latest_generated
-        if gen.tzinfo is None:
-            gen = gen.replace(tzinfo=UTC)
-        delta = now - gen
-        total_seconds = int(delta.total_seconds())
+    if latest_generated_ts is not None:
+        total_seconds = int(time.time() - latest_generated_ts)
         if total_seconds < 60:
             time_str = f"{total_seconds} second{'s' if total_seconds != 1 else ''} ago"
         elif total_seconds < 3600:
@@ -547,8 +831,10 @@ def setup(
     # Generate rules for each environment
     results = generate_rules(project_root, environments)
 
+    total_files = 0
     for env_name, paths in results.items():
         console.print(f"  [green]{env_name}:[/green] {len(paths)} file(s) written")
+        total_files += len(paths)
         for p in paths:
             rel = p.relative_to(project_root)
             console.print(f"    [dim]{rel}[/dim]")
@@ -558,7 +844,6 @@ def setup(
     if iwh_modified:
         console.print("  [green].gitignore:[/green] added IWH pattern")
 
-    total_files = sum(len(paths) for paths in results.values())
     console.print(f"\n[green]Setup complete.[/green] {total_files} rule file(s) updated.")
 
 
@@ -582,6 +867,21 @@ def sweep(
         svc.run_once()
 
 
+def _read_pid(pid_path: Path) -> int | None:
+    """Return the PID stored in *pid_path*, or ``None`` if there is no PID file.
+
+    A PID file that cannot be parsed is removed and the command exits 1.
+    """
+    try:
+        return int(pid_path.read_bytes())
+    except FileNotFoundError:
+        return None
+    except (ValueError, OSError):
+        console.print("[red]Cannot read PID file.[/red]")
+        pid_path.unlink(missing_ok=True)
+        raise typer.Exit(1) from None
+
+
 @lexictl_app.command()
 def daemon(
     action: Annotated[
@@ -622,15 +922,10 @@ def daemon(
         svc.run_watchdog()
 
     elif resolved_action == "stop":
-        if not pid_path.exists():
+        pid = _read_pid(pid_path)
+        if pid is None:
             console.print("[yellow]No daemon is running (no PID file found).[/yellow]")
             return
-        try:
-            pid = int(pid_path.read_text(encoding="utf-8").strip())
-        except (ValueError, OSError):
-            console.print("[red]Cannot read PID file.[/red]")
-            pid_path.unlink(missing_ok=True)
-            raise typer.Exit(1) from None
 
         try:
             os.kill(pid, _signal.SIGTERM)
@@ -645,15 +940,10 @@ def daemon(
             raise typer.Exit(1) from None
 
     elif resolved_action == "status":
-        if not pid_path.exists():
+        pid = _read_pid(pid_path)
+        if pid is None:
             console.print("[dim]No daemon is running.[/dim]")
             return
-        try:
-            pid = int(pid_path.read_text(encoding="utf-8").strip())
-        except (ValueError, OSError):
-            console.print("[red]Cannot read PID file.[/red]")
-            pid_path.unlink(missing_ok=True)
-            raise typer.Exit(1) from None
 
         # Check if process is still running
         try:
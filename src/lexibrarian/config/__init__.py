@@ -1,19 +1,28 @@
-"""Configuration system for Lexibrarian."""
+"""Configuration system for Lexibrarian.
+
+Exports are resolved lazily so that importing a light submodule (for
+example ``lexibrarian.config.loader`` for ``GLOBAL_CONFIG_PATH``) does not
+build the Pydantic schema until a config is actually loaded or validated.
+"""
 
 from __future__ import annotations
 
-from lexibrarian.config.defaults import DEFAULT_PROJECT_CONFIG_TEMPLATE
-from lexibrarian.config.loader import find_config_file, load_config
-from lexibrarian.config.schema import (
-    DaemonConfig,
-    IgnoreConfig,
-    IWHConfig,
-    LexibraryConfig,
-    LLMConfig,
-    MappingConfig,
-    TokenBudgetConfig,
-    TokenizerConfig,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from lexibrarian.config.defaults import DEFAULT_PROJECT_CONFIG_TEMPLATE
+    from lexibrarian.config.loader import find_config_file, load_config
+    from lexibrarian.config.schema import (
+        DaemonConfig,
+        IgnoreConfig,
+        IWHConfig,
+        LexibraryConfig,
+        LLMConfig,
+        MappingConfig,
+        TokenBudgetConfig,
+        TokenizerConfig,
+    )
 
 __all__ = [
     "DEFAULT_PROJECT_CONFIG_TEMPLATE",
@@ -28,3 +37,26 @@ __all__ = [
     "TokenBudgetConfig",
     "TokenizerConfig",
 ]
+
+_EXPORT_MODULES = {
+    "DEFAULT_PROJECT_CONFIG_TEMPLATE": "lexibrarian.config.defaults",
+    "find_config_file": "lexibrarian.config.loader",
+    "load_config": "lexibrarian.config.loader",
+    "DaemonConfig": "lexibrarian.config.schema",
+    "IgnoreConfig": "lexibrarian.config.schema",
+    "IWHConfig": "lexibrarian.config.schema",
+    "LexibraryConfig": "lexibrarian.config.schema",
+    "LLMConfig": "lexibrarian.config.schema",
+    "MappingConfig": "lexibrarian.config.schema",
+    "TokenBudgetConfig": "lexibrarian.config.schema",
+    "TokenizerConfig": "lexibrarian.config.schema",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORT_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
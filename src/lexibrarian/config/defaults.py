@@ -28,6 +28,11 @@ llm:
   api_key_env: ANTHROPIC_API_KEY         # Env var holding the API key
   max_retries: 3                         # Retry attempts on API failure
   timeout: 60                            # Request timeout in seconds
+  rpm_limit: 50                          # Max LLM requests per minute
+  tpm_limit: null                        # Max prompt tokens per minute (null = no limit)
+  response_cache: false                  # Replay cached responses for identical requests
+  response_cache_max_entries: 2000       # Least recently used entries beyond this are pruned
+  prompt_cache: true                     # Mark the static system prompt cacheable (Anthropic)
 
 # Per-artifact token budgets (validation targets for generated content)
 token_budgets:
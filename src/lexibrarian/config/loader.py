@@ -1,64 +1,130 @@
-"""Configuration file discovery and loading."""
+"""Configuration file discovery and loading.
+
+Project config lives in ``.lexibrary/config.yaml``.  A ``.lexibrary/config.toml``
+is accepted in its place and takes precedence when both exist; it is parsed
+with the stdlib ``tomllib`` and avoids the YAML tokenizer entirely.
+"""
 
 from __future__ import annotations
 
 import os
+import tomllib
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import yaml
 
-from lexibrarian.config.schema import LexibraryConfig
+if TYPE_CHECKING:
+    from lexibrarian.config.schema import LexibraryConfig
 
 # XDG base directory default
 _XDG_CONFIG_HOME = Path(os.environ.get("XDG_CONFIG_HOME", Path.home() / ".config"))
 GLOBAL_CONFIG_PATH = _XDG_CONFIG_HOME / "lexibrarian" / "config.yaml"
 
+# Project config file names, in order of precedence
+_PROJECT_CONFIG_NAMES = ("config.toml", "config.yaml")
+_PROJECT_CONFIG_SUFFIXES = tuple(os.path.join(".lexibrary", name) for name in _PROJECT_CONFIG_NAMES)
+
+# libyaml-backed loader when PyYAML was built with it; pure-Python otherwise
+_YAML_LOADER: type[yaml.SafeLoader] = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _walk_for_config(start_dir: Path) -> str | None:
+    """Return the nearest config file at or above *start_dir*, as a string."""
+    for directory in (start_dir, *start_dir.parents):
+        base = str(directory)
+        for suffix in _PROJECT_CONFIG_SUFFIXES:
+            candidate = os.path.join(base, suffix)
+            if os.path.exists(candidate):
+                return candidate
+    return None
+
 
 def find_config_file(start_dir: Path | None = None) -> Path | None:
-    """Search for .lexibrary/config.yaml starting from start_dir and walking upward.
+    """Search for .lexibrary/config.{toml,yaml} starting from start_dir and walking upward.
+
+    The walk is not memoized: validating a remembered result would mean
+    re-checking every directory between *start_dir* and the config (a nearer
+    or higher-precedence config may have appeared since), which is the walk.
 
     Args:
         start_dir: Directory to start search from. Defaults to current working directory.
 
     Returns:
-        Path to config.yaml if found, None otherwise.
+        Path to the config file if found, None otherwise.
     """
     start_dir = Path.cwd() if start_dir is None else Path(start_dir).resolve()
 
-    current = start_dir
-    while True:
-        config_path = current / ".lexibrary" / "config.yaml"
-        if config_path.exists():
-            return config_path
+    found = _walk_for_config(start_dir)
+    return Path(found) if found is not None else None
 
-        # Stop at filesystem root
-        if current.parent == current:
-            break
 
-        current = current.parent
-
-    return None
+def clear_config_caches() -> None:
+    """Forget parsed config contents."""
+    _parsed_cache.clear()
 
 
 def _load_yaml(path: Path) -> dict[str, Any]:
     """Load a YAML file and return its contents as a dict."""
-    with open(path) as f:
-        data = yaml.safe_load(f)
+    with open(path, "rb") as f:
+        data = yaml.load(f, Loader=_YAML_LOADER)
     return data if isinstance(data, dict) else {}
 
 
+def _load_toml(path: Path) -> dict[str, Any]:
+    """Load a TOML file and return its contents as a dict."""
+    with open(path, "rb") as f:
+        return tomllib.load(f)
+
+
+# Parsed config files keyed by path, reused while (mtime_ns, size) is unchanged.
+# Parsing dominates load_config; Pydantic validation is cheap by comparison
+# (cheaper than deep-copying a cached model) and still runs on every call so
+# each caller gets its own mutable config instance.  Bounded LRU so processes
+# that load many projects (tests, tooling) do not grow without limit.
+_PARSED_CACHE_MAXSIZE = 32
+_parsed_cache: OrderedDict[Path, tuple[tuple[int, int], dict[str, Any]]] = OrderedDict()
+
+
+def _load_cached(path: Path) -> dict[str, Any] | None:
+    """Return the parsed contents of *path*, or ``None`` if it does not exist.
+
+    ``.toml`` files are parsed as TOML, anything else as YAML.  The result is
+    shared between calls and must not be mutated.
+    """
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    signature = (st.st_mtime_ns, st.st_size)
+    cached = _parsed_cache.get(path)
+    if cached is not None and cached[0] == signature:
+        _parsed_cache.move_to_end(path)
+        return cached[1]
+    data = _load_toml(path) if path.suffix == ".toml" else _load_yaml(path)
+    _parsed_cache[path] = (signature, data)
+    _parsed_cache.move_to_end(path)
+    if len(_parsed_cache) > _PARSED_CACHE_MAXSIZE:
+        _parsed_cache.popitem(last=False)
+    return data
+
+
 def load_config(
     project_root: Path | None = None,
     global_config_path: Path | None = None,
 ) -> LexibraryConfig:
-    """Load and validate configuration with two-tier YAML merge.
+    """Load and validate configuration with a two-tier global + project merge.
 
     Merge strategy: load global config → load project config → shallow merge
     with project values taking precedence → validate with Pydantic.
 
+    Parsed files are memoized per process and re-read only when their
+    modification time or size changes.
+
     Args:
-        project_root: Project root directory containing ``.lexibrary/config.yaml``.
+        project_root: Project root directory containing ``.lexibrary/config.toml``
+            or ``.lexibrary/config.yaml``.
             If None, no project config is loaded.
         global_config_path: Override for the global config path (useful for testing).
             Defaults to ``~/.config/lexibrarian/config.yaml``.
@@ -69,18 +135,22 @@ def load_config(
     Raises:
         pydantic.ValidationError: If merged config contains invalid values.
     """
+    # Deferred so find_config_file and GLOBAL_CONFIG_PATH stay Pydantic-free
+    from lexibrarian.config.schema import LexibraryConfig
+
     global_path = global_config_path if global_config_path is not None else GLOBAL_CONFIG_PATH
-    project_path = project_root / ".lexibrary" / "config.yaml" if project_root else None
 
     # Load global config
-    global_data: dict[str, Any] = {}
-    if global_path.exists():
-        global_data = _load_yaml(global_path)
+    global_data = _load_cached(global_path) or {}
 
-    # Load project config
+    # Load project config (config.toml wins over config.yaml)
     project_data: dict[str, Any] = {}
-    if project_path is not None and project_path.exists():
-        project_data = _load_yaml(project_path)
+    if project_root is not None:
+        for name in _PROJECT_CONFIG_NAMES:
+            parsed = _load_cached(project_root / ".lexibrary" / name)
+            if parsed is not None:
+                project_data = parsed
+                break
 
     # Shallow merge: project top-level keys override global
     merged = {**global_data, **project_data}
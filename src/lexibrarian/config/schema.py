@@ -4,7 +4,69 @@ from __future__ import annotations
 
 from typing import Any
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, field_serializer
+
+# Default lists are module-level tuples so instances copy them instead of
+# rebuilding the literals on every construction.
+_DEFAULT_BINARY_EXTENSIONS: tuple[str, ...] = (
+    # Images
+    ".png",
+    ".jpg",
+    ".jpeg",
+    ".gif",
+    ".ico",
+    ".svg",
+    ".webp",
+    # Audio/video
+    ".mp3",
+    ".mp4",
+    ".wav",
+    ".ogg",
+    ".webm",
+    # Fonts
+    ".woff",
+    ".woff2",
+    ".ttf",
+    ".eot",
+    # Archives
+    ".zip",
+    ".tar",
+    ".gz",
+    ".bz2",
+    ".7z",
+    ".rar",
+    # Documents
+    ".pdf",
+    ".doc",
+    ".docx",
+    ".xls",
+    ".xlsx",
+    # Executables / compiled
+    ".exe",
+    ".dll",
+    ".so",
+    ".dylib",
+    ".pyc",
+    ".pyo",
+    ".class",
+    ".o",
+    ".obj",
+    # Database
+    ".sqlite",
+    ".db",
+)
+
+_DEFAULT_IGNORE_PATTERNS: tuple[str, ...] = (
+    ".lexibrary/START_HERE.md",
+    ".lexibrary/**/*.md",
+    ".lexibrary/**/.aindex",
+    "node_modules/",
+    "__pycache__/",
+    ".git/",
+    ".venv/",
+    "venv/",
+    "*.lock",
+)
 
 
 class CrawlConfig(BaseModel):
@@ -13,56 +75,16 @@ class CrawlConfig(BaseModel):
     model_config = ConfigDict(extra="ignore")
 
     max_file_size_kb: int = 512
-    binary_extensions: list[str] = Field(
-        default_factory=lambda: [
-            # Images
-            ".png",
-            ".jpg",
-            ".jpeg",
-            ".gif",
-            ".ico",
-            ".svg",
-            ".webp",
-            # Audio/video
-            ".mp3",
-            ".mp4",
-            ".wav",
-            ".ogg",
-            ".webm",
-            # Fonts
-            ".woff",
-            ".woff2",
-            ".ttf",
-            ".eot",
-            # Archives
-            ".zip",
-            ".tar",
-            ".gz",
-            ".bz2",
-            ".7z",
-            ".rar",
-            # Documents
-            ".pdf",
-            ".doc",
-            ".docx",
-            ".xls",
-            ".xlsx",
-            # Executables / compiled
-            ".exe",
-            ".dll",
-            ".so",
-            ".dylib",
-            ".pyc",
-            ".pyo",
-            ".class",
-            ".o",
-            ".obj",
-            # Database
-            ".sqlite",
-            ".db",
-        ]
+    # frozenset for O(1) suffix lookups; YAML/JSON lists are coerced on validation
+    binary_extensions: frozenset[str] = Field(
+        default_factory=lambda: frozenset(_DEFAULT_BINARY_EXTENSIONS)
     )
 
+    @field_serializer("binary_extensions")
+    def _serialize_binary_extensions(self, value: frozenset[str]) -> list[str]:
+        # Sorted so dumps (and config hashes) do not depend on set iteration order
+        return sorted(value)
+
 
 class TokenizerConfig(BaseModel):
     """Tokenizer configuration."""
@@ -84,6 +106,13 @@ class LLMConfig(BaseModel):
     api_key_env: str = "ANTHROPIC_API_KEY"
     max_retries: int = 3
     timeout: int = 60
+    rpm_limit: int = Field(default=50, gt=0)
+    tpm_limit: int | None = Field(default=None, gt=0)
+    # Opt-in: provider sampling is not deterministic, so a replayed response
+    # is one possible answer rather than the answer
+    response_cache: bool = False
+    response_cache_max_entries: int = Field(default=2000, gt=0)
+    prompt_cache: bool = True
 
 
 class TokenBudgetConfig(BaseModel):
@@ -112,19 +141,7 @@ class IgnoreConfig(BaseModel):
     model_config = ConfigDict(extra="ignore")
 
     use_gitignore: bool = True
-    additional_patterns: list[str] = Field(
-        default_factory=lambda: [
-            ".lexibrary/START_HERE.md",
-            ".lexibrary/**/*.md",
-            ".lexibrary/**/.aindex",
-            "node_modules/",
-            "__pycache__/",
-            ".git/",
-            ".venv/",
-            "venv/",
-            "*.lock",
-        ]
-    )
+    additional_patterns: list[str] = Field(default_factory=lambda: list(_DEFAULT_IGNORE_PATTERNS))
 
 
 class DaemonConfig(BaseModel):
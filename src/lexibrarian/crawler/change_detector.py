@@ -1,21 +1,69 @@
-"""SHA-256 hash-based change detection with JSON cache persistence."""
+"""SHA-256 hash-based change detection with JSON cache persistence.
+
+The cache is a JSON snapshot plus an append-only journal beside it
+(``<cache>.journal``, one JSON record per line).  Saves append only the
+entries that changed since the last save; the snapshot is rewritten, and
+the journal dropped, once the journal grows past a fraction of the cache.
+"""
 
 from __future__ import annotations
 
 import json
 import logging
-from dataclasses import asdict, dataclass
+import os
+import sys
+import time
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import Any
 
+from lexibrarian.utils.atomic import atomic_write
+from lexibrarian.utils.hash_cache import RACY_WINDOW_NS
 from lexibrarian.utils.hashing import hash_file
 
+try:
+    import orjson  # type: ignore[import-not-found, unused-ignore]
+except ImportError:  # optional speedup: pip install lexibrary[fast]
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 _CACHE_VERSION = 1
 
+# Compact once the journal holds more records than this share of the entries
+_JOURNAL_COMPACT_RATIO = 0.5
+# ...but never for journals shorter than this
+_JOURNAL_COMPACT_MIN = 256
+
+# Below this many files to hash, thread start-up costs more than it saves
+_PARALLEL_HASH_THRESHOLD = 16
+
+
+def _dumps(data: dict[str, Any]) -> bytes:
+    """Serialize the cache, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)  # type: ignore[no-any-return, unused-ignore]
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def _dumps_record(data: dict[str, Any]) -> bytes:
+    """Serialize one journal record as a single line."""
+    if orjson is not None:
+        return orjson.dumps(data) + b"\n"  # type: ignore[no-any-return, unused-ignore]
+    return json.dumps(data, separators=(",", ":")).encode("utf-8") + b"\n"
+
 
-@dataclass
+def _loads(raw: bytes) -> Any:
+    """Parse the cache, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+@dataclass(slots=True)
 class FileState:
     """Cached state for a single file."""
 
@@ -23,6 +71,55 @@ class FileState:
     tokens: int
     summary: str
     last_indexed: str
+    # Stat signature the hash was taken at; 0 means unknown (always re-hash)
+    mtime_ns: int = 0
+    size: int = 0
+
+    def as_dict(self) -> dict[str, object]:
+        """Return the JSON-ready fields (a flat literal, unlike ``asdict``'s deep copy)."""
+        return {
+            "hash": self.hash,
+            "tokens": self.tokens,
+            "summary": self.summary,
+            "last_indexed": self.last_indexed,
+            "mtime_ns": self.mtime_ns,
+            "size": self.size,
+        }
+
+    @classmethod
+    def from_dict(cls, val: dict[str, Any]) -> FileState:
+        return cls(
+            hash=val["hash"],
+            tokens=val["tokens"],
+            summary=val["summary"],
+            # Entries from one sweep share a timestamp; keep one copy
+            last_indexed=sys.intern(val["last_indexed"]),
+            mtime_ns=val.get("mtime_ns", 0),
+            size=val.get("size", 0),
+        )
+
+
+def _stable_signature(st: os.stat_result) -> tuple[int, int]:
+    """Return ``(mtime_ns, size)``, or zeros if the mtime is too recent to trust."""
+    if st.st_mtime_ns >= time.time_ns() - RACY_WINDOW_NS:
+        return 0, 0
+    return st.st_mtime_ns, st.st_size
+
+
+def _hash_or_none(path: Path) -> str | None:
+    try:
+        return hash_file(path)
+    except OSError:
+        return None
+
+
+def _hash_all(paths: list[Path]) -> list[str | None]:
+    """Hash *paths* in order, on a thread pool for larger batches."""
+    if len(paths) < _PARALLEL_HASH_THRESHOLD:
+        return [_hash_or_none(path) for path in paths]
+    workers = min(32, (os.cpu_count() or 1) * 2, len(paths))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_hash_or_none, paths))
 
 
 class CrawlCache:
@@ -34,7 +131,7 @@ class CrawlCache:
     def to_dict(self) -> dict[str, object]:
         return {
             "version": _CACHE_VERSION,
-            "files": {k: asdict(v) for k, v in self.entries.items()},
+            "files": {k: v.as_dict() for k, v in self.entries.items()},
         }
 
     @classmethod
@@ -48,64 +145,208 @@ class CrawlCache:
         if isinstance(files, dict):
             for key, val in files.items():
                 if isinstance(val, dict):
-                    cache.entries[key] = FileState(
-                        hash=val["hash"],
-                        tokens=val["tokens"],
-                        summary=val["summary"],
-                        last_indexed=val["last_indexed"],
-                    )
+                    cache.entries[key] = FileState.from_dict(val)
         return cache
 
 
 class ChangeDetector:
-    """Detect file changes via SHA-256 hash comparison with persistent cache."""
+    """Detect file changes via SHA-256 hash comparison with persistent cache.
+
+    Each entry also records the ``(mtime_ns, size)`` its hash was taken at;
+    files whose stat signature still matches are reported unchanged without
+    being read.
+    """
 
     def __init__(self, cache_path: Path) -> None:
         self._cache_path = cache_path
+        self._journal_path = cache_path.with_name(cache_path.name + ".journal")
         self._cache = CrawlCache()
         self._dirty = False
+        # Keys changed since the last save; their current state (or absence)
+        # is what the next journal append records
+        self._pending: set[str] = set()
+        # Set when the journal cannot describe the change (clear, bad journal)
+        self._rewrite = False
+        self._journal_records = 0
+        # Stat signature and hash observed by has_changed, consumed by update
+        self._observed: dict[str, tuple[int, int, str]] = {}
+        # Timestamp shared by every update in the current sweep, if one is open
+        self._sweep_iso: str | None = None
 
     def load(self) -> None:
         """Load cache from disk. No-op if file doesn't exist."""
         if not self._cache_path.exists():
             return
 
+        self._dirty = False
+        self._pending.clear()
+        self._rewrite = False
+        self._journal_records = 0
         try:
-            data = json.loads(self._cache_path.read_text(encoding="utf-8"))
+            data = _loads(self._cache_path.read_bytes())
             self._cache = CrawlCache.from_dict(data)
-        except (json.JSONDecodeError, ValueError, KeyError, TypeError):
+        except (ValueError, KeyError, TypeError, AttributeError):
             logger.warning("Corrupted cache at %s, starting fresh", self._cache_path)
             self._cache = CrawlCache()
+            self._rewrite = True
+            return
 
-        self._dirty = False
+        self._replay_journal()
+
+    def _replay_journal(self) -> None:
+        """Apply journal records on top of the loaded snapshot."""
+        try:
+            raw = self._journal_path.read_bytes()
+        except FileNotFoundError:
+            return
+        except OSError:
+            self._rewrite = True
+            return
+
+        entries = self._cache.entries
+        for line in raw.splitlines():
+            try:
+                record = _loads(line)
+                key = record["path"]
+                state = record["state"]
+                if state is None:
+                    entries.pop(key, None)
+                else:
+                    entries[key] = FileState.from_dict(state)
+            except (ValueError, KeyError, TypeError, AttributeError):
+                # A torn final write; everything before it is intact
+                logger.warning("Corrupted cache journal at %s, compacting", self._journal_path)
+                self._rewrite = True
+                self._dirty = True
+                return
+            self._journal_records += 1
 
     def save(self) -> None:
-        """Save cache to disk if dirty."""
+        """Save cache to disk if dirty.
+
+        Changed entries are appended to the journal; the snapshot is only
+        rewritten (atomically, so a crash mid-save leaves the previous one
+        intact) when the journal has grown too long to be worth replaying.
+        """
         if not self._dirty:
             return
 
-        self._cache_path.write_text(
-            json.dumps(self._cache.to_dict(), indent=2),
-            encoding="utf-8",
-        )
+        threshold = max(_JOURNAL_COMPACT_MIN, len(self._cache.entries) * _JOURNAL_COMPACT_RATIO)
+        if (
+            self._rewrite
+            or self._journal_records + len(self._pending) > threshold
+            or not self._cache_path.exists()
+        ):
+            self._compact()
+        else:
+            self._append_journal()
+        self._pending.clear()
+        self._rewrite = False
         self._dirty = False
 
+    def _compact(self) -> None:
+        """Rewrite the snapshot from memory and drop the journal."""
+        # Drop the journal first: a crash in between loses only recent
+        # entries (costing a re-hash), never replays stale ones
+        self._journal_path.unlink(missing_ok=True)
+        self._journal_records = 0
+        atomic_write(self._cache_path, _dumps(self._cache.to_dict()))
+
+    def _append_journal(self) -> None:
+        """Append one record per pending key to the journal."""
+        entries = self._cache.entries
+        payload = b"".join(
+            _dumps_record(
+                {"path": key, "state": state.as_dict() if (state := entries.get(key)) else None}
+            )
+            for key in sorted(self._pending)
+        )
+        try:
+            with self._journal_path.open("ab") as f:
+                f.write(payload)
+        except OSError:
+            # The journal may now end mid-record; start over from a snapshot
+            self._compact()
+            return
+        self._journal_records += len(self._pending)
+
+    def _mark(self, key: str) -> None:
+        self._pending.add(key)
+        self._dirty = True
+
     def has_changed(self, path: Path) -> bool:
         """Check if a file has changed since last indexing.
 
-        Returns True for new files or files with different hashes.
+        Returns True for new files or files with different hashes.  Files
+        whose ``(mtime_ns, size)`` match the cached entry are not re-hashed.
         """
-        key = str(path)
-        entry = self._cache.entries.get(key)
-        if entry is None:
-            return True
+        return self.check_many([path])[path]
 
-        try:
-            current_hash = hash_file(path)
-        except OSError:
+    def check_many(self, paths: Iterable[Path]) -> dict[Path, bool]:
+        """Check a batch of files, hashing the suspect ones in parallel.
+
+        Equivalent to calling :meth:`has_changed` on each path.  Files are
+        stat'ed first; only those whose stat signature differs from the
+        cache are read, on a thread pool once there are enough of them
+        (OpenSSL releases the GIL while hashing).  A file already found
+        changed at its current stat signature (for example because its
+        summary failed and the cache was never updated) is not hashed again.
+        """
+        results: dict[Path, bool] = {}
+        suspects: list[tuple[Path, FileState, os.stat_result]] = []
+        for path in paths:
+            key = str(path)
+            entry = self._cache.entries.get(key)
+            if entry is None:
+                results[path] = True
+                continue
+            try:
+                st = os.stat(path)
+            except OSError:
+                results[path] = True
+                continue
+            signature = (st.st_mtime_ns, st.st_size)
+            if entry.mtime_ns and signature == (entry.mtime_ns, entry.size):
+                results[path] = False
+            elif (
+                (observed := self._observed.get(key))
+                and observed[0]
+                and (signature == observed[:2])
+            ):
+                results[path] = True
+            else:
+                suspects.append((path, entry, st))
+
+        hashes = _hash_all([path for path, _entry, _st in suspects])
+        for (path, entry, st), current_hash in zip(suspects, hashes, strict=True):
+            results[path] = self._record_hash(path, entry, st, current_hash)
+        return results
+
+    def _record_hash(
+        self, path: Path, entry: FileState, st: os.stat_result, current_hash: str | None
+    ) -> bool:
+        """Compare a fresh hash against *entry*; return True if the file changed."""
+        if current_hash is None:
             return True
 
-        return current_hash != entry.hash
+        signature = _stable_signature(st)
+        if current_hash == entry.hash:
+            # Content unchanged (touched, or an old cache): remember the new stat
+            if (entry.mtime_ns, entry.size) != signature:
+                entry.mtime_ns, entry.size = signature
+                self._mark(str(path))
+            return False
+
+        self._observed[str(path)] = (*signature, current_hash)
+        return True
+
+    def begin_sweep(self) -> None:
+        """Stamp every :meth:`update` until :meth:`end_sweep` with the current time."""
+        self._sweep_iso = datetime.now(UTC).isoformat()
+
+    def end_sweep(self) -> None:
+        """Return :meth:`update` to stamping each entry as it is written."""
+        self._sweep_iso = None
 
     def get_cached(self, path: Path) -> FileState | None:
         """Get cached state for a file, or None if not cached."""
@@ -117,25 +358,40 @@ class ChangeDetector:
         file_hash: str,
         tokens: int,
         summary: str,
+        last_indexed: str | None = None,
     ) -> None:
-        """Update the cache entry for a file."""
-        self._cache.entries[str(path)] = FileState(
+        """Update the cache entry for a file.
+
+        The stat signature seen by :meth:`has_changed` is kept only when it
+        was taken for the same *file_hash*; otherwise the next check re-hashes.
+        *last_indexed* defaults to the open sweep's timestamp, or the current
+        time outside a sweep.
+        """
+        key = str(path)
+        mtime_ns, size = 0, 0
+        observed = self._observed.pop(key, None)
+        if observed is not None and observed[2] == file_hash:
+            mtime_ns, size = observed[0], observed[1]
+        self._cache.entries[key] = FileState(
             hash=file_hash,
             tokens=tokens,
             summary=summary,
-            last_indexed=datetime.now(UTC).isoformat(),
+            last_indexed=last_indexed or self._sweep_iso or datetime.now(UTC).isoformat(),
+            mtime_ns=mtime_ns,
+            size=size,
         )
-        self._dirty = True
+        self._mark(key)
 
     def prune_deleted(self, existing_paths: set[str]) -> None:
         """Remove cache entries for files that no longer exist."""
         to_remove = [k for k in self._cache.entries if k not in existing_paths]
         for key in to_remove:
             del self._cache.entries[key]
-        if to_remove:
-            self._dirty = True
+            self._mark(key)
 
     def clear(self) -> None:
         """Clear all cached entries."""
         self._cache.entries.clear()
+        self._pending.clear()
+        self._rewrite = True
         self._dirty = True
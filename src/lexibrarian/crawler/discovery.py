@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import os
+from collections.abc import Set as AbstractSet
 from pathlib import Path
 
 from lexibrarian.ignore.matcher import IgnoreMatcher
@@ -25,26 +26,31 @@ def discover_directories_bottom_up(
     Returns:
         List of directory Paths, deepest first, root last.
     """
-    directories: list[Path] = []
+    # (depth, dirpath, Path) so the sort never touches Path internals
+    entries: list[tuple[int, str, Path]] = []
 
-    for dirpath, dirnames, _filenames in os.walk(root, topdown=True):
+    # os.walk lists each directory once via scandir and never stats for
+    # is_dir; symlinked directories are not followed
+    for dirpath, dirnames, _filenames in os.walk(root, topdown=True, followlinks=False):
         current = Path(dirpath)
 
         # Prune ignored directories in-place (modifies dirnames for os.walk)
         dirnames[:] = [d for d in dirnames if ignore_matcher.should_descend(current / d)]
 
-        directories.append(current)
+        # Every dirpath extends the same root string, so separator counts
+        # order directories by depth without parsing Path.parts
+        entries.append((dirpath.count(os.sep), dirpath, current))
 
     # Sort by depth (deepest first); ties broken alphabetically
-    directories.sort(key=lambda p: (-len(p.parts), str(p)))
+    entries.sort(key=lambda t: (-t[0], t[1]))
 
-    return directories
+    return [t[2] for t in entries]
 
 
 def list_directory_files(
     directory: Path,
     ignore_matcher: IgnoreMatcher,
-    binary_extensions: set[str],
+    binary_extensions: AbstractSet[str],
 ) -> tuple[list[Path], list[Path]]:
     """List files in a directory, separating indexable from skipped.
 
@@ -62,21 +68,28 @@ def list_directory_files(
     indexable: list[Path] = []
     skipped: list[Path] = []
 
+    # DirEntry.is_file() answers from the directory read for regular files
+    # (it only stats symlinks), unlike Path.is_file() which always stats.
     try:
-        entries = sorted(directory.iterdir())
+        with os.scandir(directory) as it:
+            entries = sorted(it, key=lambda e: e.name)
     except PermissionError:
         return [], []
 
     for entry in entries:
-        if not entry.is_file():
+        try:
+            if not entry.is_file():
+                continue
+        except OSError:
             continue
 
-        if ignore_matcher.is_ignored(entry):
+        path = Path(entry.path)
+        if ignore_matcher.is_ignored(path):
             continue
 
-        if entry.suffix.lower() in binary_extensions:
-            skipped.append(entry)
+        if os.path.splitext(entry.name)[1].lower() in binary_extensions:
+            skipped.append(path)
         else:
-            indexable.append(entry)
+            indexable.append(path)
 
     return indexable, skipped
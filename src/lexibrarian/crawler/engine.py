@@ -13,7 +13,7 @@ from lexibrarian.crawler.discovery import (
     discover_directories_bottom_up,
     list_directory_files,
 )
-from lexibrarian.crawler.file_reader import read_file_for_indexing
+from lexibrarian.crawler.file_reader import FileContent, read_and_hash
 from lexibrarian.ignore.matcher import IgnoreMatcher
 
 # v1 indexer retired in Phase 1 — crawler will be reworked in a later phase.
@@ -28,7 +28,6 @@ from lexibrarian.llm.service import (
     LLMService,
 )
 from lexibrarian.tokenizer.base import TokenCounter
-from lexibrarian.utils.hashing import hash_file
 from lexibrarian.utils.languages import detect_language
 
 logger = logging.getLogger(__name__)
@@ -66,36 +65,40 @@ async def full_crawl(
     and returns crawl statistics.
     """
     stats = CrawlStats()
-    binary_exts = set(config.crawl.binary_extensions)
+    binary_exts = config.crawl.binary_extensions
     index_filename = config.output.index_filename
 
     # Discover directories bottom-up
     directories = discover_directories_bottom_up(root, ignore_matcher)
     total = len(directories)
 
-    for idx, directory in enumerate(directories, start=1):
-        if progress_callback is not None:
-            dir_name = str(directory.relative_to(root)) if directory != root else "."
-            progress_callback(idx, total, dir_name)
-
-        try:
-            await _index_directory(
-                directory=directory,
-                root=root,
-                config=config,
-                ignore_matcher=ignore_matcher,
-                token_counter=token_counter,
-                llm_service=llm_service,
-                change_detector=change_detector,
-                binary_exts=binary_exts,
-                index_filename=index_filename,
-                stats=stats,
-                dry_run=dry_run,
-            )
-            stats.directories_indexed += 1
-        except Exception:
-            logger.warning("Error indexing %s", directory, exc_info=True)
-            stats.errors += 1
+    change_detector.begin_sweep()
+    try:
+        for idx, directory in enumerate(directories, start=1):
+            if progress_callback is not None:
+                dir_name = str(directory.relative_to(root)) if directory != root else "."
+                progress_callback(idx, total, dir_name)
+
+            try:
+                await _index_directory(
+                    directory=directory,
+                    root=root,
+                    config=config,
+                    ignore_matcher=ignore_matcher,
+                    token_counter=token_counter,
+                    llm_service=llm_service,
+                    change_detector=change_detector,
+                    binary_exts=binary_exts,
+                    index_filename=index_filename,
+                    stats=stats,
+                    dry_run=dry_run,
+                )
+                stats.directories_indexed += 1
+            except Exception:
+                logger.warning("Error indexing %s", directory, exc_info=True)
+                stats.errors += 1
+    finally:
+        change_detector.end_sweep()
 
     # Save cache after crawl (unless dry run)
     if not dry_run:
@@ -131,15 +134,16 @@ async def _index_directory(
         stats.files_skipped += 1
 
     # Categorize indexable files: changed vs cached
-    changed_files: list[tuple[Path, str]] = []  # (path, hash)
+    changed_files: list[tuple[Path, str, FileContent | None]] = []  # (path, hash, content)
+    changed = change_detector.check_many(indexable_files)
     for fp in indexable_files:
-        if change_detector.has_changed(fp):
+        if changed[fp]:
             try:
-                fhash = hash_file(fp)
+                fhash, fc = read_and_hash(fp, config.crawl.max_file_size_kb)
             except OSError:
                 stats.errors += 1
                 continue
-            changed_files.append((fp, fhash))
+            changed_files.append((fp, fhash, fc))
         else:
             cached = change_detector.get_cached(fp)
             if cached is not None:
@@ -230,14 +234,14 @@ def _resolve_summary(
 
 async def _summarize_changed_files(
     *,
-    changed_files: list[tuple[Path, str]],
+    changed_files: list[tuple[Path, str, FileContent | None]],
     config: LexibraryConfig,
     token_counter: TokenCounter,
     llm_service: LLMService,
     change_detector: ChangeDetector,
     stats: CrawlStats,
 ) -> list[FileEntry]:
-    """Read and summarize changed files, updating the cache.
+    """Summarize changed files, updating the cache.
 
     Batches small files; processes large files individually.
     """
@@ -247,8 +251,7 @@ async def _summarize_changed_files(
     small_requests: list[tuple[FileSummaryRequest, Path, str, int]] = []
     large_requests: list[tuple[FileSummaryRequest, Path, str, int]] = []
 
-    for fp, fhash in changed_files:
-        fc = read_file_for_indexing(fp, max_size_kb=config.crawl.max_file_size_kb)
+    for fp, fhash, fc in changed_files:
         if fc is None:
             # Unreadable after hash — treat as skipped
             ext = fp.suffix.lstrip(".") or "unknown"
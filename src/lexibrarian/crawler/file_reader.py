@@ -2,11 +2,31 @@
 
 from __future__ import annotations
 
+import hashlib
+import io
+import os
+import threading
 from dataclasses import dataclass
 from pathlib import Path
 
 _BINARY_CHECK_SIZE = 8192
 
+# Same buffer size as utils.hashing.hash_file
+_READ_CHUNK_SIZE = 256 * 1024
+
+# Per-thread read buffer reused by read_file_for_indexing (files are read
+# on worker threads), grown on demand to the largest max_size_kb seen
+_tls = threading.local()
+
+
+def _read_buffer(size: int) -> bytearray:
+    """Return this thread's reusable read buffer, at least *size* bytes long."""
+    buf: bytearray | None = getattr(_tls, "buf", None)
+    if buf is None or len(buf) < size:
+        buf = bytearray(size)
+        _tls.buf = buf
+    return buf
+
 
 @dataclass
 class FileContent:
@@ -25,7 +45,9 @@ def is_binary_file(path: Path) -> bool:
     Returns True for binary files or files that cannot be read.
     """
     try:
-        with open(path, "rb") as f:
+        # Unbuffered: one read syscall straight into the result, no 8 KiB
+        # BufferedReader allocation.  The NUL search itself is memchr.
+        with open(path, "rb", buffering=0) as f:
             chunk = f.read(_BINARY_CHECK_SIZE)
         return b"\x00" in chunk
     except OSError:
@@ -38,38 +60,99 @@ def read_file_for_indexing(
 ) -> FileContent | None:
     """Read a text file for LLM summarization.
 
-    Detects binary files, handles UTF-8 and Latin-1 encodings,
+    Detects binary files, decodes as UTF-8 (replacing invalid bytes),
     and truncates files exceeding the size limit.
 
-    Returns None for binary or undecodable files.
+    Returns None for binary or unreadable files.
     """
-    if is_binary_file(path):
-        return None
-
     max_bytes = max_size_kb * 1024
 
+    # Never read past the cap: a huge file costs max_bytes of memory, not its
+    # size.  The bytes land in a reused buffer and are decoded straight from it.
+    # The binary check runs on the first 8 KiB of that same read, so the file
+    # is opened once and a binary file is not read any further.
+    buf = _read_buffer(max_bytes + 1)
+    view = memoryview(buf)[: max_bytes + 1]
     try:
-        raw = path.read_bytes()
+        with open(path, "rb", buffering=0) as f:
+            size_bytes = os.fstat(f.fileno()).st_size
+            n = _fill(f, view, 0, min(_BINARY_CHECK_SIZE, len(view)))
+            if buf.find(b"\x00", 0, n) != -1:
+                return None
+            n = _fill(f, view, n, len(view))
     except OSError:
         return None
 
-    size_bytes = len(raw)
-    is_truncated = size_bytes > max_bytes
+    is_truncated = n > max_bytes
     if is_truncated:
-        raw = raw[:max_bytes]
-
-    # Try UTF-8 first, then Latin-1 fallback
-    for encoding in ("utf-8", "latin-1"):
-        try:
-            content = raw.decode(encoding)
-            return FileContent(
-                path=path,
-                content=content,
-                encoding=encoding,
-                size_bytes=size_bytes,
-                is_truncated=is_truncated,
-            )
-        except (UnicodeDecodeError, ValueError):
-            continue
-
-    return None
+        n = max_bytes
+    else:
+        size_bytes = n  # exact even if the file changed since fstat
+
+    return _decode(path, view[:n], size_bytes, is_truncated)
+
+
+def _fill(f: io.RawIOBase, view: memoryview, start: int, stop: int) -> int:
+    """Read from *f* into ``view[start:stop]`` until it is full or at EOF.
+
+    Returns the new end offset.
+    """
+    n = start
+    while n < stop and (got := f.readinto(view[n:stop])):
+        n += got
+    return n
+
+
+def read_and_hash(
+    path: Path,
+    max_size_kb: int = 512,
+) -> tuple[str, FileContent | None]:
+    """Hash a file and read it for LLM summarization in a single pass.
+
+    Returns the SHA-256 hex digest of the whole file (as
+    :func:`~lexibrarian.utils.hashing.hash_file` computes it) together with
+    what :func:`read_file_for_indexing` would return, while opening and
+    reading the file only once.  Only the first ``max_size_kb`` KiB are kept
+    in memory.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    max_bytes = max_size_kb * 1024
+    keep = max(max_bytes, _BINARY_CHECK_SIZE)
+    digest = hashlib.sha256()
+    head = bytearray()
+    size_bytes = 0
+    buf = bytearray(_READ_CHUNK_SIZE)
+    view = memoryview(buf)
+
+    with open(path, "rb", buffering=0) as f:
+        while n := f.readinto(buf):
+            digest.update(view[:n])
+            if len(head) < keep:
+                head += view[: min(n, keep - len(head))]
+            size_bytes += n
+
+    if head.find(b"\x00", 0, _BINARY_CHECK_SIZE) != -1:
+        return digest.hexdigest(), None
+    is_truncated = size_bytes > max_bytes
+    raw = memoryview(head)[:max_bytes]
+    return digest.hexdigest(), _decode(path, raw, size_bytes, is_truncated)
+
+
+def _decode(
+    path: Path, raw: bytes | memoryview, size_bytes: int, is_truncated: bool
+) -> FileContent:
+    """Decode *raw* as UTF-8 in one pass, without copying it first.
+
+    Invalid bytes become U+FFFD rather than forcing a second decode: the
+    text only feeds an LLM prompt, and a multi-byte character cut at the
+    truncation point costs one replacement character, not the whole file.
+    """
+    return FileContent(
+        path=path,
+        content=str(raw, "utf-8", "replace"),
+        encoding="utf-8",
+        size_bytes=size_bytes,
+        is_truncated=is_truncated,
+    )
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import logging
+import os
 import threading
+import time
 from collections.abc import Callable
 from pathlib import Path
 
@@ -14,49 +16,99 @@ class Debouncer:
     """Coalesces rapid file change notifications into a single callback.
 
     Collects affected directories and fires the callback after a configurable
-    quiet period. Each new notification resets the timer. Thread-safe.
+    quiet period. Each new notification pushes the deadline back. Thread-safe.
+
+    A notification only moves a monotonic deadline; a single worker thread
+    waits for it, so a burst of events costs one thread rather than one
+    ``threading.Timer`` per event.  The worker exits once nothing is pending.
+
+    With *max_pending* and *on_overflow* set, a burst touching more than
+    *max_pending* directories (a branch switch, a dependency install) stops
+    tracking them individually and fires *on_overflow* once instead.
     """
 
     def __init__(
         self,
         delay: float,
         callback: Callable[[set[Path]], None],
+        *,
+        max_pending: int | None = None,
+        on_overflow: Callable[[], None] | None = None,
     ) -> None:
         self._delay = delay
         self._callback = callback
-        self._lock = threading.Lock()
-        self._timer: threading.Timer | None = None
-        self._pending: set[Path] = set()
-
-    def notify(self, directory: Path) -> None:
-        """Register a changed directory, resetting the debounce timer."""
-        with self._lock:
-            self._pending.add(directory)
-            if self._timer is not None:
-                self._timer.cancel()
-            self._timer = threading.Timer(self._delay, self._fire)
-            self._timer.daemon = True
-            self._timer.start()
-
-    def _fire(self) -> None:
-        """Fire the callback with accumulated directories."""
-        with self._lock:
-            dirs = self._pending.copy()
-            self._pending.clear()
-            self._timer = None
+        self._max_pending = max_pending if on_overflow is not None else None
+        self._on_overflow = on_overflow
+        self._cond = threading.Condition()
+        self._deadline: float | None = None
+        self._worker: threading.Thread | None = None
+        # Plain strings: cheaper to hash than Path while events pour in
+        self._pending: set[str] = set()
+        self._overflowed = False
+
+    def notify(self, directory: str | os.PathLike[str]) -> None:
+        """Register a changed directory, resetting the debounce deadline."""
+        with self._cond:
+            if not self._overflowed:
+                self._pending.add(os.fspath(directory))
+                if self._max_pending is not None and len(self._pending) > self._max_pending:
+                    self._pending.clear()
+                    self._overflowed = True
+            self._deadline = time.monotonic() + self._delay
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run, name="lexibrarian-debouncer", daemon=True
+                )
+                self._worker.start()
+            else:
+                self._cond.notify()
+
+    def _run(self) -> None:
+        """Wait out the deadline, fire, and repeat until nothing is pending."""
+        with self._cond:
+            while self._deadline is not None:
+                remaining = self._deadline - time.monotonic()
+                if remaining > 0:
+                    self._cond.wait(remaining)
+                    continue
+                dirs = self._pending
+                overflowed = self._overflowed
+                self._pending = set()
+                self._overflowed = False
+                self._deadline = None
+                self._cond.release()
+                try:
+                    if overflowed:
+                        self._fire_overflow()
+                    else:
+                        self._fire(dirs)
+                finally:
+                    self._cond.acquire()
+            self._worker = None
 
+    def _fire(self, dirs: set[str]) -> None:
+        """Fire the callback with accumulated directories."""
         if not dirs:
             return
 
         try:
-            self._callback(dirs)
+            self._callback({Path(d) for d in dirs})
         except Exception:
             logger.exception("Debouncer callback failed")
 
+    def _fire_overflow(self) -> None:
+        """Fire the overflow callback in place of the directory callback."""
+        if self._on_overflow is None:
+            return
+        try:
+            self._on_overflow()
+        except Exception:
+            logger.exception("Debouncer overflow callback failed")
+
     def cancel(self) -> None:
-        """Cancel any pending timer and discard accumulated directories."""
-        with self._lock:
-            if self._timer is not None:
-                self._timer.cancel()
-                self._timer = None
+        """Cancel any pending deadline and discard accumulated directories."""
+        with self._cond:
+            self._deadline = None
             self._pending.clear()
+            self._overflowed = False
+            self._cond.notify()
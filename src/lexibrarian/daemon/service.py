@@ -12,23 +12,29 @@ Watchdog imports are lazy -- the module loads and ``run_once`` /
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import logging
 import os
 import signal
 import threading
+from collections.abc import Callable, Coroutine
+from concurrent.futures import CancelledError, ThreadPoolExecutor, as_completed
 from pathlib import Path
 from types import FrameType
+from typing import Any, TypeVar
 
 from rich.console import Console
 
-from lexibrarian.archivist.pipeline import update_project
+from lexibrarian.archivist.cache import LLM_CACHE_DIRNAME, CachedArchivistService
+from lexibrarian.archivist.pipeline import UpdateStats, update_files, update_project
 from lexibrarian.archivist.service import ArchivistService
 from lexibrarian.config.loader import load_config
 from lexibrarian.config.schema import LexibraryConfig
 from lexibrarian.daemon.logging import setup_daemon_logging
 from lexibrarian.daemon.scheduler import PeriodicSweep
-from lexibrarian.ignore import create_ignore_matcher
+from lexibrarian.ignore import IgnoreMatcher, create_ignore_matcher
 from lexibrarian.llm.rate_limiter import RateLimiter
+from lexibrarian.utils.atomic import atomic_write
 from lexibrarian.utils.paths import LEXIBRARY_DIR
 
 logger = logging.getLogger(__name__)
@@ -36,44 +42,133 @@ console = Console()
 
 _PID_FILENAME = ".lexibrarian.pid"
 
+# Time of the last full sweep, kept under .lexibrary/ so that a restarted
+# daemon or a one-shot ``run_once`` can still skip an unchanged project
+_LAST_SWEEP_FILENAME = ".last_sweep"
 
-def _has_changes(root: Path, last_sweep: float) -> bool:
+# Debounced bursts touching more directories than this run a full sweep
+_MAX_PENDING_DIRS = 512
+
+# Seconds _stop_loop waits for cancelled in-flight sweeps to unwind
+_LOOP_CANCEL_TIMEOUT = 5.0
+
+# Top-level subtrees the change scan walks side by side
+_MAX_SCAN_THREADS = min(8, os.cpu_count() or 1)
+
+_SHUTDOWN_SIGNALS = frozenset({signal.SIGINT, signal.SIGTERM})
+
+_T = TypeVar("_T")
+
+
+def _has_changes(
+    root: Path,
+    last_sweep: float,
+    matcher: IgnoreMatcher | None = None,
+) -> bool:
     """Check whether any file under *root* has mtime newer than *last_sweep*.
 
     Uses ``os.scandir()`` for a fast stat walk.  Returns ``True`` on the
     first file found with a newer mtime (short-circuit).  Skips the
-    ``.lexibrary/`` directory to avoid self-triggered loops.
+    ``.lexibrary/`` directory to avoid self-triggered loops, and, when a
+    *matcher* is given, every directory it would not descend into (so
+    ``.git/`` activity or a ``node_modules/`` install neither triggers a
+    sweep nor gets walked).
 
     If *last_sweep* is ``0.0`` (first run), always returns ``True``.
     """
     if last_sweep == 0.0:
         return True
 
-    lexibrary_abs = (root / LEXIBRARY_DIR).resolve()
-
-    def _scan(directory: Path) -> bool:
-        try:
-            with os.scandir(directory) as it:
-                for entry in it:
-                    entry_path = Path(entry.path).resolve()
-
-                    # Skip the .lexibrary directory entirely
-                    if entry.is_dir(follow_symlinks=False):
-                        if entry_path == lexibrary_abs:
-                            continue
-                        if _scan(entry_path):
+    root_str = os.path.realpath(root)
+    descend = None if matcher is None else matcher.should_descend
+    return _scan_parallel(root_str, os.path.join(root_str, LEXIBRARY_DIR), last_sweep, descend)
+
+
+def _scan(
+    root_str: str,
+    skip_dir_str: str,
+    last_sweep: float,
+    descend: Callable[[str], bool] | None = None,
+    stop: threading.Event | None = None,
+) -> bool:
+    """Walk *root_str* depth-first looking for a file newer than *last_sweep*.
+
+    Iterates over a stack of plain string paths so no ``Path`` objects or
+    ``realpath`` calls are made per entry.  *skip_dir_str* is pruned by
+    string equality, which holds because every child path is built from
+    the already-resolved *root_str*.  Subdirectories for which *descend*
+    returns ``False`` are pruned without being opened.  Setting *stop*
+    abandons the walk (returning ``False``) before the next directory.
+    """
+    stack = [root_str]
+    while stack:
+        if stop is not None and stop.is_set():
+            return False
+        if _scan_directory(stack.pop(), skip_dir_str, last_sweep, descend, stack):
+            return True
+    return False
+
+
+def _scan_parallel(
+    root_str: str,
+    skip_dir_str: str,
+    last_sweep: float,
+    descend: Callable[[str], bool] | None = None,
+) -> bool:
+    """Like :func:`_scan`, but walk each top-level subtree on a thread pool.
+
+    ``stat`` calls spend most of their time in the kernel with the GIL
+    released, so subtrees scanned side by side overlap that latency.  The
+    first newer file found stops the remaining walkers.
+    """
+    subdirs: list[str] = []
+    if _scan_directory(root_str, skip_dir_str, last_sweep, descend, subdirs):
+        return True
+    if len(subdirs) < 2:
+        return any(_scan(d, skip_dir_str, last_sweep, descend) for d in subdirs)
+
+    stop = threading.Event()
+    executor = ThreadPoolExecutor(
+        max_workers=min(_MAX_SCAN_THREADS, len(subdirs)),
+        thread_name_prefix="lexibrarian-scan",
+    )
+    try:
+        futures = [
+            executor.submit(_scan, d, skip_dir_str, last_sweep, descend, stop) for d in subdirs
+        ]
+        return any(future.result() for future in as_completed(futures))
+    finally:
+        stop.set()
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _scan_directory(
+    directory: str,
+    skip_dir_str: str,
+    last_sweep: float,
+    descend: Callable[[str], bool] | None,
+    subdirs: list[str],
+) -> bool:
+    """Check the files directly inside *directory* against *last_sweep*.
+
+    Returns ``True`` at the first newer file.  Subdirectories still to be
+    walked are appended to *subdirs*.  Unreadable entries are skipped.
+    """
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.path != skip_dir_str and (descend is None or descend(entry.path)):
+                        subdirs.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    try:
+                        if entry.stat(follow_symlinks=False).st_mtime > last_sweep:
                             return True
-                    elif entry.is_file(follow_symlinks=False):
-                        try:
-                            if entry.stat().st_mtime > last_sweep:
-                                return True
-                        except OSError:
-                            continue
-        except OSError:
-            pass
-        return False
-
-    return _scan(root)
+                    except OSError:
+                        continue
+    except OSError:
+        pass
+    return False
 
 
 class DaemonService:
@@ -89,10 +184,22 @@ class DaemonService:
 
     def __init__(self, root: Path) -> None:
         self._root = root.resolve()
+        # Already resolved, so the change scan can compare plain strings
+        self._root_str = str(self._root)
+        self._lexibrary_abs_str = os.path.join(self._root_str, LEXIBRARY_DIR)
         self._shutdown_event = threading.Event()
         self._observer: object | None = None
         self._sweep: PeriodicSweep | None = None
-        self._last_sweep: float = 0.0
+        self._last_sweep: float = _read_last_sweep(self._root)
+        # Long-lived event loop (on its own thread) shared by the sweeps of
+        # run_watch / run_watchdog; None means each sweep uses asyncio.run
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread: threading.Thread | None = None
+        self._signal_thread: threading.Thread | None = None
+        # What _install_signal_handling replaced, for _restore_signal_handling
+        self._saved_sigmask: set[int | signal.Signals] | None = None
+        self._saved_handlers: dict[signal.Signals, Any] = {}
+        self._signal_waiter_stopping = False
 
     # -- public entry points ------------------------------------------------
 
@@ -105,7 +212,7 @@ class DaemonService:
         config = self._load_config()
         setup_daemon_logging(self._root, config.daemon.log_level)
 
-        if config.daemon.sweep_skip_if_unchanged and not _has_changes(self._root, self._last_sweep):
+        if config.daemon.sweep_skip_if_unchanged and not self._has_changes(config):
             console.print("[dim]No changes detected -- skipping sweep.[/dim]")
             logger.debug("run_once: no changes detected, skipping sweep")
             return
@@ -129,9 +236,8 @@ class DaemonService:
             callback=lambda: self._periodic_callback(config),
         )
 
-        signal.signal(signal.SIGTERM, self._signal_handler)
-        signal.signal(signal.SIGINT, self._signal_handler)
-
+        self._install_signal_handling()
+        self._start_loop()
         self._sweep.start()
         console.print(
             f"[green]Watching[/green] [cyan]{self._root}[/cyan] "
@@ -170,7 +276,7 @@ class DaemonService:
             from watchdog.observers import Observer
 
             from lexibrarian.daemon.debouncer import Debouncer
-            from lexibrarian.daemon.watcher import LexibrarianEventHandler
+            from lexibrarian.daemon.watcher import WATCHED_EVENT_TYPES, LexibrarianEventHandler
         except ImportError as exc:
             msg = (
                 "The 'watchdog' package is required for watchdog mode. "
@@ -183,7 +289,9 @@ class DaemonService:
 
         debouncer = Debouncer(
             delay=config.daemon.debounce_seconds,
-            callback=lambda dirs: self._run_sweep(config),
+            callback=lambda dirs: self._run_sweep(config, changed_dirs=dirs),
+            max_pending=_MAX_PENDING_DIRS,
+            on_overflow=lambda: self._run_sweep(config),
         )
 
         self._sweep = PeriodicSweep(
@@ -196,14 +304,15 @@ class DaemonService:
             ignore_matcher=ignore_matcher,
         )
         observer = Observer()
-        observer.schedule(handler, str(self._root), recursive=True)
+        observer.schedule(
+            handler, str(self._root), recursive=True, event_filter=WATCHED_EVENT_TYPES
+        )
         self._observer = observer
 
         self._write_pid_file()
 
-        signal.signal(signal.SIGTERM, self._signal_handler)
-        signal.signal(signal.SIGINT, self._signal_handler)
-
+        self._install_signal_handling()
+        self._start_loop()
         observer.start()
         self._sweep.start()
 
@@ -234,6 +343,8 @@ class DaemonService:
             if hasattr(observer, "join"):
                 observer.join(timeout=5.0)
 
+        self._stop_loop()
+        self._restore_signal_handling()
         self._remove_pid_file()
         console.print("[yellow]Daemon stopped.[/yellow]")
         logger.info("Daemon stopped.")
@@ -244,37 +355,188 @@ class DaemonService:
         """Load project configuration from the project root."""
         return load_config(project_root=self._root)
 
+    def _start_loop(self) -> None:
+        """Start the event loop thread that later sweeps run on."""
+        if self._loop is not None:
+            return
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=loop.run_forever, name="lexibrarian-loop", daemon=True)
+        thread.start()
+        self._loop = loop
+        self._loop_thread = thread
+
+    def _stop_loop(self) -> None:
+        """Stop and close the sweep event loop, if one is running."""
+        loop, thread = self._loop, self._loop_thread
+        if loop is None:
+            return
+        self._loop = None
+        self._loop_thread = None
+        if loop.is_running():
+            # Cancel a sweep still in flight and let it unwind first; stopping
+            # under it would leave the thread waiting in _run_coroutine hung
+            try:
+                asyncio.run_coroutine_threadsafe(_cancel_pending_tasks(), loop).result(
+                    timeout=_LOOP_CANCEL_TIMEOUT
+                )
+            except TimeoutError:
+                logger.warning("In-flight sweep did not finish cancelling; stopping anyway")
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join(timeout=5.0)
+        if not loop.is_running():
+            # Same cleanup asyncio.run does: finalize async generators and
+            # join the to_thread() workers before closing
+            try:
+                loop.run_until_complete(loop.shutdown_asyncgens())
+                loop.run_until_complete(loop.shutdown_default_executor())
+            finally:
+                loop.close()
+
+    def _run_coroutine(self, coro: Coroutine[Any, Any, _T]) -> _T:
+        """Run *coro* to completion on the shared loop, or a fresh one if none.
+
+        Raises :class:`concurrent.futures.CancelledError` when
+        :meth:`_stop_loop` cancels the coroutine during shutdown.
+        """
+        loop = self._loop
+        if loop is None:
+            return asyncio.run(coro)
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    def _install_signal_handling(self) -> None:
+        """Route SIGTERM/SIGINT to graceful shutdown.
+
+        On POSIX the signals are blocked in the calling thread -- and so in
+        every thread it starts afterwards, which is why this runs before any
+        worker is started -- and a dedicated thread receives them with
+        ``signal.sigwait``.  Shutdown then never runs inside a Python signal
+        handler that may have interrupted a thread holding the shutdown
+        event's lock.  Platforms without ``sigwait`` keep plain handlers.
+        """
+        if not hasattr(signal, "sigwait"):
+            for signum in _SHUTDOWN_SIGNALS:
+                self._saved_handlers[signum] = signal.signal(signum, self._signal_handler)
+            return
+        self._saved_sigmask = signal.pthread_sigmask(signal.SIG_BLOCK, _SHUTDOWN_SIGNALS)
+        self._signal_waiter_stopping = False
+        self._signal_thread = threading.Thread(
+            target=self._wait_for_signal, name="lexibrarian-signals", daemon=True
+        )
+        self._signal_thread.start()
+
+    def _restore_signal_handling(self) -> None:
+        """Undo :meth:`_install_signal_handling`.
+
+        Must run on the thread that installed it, since the signal mask is
+        per-thread.  The sigwait thread is woken with a SIGTERM aimed at it
+        alone, which it swallows, and joined before the mask is restored.
+        """
+        for signum, handler in self._saved_handlers.items():
+            signal.signal(signum, handler)
+        self._saved_handlers.clear()
+
+        thread, self._signal_thread = self._signal_thread, None
+        if thread is not None and thread.ident is not None:
+            self._signal_waiter_stopping = True
+            if thread.is_alive():
+                # The thread may exit on a real signal before this lands
+                with contextlib.suppress(ProcessLookupError):
+                    signal.pthread_kill(thread.ident, signal.SIGTERM)
+            thread.join(timeout=5.0)
+
+        if self._saved_sigmask is not None:
+            signal.pthread_sigmask(signal.SIG_SETMASK, self._saved_sigmask)
+            self._saved_sigmask = None
+
+    def _wait_for_signal(self) -> None:
+        """Block until SIGTERM/SIGINT arrives, then trigger shutdown."""
+        signum = signal.sigwait(_SHUTDOWN_SIGNALS)
+        if self._signal_waiter_stopping:
+            return
+        self._signal_handler(signum, None)
+
     def _signal_handler(self, signum: int, frame: FrameType | None) -> None:
         """Handle SIGTERM/SIGINT by triggering shutdown."""
         logger.info("Received signal %d, shutting down...", signum)
         self._shutdown_event.set()
 
     def _write_pid_file(self) -> None:
-        """Write the current PID to the PID file."""
-        pid_path = self._root / _PID_FILENAME
-        pid_path.write_text(str(os.getpid()), encoding="utf-8")
+        """Write the current PID to the PID file.
+
+        The PID goes to a per-process temp file that is then renamed over the
+        PID file, so a reader (or a second daemon starting concurrently) never
+        sees a truncated or interleaved PID.
+        """
+        pid = os.getpid()
+        pid_path = os.path.join(self._root_str, _PID_FILENAME)
+        tmp_path = f"{pid_path}.{pid}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, str(pid).encode("ascii"))
+        finally:
+            os.close(fd)
+        try:
+            os.replace(tmp_path, pid_path)
+        except OSError:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+            raise
 
     def _remove_pid_file(self) -> None:
         """Remove the PID file, tolerating if already gone."""
-        pid_path = self._root / _PID_FILENAME
-        pid_path.unlink(missing_ok=True)
-
-    def _run_sweep(self, config: LexibraryConfig) -> None:
-        """Execute a single project update sweep via the archivist pipeline."""
-        logger.info("Sweep triggered")
-        try:
-            archivist = ArchivistService(
-                rate_limiter=RateLimiter(),
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(os.path.join(self._root_str, _PID_FILENAME))
+
+    def _make_archivist(self, config: LexibraryConfig) -> ArchivistService:
+        """Build the archivist service (and its rate limiter) for a sweep."""
+        rate_limiter = RateLimiter(
+            requests_per_minute=config.llm.rpm_limit,
+            tokens_per_minute=config.llm.tpm_limit,
+        )
+        if config.llm.response_cache:
+            cached = CachedArchivistService(
+                rate_limiter=rate_limiter,
                 config=config.llm,
+                cache_dir=self._root / LEXIBRARY_DIR / LLM_CACHE_DIRNAME,
             )
-            stats = asyncio.run(
-                update_project(
-                    project_root=self._root,
-                    config=config,
-                    archivist=archivist,
+            cached.prune()
+            return cached
+        return ArchivistService(rate_limiter=rate_limiter, config=config.llm)
+
+    def _run_sweep(
+        self,
+        config: LexibraryConfig,
+        changed_dirs: set[Path] | None = None,
+    ) -> None:
+        """Execute a project update sweep via the archivist pipeline.
+
+        With *changed_dirs* (from the watchdog debouncer) only the files
+        directly inside those directories are updated; ``update_file``
+        refreshes their parent ``.aindex`` files.  Otherwise the whole
+        project is swept.
+        """
+        if changed_dirs is None:
+            logger.info("Sweep triggered")
+        else:
+            logger.info("Incremental update triggered for %d directories", len(changed_dirs))
+        try:
+            archivist = self._make_archivist(config)
+            stats: UpdateStats
+            if changed_dirs is None:
+                stats = self._run_coroutine(
+                    update_project(
+                        project_root=self._root,
+                        config=config,
+                        archivist=archivist,
+                    )
+                )
+                self._last_sweep = _current_time()
+                _write_last_sweep(self._root, self._last_sweep)
+            else:
+                stats = self._run_coroutine(
+                    update_files(_files_in(changed_dirs), self._root, config, archivist)
                 )
-            )
-            self._last_sweep = _current_time()
             logger.info(
                 "Sweep complete: %d scanned, %d updated, %d created, %d unchanged, %d failed",
                 stats.files_scanned,
@@ -283,17 +545,81 @@ class DaemonService:
                 stats.files_unchanged,
                 stats.files_failed,
             )
+        except CancelledError:
+            logger.info("Sweep cancelled by shutdown")
         except Exception:
             logger.exception("Sweep failed")
 
+    def _has_changes(self, config: LexibraryConfig) -> bool:
+        """Check for files changed since the last full sweep.
+
+        Same walk as the module-level :func:`_has_changes`, reusing the root
+        and ``.lexibrary/`` strings resolved at construction instead of
+        resolving them on every tick.
+        """
+        if self._last_sweep == 0.0:
+            return True
+        matcher = create_ignore_matcher(config, self._root)
+        return _scan_parallel(
+            self._root_str, self._lexibrary_abs_str, self._last_sweep, matcher.should_descend
+        )
+
     def _periodic_callback(self, config: LexibraryConfig) -> None:
         """Callback for PeriodicSweep: check for changes then sweep."""
-        if config.daemon.sweep_skip_if_unchanged and not _has_changes(self._root, self._last_sweep):
+        if config.daemon.sweep_skip_if_unchanged and not self._has_changes(config):
             logger.debug("Periodic sweep: no changes detected, skipping")
             return
         self._run_sweep(config)
 
 
+async def _cancel_pending_tasks() -> None:
+    """Cancel every other task on the running loop and wait for them to end."""
+    current = asyncio.current_task()
+    tasks = [task for task in asyncio.all_tasks() if task is not current]
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def _files_in(directories: set[Path]) -> list[Path]:
+    """Return the files directly inside *directories*, sorted.
+
+    Directories that no longer exist contribute nothing; the files the
+    pipeline cannot process are filtered out by ``update_files``.
+    """
+    files: list[Path] = []
+    for directory in directories:
+        try:
+            with os.scandir(directory) as it:
+                files.extend(Path(e.path) for e in it if e.is_file())
+        except OSError:
+            continue
+    return sorted(files)
+
+
+def _read_last_sweep(root: Path) -> float:
+    """Return the persisted last full sweep time, or ``0.0`` if unknown."""
+    try:
+        text = (root / LEXIBRARY_DIR / _LAST_SWEEP_FILENAME).read_text(encoding="utf-8")
+        return float(text.strip())
+    except (OSError, ValueError):
+        return 0.0
+
+
+def _write_last_sweep(root: Path, timestamp: float) -> None:
+    """Persist *timestamp* as the last full sweep time.
+
+    Nothing is written for a project without a ``.lexibrary/`` directory.
+    """
+    lexibrary_dir = root / LEXIBRARY_DIR
+    if not lexibrary_dir.is_dir():
+        return
+    try:
+        atomic_write(lexibrary_dir / _LAST_SWEEP_FILENAME, repr(timestamp))
+    except OSError:
+        logger.warning("Could not record last sweep time in %s", lexibrary_dir)
+
+
 def _current_time() -> float:
     """Return the current time as a float (seconds since epoch).
 
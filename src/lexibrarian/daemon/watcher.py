@@ -3,9 +3,20 @@
 from __future__ import annotations
 
 import logging
-from pathlib import Path
-
-from watchdog.events import FileSystemEvent, FileSystemEventHandler
+import os
+
+from watchdog.events import (
+    EVENT_TYPE_CREATED,
+    EVENT_TYPE_DELETED,
+    EVENT_TYPE_MODIFIED,
+    EVENT_TYPE_MOVED,
+    FileCreatedEvent,
+    FileDeletedEvent,
+    FileModifiedEvent,
+    FileMovedEvent,
+    FileSystemEvent,
+    FileSystemEventHandler,
+)
 
 from lexibrarian.daemon.debouncer import Debouncer
 from lexibrarian.ignore.matcher import IgnoreMatcher
@@ -22,11 +33,27 @@ _INTERNAL_FILES = frozenset(
 )
 
 
+# Events worth re-indexing for.  inotify also reports opens and closes --
+# including every read a sweep itself makes -- so the observer is scheduled
+# with these as its event_filter and drops the rest in the emitter thread,
+# before they are ever queued.
+WATCHED_EVENT_TYPES: list[type[FileSystemEvent]] = [
+    FileCreatedEvent,
+    FileModifiedEvent,
+    FileDeletedEvent,
+    FileMovedEvent,
+]
+_WATCHED_EVENT_NAMES = frozenset(
+    {EVENT_TYPE_CREATED, EVENT_TYPE_MODIFIED, EVENT_TYPE_DELETED, EVENT_TYPE_MOVED}
+)
+
+
 class LexibrarianEventHandler(FileSystemEventHandler):
     """Filters file system events and notifies the debouncer for valid changes.
 
     Ignores:
     - Directory events (only file changes matter)
+    - Opened/closed events (reads, including the sweep's own, change nothing)
     - .aindex files (prevents infinite re-index loops)
     - Internal files (cache, log, PID)
     - Files matching ignore patterns (gitignore + config)
@@ -41,14 +68,23 @@ class LexibrarianEventHandler(FileSystemEventHandler):
         self._debouncer = debouncer
         self._ignore_matcher = ignore_matcher
 
+    def dispatch(self, event: FileSystemEvent) -> None:
+        """Route every event to :meth:`on_any_event`, the only callback used.
+
+        Skips the base class's second lookup of a per-type ``on_*`` method,
+        all of which are no-ops here.
+        """
+        self.on_any_event(event)
+
     def on_any_event(self, event: FileSystemEvent) -> None:
         """Process any file system event, applying filters."""
-        # Ignore directory events
-        if event.is_directory:
+        # Ignore directory events and events that do not change content
+        if event.is_directory or event.event_type not in _WATCHED_EVENT_NAMES:
             return
 
-        src_path = Path(str(event.src_path))
-        name = src_path.name
+        # Plain string operations: atomic saves fire several events per file
+        src_path = os.fsdecode(event.src_path)
+        name = os.path.basename(src_path)
 
         # Ignore .aindex files (prefix match)
         if name.startswith(".aindex"):
@@ -63,6 +99,6 @@ class LexibrarianEventHandler(FileSystemEventHandler):
             return
 
         # Notify debouncer with the parent directory
-        parent = src_path.parent
+        parent = os.path.dirname(src_path)
         logger.debug("File event: %s -> notifying debouncer for %s", event.src_path, parent)
         self._debouncer.notify(parent)
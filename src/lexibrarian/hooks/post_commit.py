@@ -8,24 +8,35 @@ the developer's workflow.
 
 from __future__ import annotations
 
+import contextlib
+import os
 import stat
+import tempfile
 from dataclasses import dataclass
 from pathlib import Path
 
 # Marker used to detect whether the Lexibrarian section is already present
 # in an existing hook script.  Must appear on its own line.
 HOOK_MARKER = "# lexibrarian:post-commit"
+_HOOK_MARKER_BYTES = HOOK_MARKER.encode("utf-8")
 
 # The hook script appended (or written) to .git/hooks/post-commit.
-# Uses git diff-tree to list changed files and passes them to lexictl
-# in the background, redirecting output to .lexibrarian.log.
+# Streams the NUL-delimited list of changed files from git diff-tree into
+# xargs, which runs lexictl in chunks of at most _HOOK_BATCH_SIZE files so
+# large commits never exceed ARG_MAX and names with spaces survive intact.
+# The inner sh turns each file into its own ``--changed-only <file>`` pair
+# and skips lexictl entirely when the commit changed no files.
+# Everything runs in the background, logging to .lexibrarian.log.
+_HOOK_BATCH_SIZE = 256
+
 HOOK_SCRIPT_TEMPLATE = f"""\
 {HOOK_MARKER}
 # — Lexibrarian auto-update (installed by lexictl setup --hooks) —
-CHANGED_FILES=$(git diff-tree --no-commit-id --name-only -r HEAD)
-if [ -n "$CHANGED_FILES" ]; then
-    lexictl update --changed-only $CHANGED_FILES >> .lexibrarian.log 2>&1 &
-fi
+git diff-tree --no-commit-id --name-only -r -z HEAD | xargs -0 -n {_HOOK_BATCH_SIZE} sh -c '
+    [ "$#" -gt 0 ] || exit 0
+    first=$1; shift
+    for f do set -- "$@" --changed-only "$f"; shift; done
+    lexictl update --changed-only "$first" "$@"' lexibrarian-hook >> .lexibrarian.log 2>&1 &
 # — end Lexibrarian —
 """
 
@@ -80,21 +91,25 @@ def install_post_commit_hook(project_root: Path) -> HookInstallResult:
 
     hook_path = hooks_dir / "post-commit"
 
-    if hook_path.exists():
-        existing_content = hook_path.read_text(encoding="utf-8")
+    # Existing hooks are handled as bytes: the marker is found without
+    # decoding, and hooks in any encoding are preserved verbatim
+    try:
+        existing_content: bytes | None = hook_path.read_bytes()
+    except FileNotFoundError:
+        existing_content = None
 
+    if existing_content is not None:
         # Idempotent: already installed
-        if HOOK_MARKER in existing_content:
+        if _HOOK_MARKER_BYTES in existing_content:
             return HookInstallResult(
                 already_installed=True,
                 message="Lexibrarian post-commit hook is already installed.",
             )
 
         # Append to existing hook
-        separator = "" if existing_content.endswith("\n") else "\n"
-        new_content = existing_content + separator + "\n" + HOOK_SCRIPT_TEMPLATE
-        hook_path.write_text(new_content, encoding="utf-8")
-        _ensure_executable(hook_path)
+        separator = b"" if existing_content.endswith(b"\n") else b"\n"
+        new_content = existing_content + separator + b"\n" + HOOK_SCRIPT_TEMPLATE.encode("utf-8")
+        _write_hook(hook_path, new_content)
 
         return HookInstallResult(
             installed=True,
@@ -102,9 +117,7 @@ def install_post_commit_hook(project_root: Path) -> HookInstallResult:
         )
 
     # Create new hook file with shebang
-    new_content = "#!/bin/sh\n\n" + HOOK_SCRIPT_TEMPLATE
-    hook_path.write_text(new_content, encoding="utf-8")
-    _ensure_executable(hook_path)
+    _write_hook(hook_path, ("#!/bin/sh\n\n" + HOOK_SCRIPT_TEMPLATE).encode("utf-8"))
 
     return HookInstallResult(
         installed=True,
@@ -112,7 +125,48 @@ def install_post_commit_hook(project_root: Path) -> HookInstallResult:
     )
 
 
-def _ensure_executable(path: Path) -> None:
-    """Add owner/group/other execute bits to *path*."""
-    current = path.stat().st_mode
-    path.chmod(current | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+_EXEC_BITS = stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH
+
+
+def _write_hook(hook_path: Path, content: bytes) -> None:
+    """Atomically write an executable hook script to *hook_path*.
+
+    The script is written and fsynced to a temporary file beside the hook,
+    made executable (keeping the permissions of any hook it replaces) and
+    moved into place with ``os.replace``, so git never runs a half-written
+    hook.  A symlinked hook (e.g. one managed by a dotfiles or hook-manager
+    repo) is resolved first, so its target is updated and the link kept.
+    The target's directory is then fsynced once to make the rename durable.
+    """
+    target = hook_path.resolve()
+    hooks_dir = target.parent
+    try:
+        mode = stat.S_IMODE(target.stat().st_mode)
+    except FileNotFoundError:
+        mode = 0o644
+
+    with tempfile.NamedTemporaryFile(
+        "wb",
+        dir=hooks_dir,
+        prefix=f".{target.name}.",
+        suffix=".tmp",
+        delete=False,
+    ) as tmp:
+        tmp.write(content)
+        tmp.flush()
+        os.fsync(tmp.fileno())
+    tmp_path = Path(tmp.name)
+    try:
+        tmp_path.chmod(mode | _EXEC_BITS)
+        os.replace(tmp_path, target)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    # Directory fsync is unsupported on some platforms (e.g. Windows)
+    with contextlib.suppress(OSError):
+        dir_fd = os.open(hooks_dir, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
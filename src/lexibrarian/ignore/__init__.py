@@ -34,7 +34,7 @@ def create_ignore_matcher(config: LexibraryConfig, root: Path) -> IgnoreMatcher:
     # Load .gitignore patterns if enabled
     gitignore_specs = []
     if config.ignore.use_gitignore:
-        gitignore_specs = load_gitignore_specs(root)
+        gitignore_specs = load_gitignore_specs(root, exclude=config_spec)
 
     # Load .lexignore patterns (optional — missing file is OK)
     lexignore_patterns: list[str] = []
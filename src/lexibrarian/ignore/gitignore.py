@@ -2,40 +2,84 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 import pathspec
 
+# Never holds .gitignore files that apply to the working tree
+_GIT_DIR = ".git"
+
 
 def load_gitignore_specs(
     root: Path,
-) -> list[tuple[Path, pathspec.PathSpec]]:
+    exclude: pathspec.PathSpec[pathspec.Pattern] | None = None,
+) -> list[tuple[Path, pathspec.PathSpec[pathspec.Pattern]]]:
     """
     Find and parse all .gitignore files in a project tree.
 
+    The tree is walked with ``os.scandir`` and pruned as it goes: ``.git/``
+    is never entered, nor is any directory matched by *exclude* or by a
+    ``.gitignore`` already found above it.  Everything inside such a
+    directory is ignored regardless, so its ``.gitignore`` files could not
+    change the outcome.
+
     Args:
         root: Project root directory to search.
+        exclude: Optional spec (e.g. the config ignore patterns) of
+            directories not to search, matched against root-relative paths.
 
     Returns:
         List of (directory, PathSpec) tuples sorted by depth (root first).
         Each tuple contains the directory containing the .gitignore and its
         parsed PathSpec.
     """
-    gitignore_files: list[tuple[Path, pathspec.PathSpec]] = []
+    gitignore_files: list[tuple[Path, pathspec.PathSpec[pathspec.Pattern]]] = []
 
-    # Find all .gitignore files recursively
-    for gitignore_path in root.rglob(".gitignore"):
-        # Read and parse patterns
+    root_str = str(root)
+    # Each stack entry carries the specs found in the directory's ancestors
+    stack: list[tuple[str, list[pathspec.PathSpec[pathspec.Pattern]]]] = [(root_str, [])]
+    while stack:
+        directory, inherited = stack.pop()
         try:
-            with open(gitignore_path, encoding="utf-8") as f:
-                patterns = f.read().splitlines()
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            continue
+
+        specs = inherited
+        for entry in entries:
+            if entry.name != ".gitignore" or not entry.is_file():
+                continue
+            # Read as bytes and decode only the lines that can hold a pattern;
+            # blank lines and comments are dropped before decoding
+            try:
+                with open(entry.path, "rb") as f:
+                    data = f.read()
+                patterns = [
+                    line.decode("utf-8")
+                    for line in data.splitlines()
+                    if line and not line.startswith(b"#")
+                ]
+            except (OSError, UnicodeDecodeError):
+                # Skip files that can't be read
+                break
 
             # Parse with gitignore pattern style
             spec = pathspec.PathSpec.from_lines("gitignore", patterns)
-            gitignore_files.append((gitignore_path.parent, spec))
-        except (OSError, UnicodeDecodeError):
-            # Skip files that can't be read
-            continue
+            gitignore_files.append((Path(directory), spec))
+            specs = [*inherited, spec]
+            break
+
+        for entry in entries:
+            if entry.name == _GIT_DIR or not entry.is_dir(follow_symlinks=False):
+                continue
+            rel_dir = os.path.relpath(entry.path, root_str).replace(os.sep, "/") + "/"
+            if exclude is not None and exclude.match_file(rel_dir):
+                continue
+            if any(spec.match_file(rel_dir) for spec in specs):
+                continue
+            stack.append((entry.path, specs))
 
     # Sort by directory depth (root first) for hierarchical matching
     gitignore_files.sort(key=lambda x: len(x[0].parts))
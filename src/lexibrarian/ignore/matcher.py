@@ -2,9 +2,55 @@
 
 from __future__ import annotations
 
+import os
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
 from pathlib import Path
 
 import pathspec
+from pathspec.util import normalize_file
+
+# Watchers report the same files over and over; remember this many verdicts
+# (per kind of check) before evicting the least recently used
+_IGNORE_CACHE_SIZE = 8192
+
+
+def _compile_spec(spec: pathspec.PathSpec[pathspec.Pattern]) -> Callable[[str], bool]:
+    """
+    Return a predicate equivalent to ``spec.match_file`` backed by one regex.
+
+    The include patterns are joined into a single alternation, so a path is
+    tested with one ``re.search`` instead of one per pattern.  Specs with
+    negation (``!``) patterns only defer to ``spec.match_file`` when some
+    include pattern matched, since without one the result is always False.
+    Specs whose patterns cannot be merged fall back to ``spec.match_file``.
+    """
+    compiled: list[tuple[bool, re.Pattern[str]]] = []
+    for pattern in spec.patterns:
+        if pattern.include is None:
+            continue
+        regex = getattr(pattern, "regex", None)
+        if not isinstance(regex, re.Pattern):
+            return spec.match_file
+        compiled.append((pattern.include, regex))
+
+    includes = [regex for include, regex in compiled if include]
+    if not includes:
+        return lambda _path: False
+    flags = {regex.flags for _, regex in compiled}
+    if len(flags) > 1:
+        return spec.match_file
+    try:
+        union = re.compile("|".join(f"(?:{r.pattern})" for r in includes), flags.pop())
+    except re.error:
+        return spec.match_file
+
+    search = union.search
+    if len(includes) == len(compiled):
+        return lambda path: search(normalize_file(path)) is not None
+    return lambda path: search(normalize_file(path)) is not None and spec.match_file(path)
 
 
 class IgnoreMatcher:
@@ -33,9 +79,56 @@ class IgnoreMatcher:
             lexignore_patterns: Patterns from .lexignore file (gitignore format).
         """
         self.root = root.resolve()
+        self._root_str = os.path.join(str(self.root), "")
         self.config_spec = config_spec
         self.gitignore_specs = gitignore_specs
+        # Root-relative directory ("" for root) -> matchers of its .gitignore
+        # files, looked up once per ancestor of a path: O(depth) per check
+        self._gitignore_by_dir: dict[str, list[Callable[[str], bool]]] = {}
+        # (resolved directory + separator, matcher) for .gitignore files
+        # outside root, which are picked by a string prefix test instead
+        self._gitignore_outside: list[tuple[str, Callable[[str], bool]]] = []
+        for directory, spec in gitignore_specs:
+            dir_str = os.path.join(str(directory.resolve()), "")
+            if dir_str.startswith(self._root_str):
+                key = dir_str[len(self._root_str) :].rstrip(os.sep)
+                self._gitignore_by_dir.setdefault(key, []).append(_compile_spec(spec))
+            else:
+                self._gitignore_outside.append((dir_str, _compile_spec(spec)))
         self.lexignore_spec = pathspec.PathSpec.from_lines("gitignore", lexignore_patterns or [])
+        self._config_match = _compile_spec(config_spec)
+        self._lexignore_match = _compile_spec(self.lexignore_spec)
+        # Bounded LRU caches keyed on the path string.  Instance-level rather
+        # than functools.lru_cache on the methods, which would hold on to
+        # every matcher; locked because scans call in from worker threads.
+        self._ignored_cache: OrderedDict[str, bool] = OrderedDict()
+        self._descend_cache: OrderedDict[str, bool] = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    def clear_cache(self) -> None:
+        """Forget all cached verdicts, e.g. after the ignore rules change."""
+        with self._cache_lock:
+            self._ignored_cache.clear()
+            self._descend_cache.clear()
+
+    def _cached(
+        self,
+        cache: OrderedDict[str, bool],
+        key: str,
+        compute: Callable[[str], bool],
+    ) -> bool:
+        """Return the verdict for *key* from *cache*, computing it on a miss."""
+        with self._cache_lock:
+            verdict = cache.get(key)
+            if verdict is not None:
+                cache.move_to_end(key)
+                return verdict
+        verdict = compute(key)
+        with self._cache_lock:
+            cache[key] = verdict
+            if len(cache) > _IGNORE_CACHE_SIZE:
+                cache.popitem(last=False)
+        return verdict
 
     def _relative_path(self, path: Path, is_dir: bool = False) -> str:
         """
@@ -48,22 +141,51 @@ class IgnoreMatcher:
         Returns:
             Path relative to root as string.
         """
-        try:
-            abs_path = path.resolve()
-            rel_path = abs_path.relative_to(self.root)
-            path_str = str(rel_path)
-            # Append trailing slash for directories (pathspec requirement)
-            if is_dir and not path_str.endswith("/"):
-                path_str += "/"
-            return path_str
-        except ValueError:
-            # Path is outside root
-            path_str = str(path)
-            if is_dir and not path_str.endswith("/"):
-                path_str += "/"
-            return path_str
-
-    def is_ignored(self, path: Path) -> bool:
+        path_str = self._locate(path)[1]
+        # Append trailing slash for directories (pathspec requirement)
+        if is_dir and not path_str.endswith("/"):
+            path_str += "/"
+        return path_str
+
+    def _locate(self, path: Path | str) -> tuple[str, str]:
+        """
+        Return the absolute and root-relative strings for *path*.
+
+        The absolute string carries a trailing separator so it can be tested
+        against the gitignore directory prefixes.  Paths already under the
+        resolved root are handled with string operations alone; anything
+        else is resolved once.  Paths outside root keep their own string as
+        the relative form.
+        """
+        path_str = os.fspath(path)
+        if path_str.startswith(self._root_str):
+            return os.path.join(path_str, ""), path_str[len(self._root_str) :]
+        abs_str = os.path.join(str(Path(path_str).resolve()), "")
+        if abs_str.startswith(self._root_str):
+            return abs_str, abs_str[len(self._root_str) :].rstrip(os.sep) or "."
+        return abs_str, path_str
+
+    def _gitignore_match(self, abs_str: str, rel_path: str) -> bool:
+        """Check *rel_path* against the specs of .gitignore files above *abs_str*.
+
+        Specs are checked most specific directory first.
+        """
+        if self._gitignore_by_dir and abs_str.startswith(self._root_str):
+            by_dir = self._gitignore_by_dir
+            key = abs_str[len(self._root_str) :].rstrip(os.sep)
+            while True:
+                for match in by_dir.get(key, ()):
+                    if match(rel_path):
+                        return True
+                if not key:
+                    break
+                key = key[: max(key.rfind(os.sep), 0)]
+        for prefix, match in self._gitignore_outside:
+            if abs_str.startswith(prefix) and match(rel_path):
+                return True
+        return False
+
+    def is_ignored(self, path: Path | str) -> bool:
         """
         Check if path should be ignored.
 
@@ -71,36 +193,30 @@ class IgnoreMatcher:
         hierarchical order (most specific directory first).
 
         Args:
-            path: Path to check (absolute or relative).
+            path: Path to check (absolute or relative), as a ``Path`` or a
+                plain string (which skips building a ``Path`` entirely).
 
         Returns:
             True if path matches any ignore pattern.
         """
-        rel_path = self._relative_path(path)
+        return self._cached(self._ignored_cache, os.fspath(path), self._is_ignored)
+
+    def _is_ignored(self, path: Path | str) -> bool:
+        """Uncached implementation of :meth:`is_ignored`."""
+        abs_str, rel_path = self._locate(path)
 
         # Check config patterns first (cheap)
-        if self.config_spec.match_file(rel_path):
+        if self._config_match(rel_path):
             return True
 
-        # Check .gitignore specs in reverse order (most specific first)
-        # This ensures subdirectory .gitignore files take precedence
-        for directory, spec in reversed(self.gitignore_specs):
-            # Only check gitignore if path is under its directory
-            try:
-                abs_path = path.resolve()
-                abs_path.relative_to(directory)
-
-                # Path is under this directory, check its patterns
-                if spec.match_file(rel_path):
-                    return True
-            except ValueError:
-                # Path not under this directory, skip
-                continue
+        # Check .gitignore specs, most specific directory first
+        if self._gitignore_match(abs_str, rel_path):
+            return True
 
         # Check .lexignore patterns
-        return bool(self.lexignore_spec.match_file(rel_path))
+        return self._lexignore_match(rel_path)
 
-    def should_descend(self, directory: Path) -> bool:
+    def should_descend(self, directory: Path | str) -> bool:
         """
         Check if directory should be descended during traversal.
 
@@ -113,22 +229,22 @@ class IgnoreMatcher:
         Returns:
             True if directory should be traversed, False to skip.
         """
-        rel_path = self._relative_path(directory, is_dir=True)
+        return self._cached(self._descend_cache, os.fspath(directory), self._should_descend)
+
+    def _should_descend(self, directory: Path | str) -> bool:
+        """Uncached implementation of :meth:`should_descend`."""
+        abs_str, rel_path = self._locate(directory)
+        # Append trailing slash for directories (pathspec requirement)
+        if not rel_path.endswith("/"):
+            rel_path += "/"
 
         # Check config patterns first (cheap)
-        if self.config_spec.match_file(rel_path):
+        if self._config_match(rel_path):
             return False
 
         # Check .gitignore specs
-        for directory_path, spec in reversed(self.gitignore_specs):
-            try:
-                abs_path = directory.resolve()
-                abs_path.relative_to(directory_path)
-
-                if spec.match_file(rel_path):
-                    return False
-            except ValueError:
-                continue
+        if self._gitignore_match(abs_str, rel_path):
+            return False
 
         # Check .lexignore patterns
-        return not self.lexignore_spec.match_file(rel_path)
+        return not self._lexignore_match(rel_path)
@@ -2,7 +2,12 @@
 
 from __future__ import annotations
 
+import hashlib
+import os
+from collections.abc import Mapping
+from collections.abc import Set as AbstractSet
 from datetime import UTC, datetime
+from functools import lru_cache
 from pathlib import Path
 
 from lexibrarian.artifacts.aindex import AIndexEntry, AIndexFile
@@ -10,31 +15,62 @@ from lexibrarian.artifacts.aindex_parser import parse_aindex
 from lexibrarian.artifacts.design_file import StalenessMetadata
 from lexibrarian.artifacts.design_file_parser import parse_design_file_frontmatter
 from lexibrarian.ignore.matcher import IgnoreMatcher
-from lexibrarian.utils.hashing import hash_string
 from lexibrarian.utils.languages import EXTENSION_MAP
 from lexibrarian.utils.paths import mirror_path
 
 _GENERATOR_ID = "lexibrarian-v2"
 
+_LINE_COUNT_CHUNK = 1 << 16
 
-def _get_structural_description(file_path: Path, binary_extensions: set[str]) -> str:
-    """Return a structural description string for a file entry."""
-    ext = file_path.suffix.lower()
+_DIR_HASH_BATCH = 1024
+
+
+@lru_cache(maxsize=256)
+def _describe_extension(ext: str, binary_extensions: frozenset[str]) -> tuple[str, bool]:
+    """Return the description for files with *ext* and whether it needs a line count.
+
+    A description that needs a line count is a template with one ``{}`` field.
+    """
     if ext in binary_extensions:
-        return f"Binary file ({ext})"
+        return f"Binary file ({ext})", False
     language = EXTENSION_MAP.get(ext)
     if language is None:
-        return "Unknown file type"
+        return "Unknown file type", False
+    return f"{language} source ({{}} lines)", True
+
+
+def _get_structural_description(file_path: Path, binary_extensions: frozenset[str]) -> str:
+    """Return a structural description string for a file entry."""
+    description, counts_lines = _describe_extension(file_path.suffix.lower(), binary_extensions)
+    if not counts_lines:
+        return description
     try:
-        line_count = len(file_path.read_text(encoding="utf-8", errors="replace").splitlines())
+        line_count = _count_lines(file_path)
     except OSError:
         line_count = 0
-    return f"{language} source ({line_count} lines)"
+    return description.format(line_count)
+
+
+def _count_lines(file_path: Path) -> int:
+    """Count the lines in *file_path* without decoding it.
+
+    Counts newline bytes chunk by chunk, plus one for a final unterminated
+    line, so memory use stays constant however large the file is.
+    """
+    count = 0
+    last = b""
+    with open(file_path, "rb", buffering=0) as f:
+        while chunk := f.read(_LINE_COUNT_CHUNK):
+            count += chunk.count(b"\n")
+            last = chunk
+    if last and not last.endswith(b"\n"):
+        count += 1
+    return count
 
 
 def _get_file_description(
     file_path: Path,
-    binary_extensions: set[str],
+    binary_extensions: frozenset[str],
     project_root: Path,
 ) -> str:
     """Return a description for a file entry.
@@ -51,14 +87,22 @@ def _get_file_description(
     return _get_structural_description(file_path, binary_extensions)
 
 
-def _get_dir_description(subdir: Path, project_root: Path) -> str:
+def _get_dir_description(
+    subdir: Path,
+    project_root: Path,
+    aindex_cache: Mapping[Path, AIndexFile] | None = None,
+) -> str:
     """Return a description for a subdirectory entry.
 
     Uses entry counts from its child .aindex in the .lexibrary mirror tree
-    if available; otherwise falls back to a direct filesystem count.
+    if available; otherwise falls back to a direct filesystem count.  A
+    child .aindex found in *aindex_cache* (keyed by mirror path) is used
+    without re-reading it from disk.
     """
     mirror_aindex = project_root / ".lexibrary" / subdir.relative_to(project_root) / ".aindex"
-    child_aindex = parse_aindex(mirror_aindex)
+    child_aindex = aindex_cache.get(mirror_aindex) if aindex_cache is not None else None
+    if child_aindex is None:
+        child_aindex = parse_aindex(mirror_aindex)
     if child_aindex is not None:
         file_count = sum(1 for e in child_aindex.entries if e.entry_type == "file")
         dir_count = sum(1 for e in child_aindex.entries if e.entry_type == "dir")
@@ -67,7 +111,7 @@ def _get_dir_description(subdir: Path, project_root: Path) -> str:
         return f"Contains {file_count} files"
     # Fallback: count direct children in the filesystem
     try:
-        count = sum(1 for _ in subdir.iterdir())
+        count = len(os.listdir(subdir))
     except OSError:
         count = 0
     return f"Contains {count} items"
@@ -94,24 +138,47 @@ def _generate_billboard(entries: list[AIndexEntry]) -> str:
 
 
 def _compute_dir_hash(names: list[str]) -> str:
-    """SHA-256 of the sorted directory listing."""
-    content = "\n".join(sorted(names))
-    return hash_string(content)
+    """SHA-256 of the sorted directory listing.
+
+    Equal to hashing ``"\n".join(sorted(names))``, but fed to the digest a
+    block of names at a time so a huge listing is never joined and encoded
+    whole.  Blocks rather than single names: per-call overhead would make
+    one ``update`` per name several times slower than the join.
+    """
+    ordered = sorted(names)
+    digest = hashlib.sha256()
+    for start in range(0, len(ordered), _DIR_HASH_BATCH):
+        if start:
+            digest.update(b"\n")
+        block = ordered[start : start + _DIR_HASH_BATCH]
+        digest.update("\n".join(block).encode("utf-8"))
+    return digest.hexdigest()
 
 
 def generate_aindex(
     directory: Path,
     project_root: Path,
     ignore_matcher: IgnoreMatcher,
-    binary_extensions: set[str],
+    binary_extensions: AbstractSet[str],
+    *,
+    aindex_cache: Mapping[Path, AIndexFile] | None = None,
 ) -> AIndexFile:
     """Generate an AIndexFile model for *directory* without any I/O side effects.
 
     Lists directory contents, filters ignored entries, builds structural
     descriptions for files and subdirs, and computes a staleness hash.
+    Subdirectory .aindex models in *aindex_cache* are used in place of
+    parsing the mirror files.
     """
+    # Hashable, so extension lookups can be memoized; a no-op for the
+    # frozenset the config already holds
+    binary_extensions = frozenset(binary_extensions)
+
+    # DirEntry caches the file type from the directory listing, so regular
+    # entries need no per-child stat; symlinks are still followed.
     try:
-        children = sorted(directory.iterdir(), key=lambda p: p.name.lower())
+        with os.scandir(directory) as it:
+            children = sorted(it, key=lambda e: e.name.lower())
     except OSError:
         children = []
 
@@ -119,14 +186,21 @@ def generate_aindex(
     all_names: list[str] = []
 
     for child in children:
-        if child.is_dir():
-            if not ignore_matcher.should_descend(child):
+        try:
+            is_dir = child.is_dir()
+            is_file = not is_dir and child.is_file()
+        except OSError:
+            is_dir = is_file = False
+        if is_dir:
+            if not ignore_matcher.should_descend(child.path):
                 continue
-        elif ignore_matcher.is_ignored(child):
+        elif ignore_matcher.is_ignored(child.path):
             continue
         all_names.append(child.name)
-        if child.is_file():
-            description = _get_file_description(child, binary_extensions, project_root)
+        if is_file:
+            description = _get_file_description(
+                directory / child.name, binary_extensions, project_root
+            )
             entries.append(
                 AIndexEntry(
                     name=child.name,
@@ -134,8 +208,8 @@ def generate_aindex(
                     description=description,
                 )
             )
-        elif child.is_dir():
-            description = _get_dir_description(child, project_root)
+        elif is_dir:
+            description = _get_dir_description(directory / child.name, project_root, aindex_cache)
             entries.append(
                 AIndexEntry(
                     name=child.name,
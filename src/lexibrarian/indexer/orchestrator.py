@@ -3,18 +3,37 @@
 from __future__ import annotations
 
 import contextlib
-from collections.abc import Callable
+import logging
+import multiprocessing
+import os
+from collections.abc import Callable, Iterator
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
+from functools import partial
+from itertools import groupby
 from pathlib import Path
 
+from lexibrarian.artifacts.aindex import AIndexFile
 from lexibrarian.artifacts.aindex_serializer import serialize_aindex
 from lexibrarian.artifacts.writer import write_artifact
 from lexibrarian.config.schema import LexibraryConfig
-from lexibrarian.ignore import create_ignore_matcher
+from lexibrarian.ignore import IgnoreMatcher, create_ignore_matcher
 from lexibrarian.indexer.generator import generate_aindex
 
+logger = logging.getLogger(__name__)
+
 _LEXIBRARY_DIR = ".lexibrary"
 
+# Directory listing is I/O-bound, so use more threads than cores
+_MAX_DISCOVERY_THREADS = min(32, (os.cpu_count() or 1) * 4)
+
+_MAX_INDEX_WORKERS = os.cpu_count() or 1
+
+# Depth levels smaller than this are indexed in-process; worker start-up
+# would cost more than it saves
+_MIN_PARALLEL_DIRS = 16
+
 
 @dataclass
 class IndexStats:
@@ -29,6 +48,8 @@ def index_directory(
     directory: Path,
     project_root: Path,
     config: LexibraryConfig,
+    *,
+    aindex_cache: dict[Path, AIndexFile] | None = None,
 ) -> Path:
     """Generate and write a .aindex file for a single directory.
 
@@ -40,23 +61,119 @@ def index_directory(
         directory: The directory to index.
         project_root: The project root (contains .lexibrary/).
         config: Project configuration.
+        aindex_cache: Optional map of mirror path to AIndexFile.  Child
+            models found here are not re-parsed from disk, and the model
+            written for *directory* is stored in it.
 
     Returns:
         Path to the written .aindex file.
     """
     ignore_matcher = create_ignore_matcher(config, project_root)
-    binary_extensions = set(config.crawl.binary_extensions)
+    binary_extensions = config.crawl.binary_extensions
 
-    aindex_model = generate_aindex(directory, project_root, ignore_matcher, binary_extensions)
+    aindex_model = generate_aindex(
+        directory, project_root, ignore_matcher, binary_extensions, aindex_cache=aindex_cache
+    )
     markdown = serialize_aindex(aindex_model)
 
-    relative_dir = directory.relative_to(project_root)
-    output_path = project_root / _LEXIBRARY_DIR / relative_dir / ".aindex"
+    output_path = _aindex_path(directory, project_root)
 
     write_artifact(output_path, markdown)
+    if aindex_cache is not None:
+        aindex_cache[output_path] = aindex_model
     return output_path
 
 
+def _aindex_path(directory: Path, project_root: Path) -> Path:
+    """Return the .lexibrary mirror path of the .aindex for *directory*."""
+    return project_root / _LEXIBRARY_DIR / directory.relative_to(project_root) / ".aindex"
+
+
+def _same_directory(entry: os.DirEntry[str], dir_id: tuple[int, int]) -> bool:
+    """Return whether *entry* is the directory identified by (st_dev, st_ino).
+
+    A plain entry's inode comes free with the directory listing, so it is only
+    stat-ed when the inode already matches; symlinks are always followed.
+    """
+    if not entry.is_symlink() and entry.inode() != dir_id[1]:
+        return False
+    st = entry.stat()
+    return (st.st_dev, st.st_ino) == dir_id
+
+
+def _index_one(
+    directory: Path,
+    child_aindexes: dict[Path, AIndexFile],
+    project_root: Path,
+    config: LexibraryConfig,
+) -> tuple[int, AIndexFile] | None:
+    """Index *directory* given the models of its already-indexed children.
+
+    Returns how many files the directory holds together with its own model,
+    or None on failure.  Runs in a pool worker, so failures are reported
+    rather than raised.
+    """
+    aindex_cache = dict(child_aindexes)
+    try:
+        output_path = index_directory(directory, project_root, config, aindex_cache=aindex_cache)
+    except Exception:
+        logger.exception("Failed to index %s", directory)
+        return None
+    files_found = 0
+    with contextlib.suppress(OSError), os.scandir(directory) as it:
+        files_found = sum(1 for child in it if child.is_file())
+    return files_found, aindex_cache[output_path]
+
+
+def _make_index_executor() -> ProcessPoolExecutor | None:
+    """Return a process pool for indexing, or None where one cannot start."""
+    # Never fork: the caller may be running other threads
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    try:
+        return ProcessPoolExecutor(
+            max_workers=_MAX_INDEX_WORKERS, mp_context=multiprocessing.get_context(method)
+        )
+    except (OSError, NotImplementedError, ValueError):
+        # e.g. no working sem_open on this platform
+        return None
+
+
+def _index_chunksize(count: int) -> int:
+    """Return a map() chunksize spreading *count* directories over the workers."""
+    return max(1, count // (_MAX_INDEX_WORKERS * 4))
+
+
+def _list_subdirectories(
+    directory: Path,
+    ignore_matcher: IgnoreMatcher,
+    lexibrary_id: tuple[int, int] | None,
+) -> list[Path]:
+    """Return the subdirectories of *directory* that discovery should enter.
+
+    Skips .lexibrary/ (or a symlink to it) and anything the IgnoreMatcher
+    says should not be descended into.  An unreadable directory has none.
+    """
+    try:
+        with os.scandir(directory) as it:
+            children = sorted(it, key=lambda e: e.name.lower())
+    except OSError:
+        return []
+    subdirs: list[Path] = []
+    for child in children:
+        try:
+            if not child.is_dir():
+                continue
+            # Skip .lexibrary/ itself (or a symlink to it)
+            if lexibrary_id is not None and _same_directory(child, lexibrary_id):
+                continue
+        except OSError:
+            continue
+        if not ignore_matcher.should_descend(child.path):
+            continue
+        subdirs.append(directory / child.name)
+    return subdirs
+
+
 def _discover_directories_bottom_up(
     root: Path,
     project_root: Path,
@@ -66,32 +183,37 @@ def _discover_directories_bottom_up(
 
     Skips the .lexibrary/ directory and any directories the IgnoreMatcher
     says should not be descended into.
+
+    Directories are listed on a thread pool: ``scandir`` and ``stat`` spend
+    most of their time in the kernel with the GIL released, so sibling
+    listings overlap that latency.  The result is sorted deepest-first, with
+    paths of equal depth in name order, so it does not depend on which
+    listing finished first.
     """
     ignore_matcher = create_ignore_matcher(config, project_root)
-    lexibrary_path = (project_root / _LEXIBRARY_DIR).resolve()
-
-    directories: list[Path] = []
-    stack: list[Path] = [root]
+    try:
+        lexibrary_stat = os.stat(project_root / _LEXIBRARY_DIR)
+    except OSError:
+        lexibrary_id = None
+    else:
+        lexibrary_id = (lexibrary_stat.st_dev, lexibrary_stat.st_ino)
 
-    while stack:
-        current = stack.pop()
-        directories.append(current)
-        try:
-            children = sorted(current.iterdir(), key=lambda p: p.name.lower())
-        except OSError:
-            continue
-        for child in children:
-            if not child.is_dir():
-                continue
-            # Skip .lexibrary/ itself
-            if child.resolve() == lexibrary_path:
-                continue
-            if not ignore_matcher.should_descend(child):
-                continue
-            stack.append(child)
+    directories: list[Path] = [root]
+    with ThreadPoolExecutor(
+        max_workers=_MAX_DISCOVERY_THREADS,
+        thread_name_prefix="lexibrarian-discover",
+    ) as executor:
+        pending = {executor.submit(_list_subdirectories, root, ignore_matcher, lexibrary_id)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                for subdir in future.result():
+                    directories.append(subdir)
+                    pending.add(
+                        executor.submit(_list_subdirectories, subdir, ignore_matcher, lexibrary_id)
+                    )
 
-    # Reverse so deepest directories come first (bottom-up)
-    directories.reverse()
+    directories.sort(key=lambda p: (-len(p.parts), [part.lower() for part in p.parts]))
     return directories
 
 
@@ -107,6 +229,12 @@ def index_recursive(
     Discovers directories deepest-first so child .aindex files exist before
     their parents are processed. The .lexibrary/ directory is always excluded.
 
+    Directories at the same depth only read the .aindex files of deeper ones,
+    so a level of at least ``_MIN_PARALLEL_DIRS`` directories is indexed on a
+    process pool.  Results are consumed in order, so *progress_callback* is
+    still called from this process, once per directory, in discovery order.
+    If the pool breaks, the rest of the run is indexed in-process.
+
     Args:
         directory: Root directory to start recursive indexing from.
         project_root: The project root (contains .lexibrary/).
@@ -120,18 +248,71 @@ def index_recursive(
     dirs = _discover_directories_bottom_up(directory, project_root, config)
     total = len(dirs)
     stats = IndexStats()
+    index_one = partial(_index_one, project_root=project_root, config=config)
+
+    # Models written this run, held until their parent has been indexed so
+    # it need not re-parse them from disk
+    aindex_cache: dict[Path, AIndexFile] = {}
+    subdirs: dict[Path, list[Path]] = {}
+    for dir_path in dirs:
+        subdirs.setdefault(dir_path.parent, []).append(dir_path)
 
-    for i, dir_path in enumerate(dirs, start=1):
+    def child_aindexes(dir_path: Path) -> dict[Path, AIndexFile]:
+        children: dict[Path, AIndexFile] = {}
+        for subdir in subdirs.get(dir_path, ()):
+            mirror = _aindex_path(subdir, project_root)
+            model = aindex_cache.pop(mirror, None)
+            if model is not None:
+                children[mirror] = model
+        return children
+
+    done = 0
+    executor: ProcessPoolExecutor | None = None
+    pool_broken = False
+
+    def index_level(
+        level: list[Path], level_children: list[dict[Path, AIndexFile]]
+    ) -> Iterator[tuple[int, AIndexFile] | None]:
+        nonlocal pool_broken
+        if executor is None or pool_broken or len(level) < _MIN_PARALLEL_DIRS:
+            yield from map(index_one, level, level_children)
+            return
+        indexed = 0
         try:
-            index_directory(dir_path, project_root, config)
-            stats.directories_indexed += 1
-            # Count files in the directory for stats
-            with contextlib.suppress(OSError):
-                stats.files_found += sum(1 for child in dir_path.iterdir() if child.is_file())
-        except Exception:
-            stats.errors += 1
-
-        if progress_callback is not None:
-            progress_callback(i, total, dir_path.name)
+            for result in executor.map(
+                index_one, level, level_children, chunksize=_index_chunksize(len(level))
+            ):
+                yield result
+                indexed += 1
+        except BrokenProcessPool:
+            # A worker died (e.g. killed for memory); finish in this process
+            logger.warning(
+                "Index worker pool broke; indexing the remaining %d directories in-process",
+                len(level) - indexed,
+            )
+            pool_broken = True
+            yield from map(index_one, level[indexed:], level_children[indexed:])
+
+    try:
+        # Discovery returns dirs grouped by depth, deepest first
+        for _depth, group in groupby(dirs, key=lambda p: len(p.parts)):
+            level = list(group)
+            level_children = [child_aindexes(dir_path) for dir_path in level]
+            if executor is None and len(level) >= _MIN_PARALLEL_DIRS and _MAX_INDEX_WORKERS > 1:
+                executor = _make_index_executor()
+            for dir_path, result in zip(level, index_level(level, level_children), strict=True):
+                done += 1
+                if result is None:
+                    stats.errors += 1
+                else:
+                    files_found, model = result
+                    stats.directories_indexed += 1
+                    stats.files_found += files_found
+                    aindex_cache[_aindex_path(dir_path, project_root)] = model
+                if progress_callback is not None:
+                    progress_callback(done, total, dir_path.name)
+    finally:
+        if executor is not None:
+            executor.shutdown()
 
     return stats
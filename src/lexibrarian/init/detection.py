@@ -60,6 +60,8 @@ _AGENT_RULES_FILES: dict[str, list[str]] = {
     "codex": ["AGENTS.md"],
 }
 
+_RULES_MARKER = b"<!-- lexibrarian:"
+
 # ---------------------------------------------------------------------------
 # Ignore pattern suggestions per project type
 # ---------------------------------------------------------------------------
@@ -119,11 +121,32 @@ def detect_agent_environments(project_root: Path) -> list[str]:
 
     Returns a deduplicated list of environment names (e.g. ``["claude", "cursor"]``).
     """
+    # One listing of the root answers every marker, instead of a stat each
+    try:
+        with os.scandir(project_root) as it:
+            children = {entry.name: entry for entry in it}
+    except OSError:
+        return []
+    folded_names = {name.casefold() for name in children}
+
     found: list[str] = []
     for env_name, markers in _AGENT_MARKERS:
         for marker in markers:
-            path = project_root / marker
-            exists = path.is_dir() if marker.endswith("/") else path.is_file()
+            name = marker.rstrip("/")
+            want_dir = marker.endswith("/")
+            entry = children.get(name)
+            try:
+                if entry is not None:
+                    exists = entry.is_dir() if want_dir else entry.is_file()
+                elif name.casefold() in folded_names:
+                    # A case variant such as claude.md still names the marker
+                    # on a case-insensitive filesystem, so let the OS decide
+                    path = project_root / name
+                    exists = path.is_dir() if want_dir else path.is_file()
+                else:
+                    continue
+            except OSError:
+                exists = False
             if exists and env_name not in found:
                 found.append(env_name)
                 break  # no need to check remaining markers for this env
@@ -141,13 +164,16 @@ def check_existing_agent_rules(
     candidates = _AGENT_RULES_FILES.get(environment, [])
     for rel in candidates:
         path = project_root / rel
-        if path.is_file():
-            try:
-                content = path.read_text(encoding="utf-8")
-                if "<!-- lexibrarian:" in content:
-                    return str(path)
-            except Exception:  # noqa: BLE001
-                pass
+        # Search the raw bytes: the marker is ASCII, so nothing needs decoding.
+        # Missing files and directories (e.g. a .cursor/rules/ folder) raise
+        # OSError and are skipped.
+        try:
+            with open(path, "rb") as f:
+                content = f.read()
+        except OSError:
+            continue
+        if _RULES_MARKER in content:
+            return str(path)
     return None
 
 
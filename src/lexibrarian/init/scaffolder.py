@@ -16,8 +16,15 @@ if TYPE_CHECKING:
 
 LEXIBRARY_DIR = ".lexibrary"
 
-# Patterns for daemon runtime files that should be gitignored.
-_DAEMON_GITIGNORE_PATTERNS = [".lexibrarian.log", ".lexibrarian.pid"]
+# Patterns for daemon and CLI runtime files that should be gitignored.
+# ``.lexibrary/.*.json`` covers local caches such as ``.status_cache.json``;
+# ``.lexibrary/.llm_cache/`` holds cached archivist LLM responses.
+_DAEMON_GITIGNORE_PATTERNS = [
+    ".lexibrarian.log",
+    ".lexibrarian.pid",
+    ".lexibrary/.*.json",
+    ".lexibrary/.llm_cache/",
+]
 
 LEXIGNORE_HEADER = """\
 # .lexignore — Lexibrarian-specific ignore patterns
@@ -106,10 +113,11 @@ def _generate_config_yaml(answers: WizardAnswers) -> str:
 
 
 def _ensure_daemon_files_gitignored(project_root: Path) -> bool:
-    """Ensure daemon runtime files are listed in ``.gitignore``.
+    """Ensure daemon and CLI runtime files are listed in ``.gitignore``.
 
-    Appends ``.lexibrarian.log`` and ``.lexibrarian.pid`` to the project's
-    ``.gitignore`` if they are not already present.  Creates the
+    Appends ``.lexibrarian.log``, ``.lexibrarian.pid`` and the
+    ``.lexibrary/`` cache patterns to the project's ``.gitignore``
+    if they are not already present.  Creates the
     ``.gitignore`` file if it does not exist.
 
     Args:
@@ -26,5 +26,8 @@ def create_llm_service(config: LLMConfig) -> LLMService:
         api_key = os.environ.get(config.api_key_env, "")
         os.environ.setdefault(env_key, api_key)
 
-    rate_limiter = RateLimiter()
+    rate_limiter = RateLimiter(
+        requests_per_minute=config.rpm_limit,
+        tokens_per_minute=config.tpm_limit,
+    )
     return LLMService(rate_limiter=rate_limiter)
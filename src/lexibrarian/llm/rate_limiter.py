@@ -10,19 +10,59 @@ class RateLimiter:
     """Token-bucket rate limiter with async support.
 
     Enforces a configurable requests-per-minute limit by ensuring a minimum
-    interval between successive calls. Uses asyncio.Lock for serialization.
+    interval between successive calls. When ``tokens_per_minute`` is set, a
+    second bucket holding up to one minute of token budget is refilled in
+    proportion to elapsed time, and each call waits until the bucket covers
+    its estimated token cost. The longer of the two waits wins. Uses
+    asyncio.Lock for serialization.
     """
 
-    def __init__(self, requests_per_minute: int = 50) -> None:
+    def __init__(
+        self,
+        requests_per_minute: int = 50,
+        tokens_per_minute: int | None = None,
+    ) -> None:
         self._interval = 60.0 / requests_per_minute
         self._last_call: float = 0.0
         self._lock = asyncio.Lock()
+        self._token_capacity: float | None = float(tokens_per_minute) if tokens_per_minute else None
+        self._token_rate = (self._token_capacity or 0.0) / 60.0
+        self._tokens: float = self._token_capacity or 0.0
+        self._last_refill: float = time.monotonic()
 
-    async def acquire(self) -> None:
-        """Wait until the next request slot is available."""
+    def _refill(self, now: float) -> None:
+        """Credit the token bucket for the time elapsed up to *now*."""
+        if self._token_capacity is None:
+            return
+        self._tokens = min(
+            self._token_capacity,
+            self._tokens + (now - self._last_refill) * self._token_rate,
+        )
+        self._last_refill = now
+
+    def _token_wait(self, tokens: int, now: float) -> float:
+        """Refill the token bucket to *now* and return the wait *tokens* needs."""
+        if self._token_capacity is None or tokens <= 0:
+            return 0.0
+        self._refill(now)
+        # A single call larger than the whole bucket only waits for a full bucket
+        needed = min(float(tokens), self._token_capacity)
+        if self._tokens >= needed:
+            return 0.0
+        return (needed - self._tokens) / self._token_rate
+
+    async def acquire(self, tokens: int = 0) -> None:
+        """Wait until the next request slot, and *tokens* of budget, are available."""
         async with self._lock:
             now = time.monotonic()
             elapsed = now - self._last_call
+            wait = 0.0
             if self._last_call > 0.0 and elapsed < self._interval:
-                await asyncio.sleep(self._interval - elapsed)
+                wait = self._interval - elapsed
+            wait = max(wait, self._token_wait(tokens, now))
+            if wait > 0.0:
+                await asyncio.sleep(wait)
+            if self._token_capacity is not None and tokens > 0:
+                self._refill(time.monotonic())
+                self._tokens -= min(float(tokens), self._token_capacity)
             self._last_call = time.monotonic()
@@ -26,6 +26,10 @@ class AnthropicCounter:
         )
         return response.input_tokens
 
+    def count_batch(self, texts: list[str]) -> list[int]:
+        """Count tokens for several texts (one API call each)."""
+        return [self.count(text) for text in texts]
+
     def count_file(self, path: Path) -> int:
         """Count tokens in a file."""
         text = path.read_text(encoding="utf-8", errors="replace")
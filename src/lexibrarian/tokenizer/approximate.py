@@ -18,6 +18,10 @@ class ApproximateCounter:
         """Count tokens by dividing character count by 4."""
         return max(1, int(len(text) / CHARS_PER_TOKEN))
 
+    def count_batch(self, texts: list[str]) -> list[int]:
+        """Count tokens for several texts."""
+        return [self.count(text) for text in texts]
+
     def count_file(self, path: Path) -> int:
         """Count tokens in a file."""
         text = path.read_text(encoding="utf-8", errors="replace")
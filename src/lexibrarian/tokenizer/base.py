@@ -30,6 +30,20 @@ class TokenCounter(Protocol):
         """
         ...
 
+    def count_batch(self, texts: list[str]) -> list[int]:
+        """Count tokens in several texts at once.
+
+        Backends with a native batch API use it to amortise per-call
+        overhead; others count each text in turn.
+
+        Args:
+            texts: The texts to count tokens for
+
+        Returns:
+            One non-negative token count per text, in order
+        """
+        ...
+
     def count_file(self, path: Path) -> int:
         """Count tokens in a file.
 
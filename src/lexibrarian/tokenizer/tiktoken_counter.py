@@ -22,6 +22,10 @@ class TiktokenCounter:
         """Count tokens using BPE encoding."""
         return len(self._encoding.encode(text))
 
+    def count_batch(self, texts: list[str]) -> list[int]:
+        """Count tokens for several texts, encoding them on tiktoken's thread pool."""
+        return [len(tokens) for tokens in self._encoding.encode_batch(texts)]
+
     def count_file(self, path: Path) -> int:
         """Count tokens in a file."""
         text = path.read_text(encoding="utf-8", errors="replace")
@@ -13,7 +13,7 @@ from pathlib import Path
 
 def atomic_write(
     target: Path,
-    content: str,
+    content: str | bytes,
     encoding: str = "utf-8",
 ) -> None:
     """Write content to target path atomically.
@@ -25,13 +25,14 @@ def atomic_write(
 
     Args:
         target: Destination file path.
-        content: Text content to write.
-        encoding: Text encoding (default ``"utf-8"``).
+        content: Text content to write, or bytes to write as-is.
+        encoding: Text encoding for str content (default ``"utf-8"``).
 
     Raises:
         OSError: On write failure (original file unchanged, temp cleaned up).
     """
     target = Path(target)
+    data = content if isinstance(content, bytes) else content.encode(encoding)
     target.parent.mkdir(parents=True, exist_ok=True)
 
     fd = -1
@@ -41,7 +42,7 @@ def atomic_write(
             suffix=".tmp",
             dir=target.parent,
         )
-        os.write(fd, content.encode(encoding))
+        os.write(fd, data)
         os.close(fd)
         fd = -1  # mark as closed so finally doesn't double-close
         os.replace(tmp_path, target)
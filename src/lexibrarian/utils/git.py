@@ -0,0 +1,82 @@
+"""Thin wrappers around the ``git`` CLI for change discovery.
+
+Every helper returns ``None`` when git is unavailable, the directory is not
+inside a work tree, or the command fails, so callers can fall back to a
+full filesystem walk.
+"""
+
+from __future__ import annotations
+
+import logging
+import subprocess
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+_GIT_TIMEOUT_SECONDS = 30
+
+
+def _run_git(project_root: Path, *args: str) -> str | None:
+    """Run ``git -C <project_root> <args>`` and return stdout, or ``None`` on failure."""
+    try:
+        proc = subprocess.run(
+            ["git", "-C", str(project_root), *args],
+            capture_output=True,
+            text=True,
+            encoding="utf-8",
+            errors="surrogateescape",
+            timeout=_GIT_TIMEOUT_SECONDS,
+            check=False,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if proc.returncode != 0:
+        logger.debug("git %s failed: %s", " ".join(args), proc.stderr.strip())
+        return None
+    return proc.stdout
+
+
+def _split_z(output: str) -> list[str]:
+    """Split NUL-delimited git output into non-empty entries."""
+    return [entry for entry in output.split("\0") if entry]
+
+
+def head_commit(project_root: Path) -> str | None:
+    """Return the full SHA of ``HEAD``, or ``None`` if unavailable."""
+    out = _run_git(project_root, "rev-parse", "--verify", "--quiet", "HEAD")
+    if out is None:
+        return None
+    sha = out.strip()
+    return sha or None
+
+
+def dirty_files(project_root: Path) -> list[str] | None:
+    """Return tracked files that differ from ``HEAD`` in the work tree or index.
+
+    Paths are relative to *project_root* and limited to files beneath it.
+    """
+    out = _run_git(project_root, "diff", "HEAD", "--name-only", "--no-renames", "--relative", "-z")
+    return None if out is None else _split_z(out)
+
+
+def changed_files_since(project_root: Path, commit: str) -> list[str] | None:
+    """Return files changed since *commit*, including uncommitted and untracked files.
+
+    Combines ``git diff <commit>`` (committed plus working-tree changes to
+    tracked files) with ``git ls-files --others --exclude-standard``
+    (untracked, non-ignored files).  Deleted paths are included; callers
+    are expected to skip files that no longer exist.  Paths are relative to
+    *project_root*, limited to files beneath it, sorted and de-duplicated.
+
+    Returns ``None`` if either git command fails (for example when *commit*
+    no longer exists after a rebase).
+    """
+    diff_out = _run_git(
+        project_root, "diff", commit, "--name-only", "--no-renames", "--relative", "-z"
+    )
+    if diff_out is None:
+        return None
+    untracked_out = _run_git(project_root, "ls-files", "--others", "--exclude-standard", "-z")
+    if untracked_out is None:
+        return None
+    return sorted(set(_split_z(diff_out)) | set(_split_z(untracked_out)))
@@ -0,0 +1,106 @@
+"""Stat-keyed SHA-256 cache with JSON persistence.
+
+Skips re-hashing files whose ``(mtime_ns, size)`` are unchanged since the
+hash was last recorded, so repeated staleness checks cost one ``stat``
+per file instead of reading every byte.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import time
+from pathlib import Path
+
+from lexibrarian.utils.atomic import atomic_write
+from lexibrarian.utils.hashing import hash_file
+
+logger = logging.getLogger(__name__)
+
+_CACHE_VERSION = 1
+
+# Files modified this recently are hashed but not cached: a write landing in
+# the same mtime tick as our read would otherwise go unnoticed ("racy" stat).
+RACY_WINDOW_NS = 2_000_000_000
+
+
+class HashCache:
+    """Persistent ``path -> (mtime_ns, size, sha256)`` cache.
+
+    Keys are caller-chosen strings (typically project-relative paths) so the
+    cache file stays valid if the project directory is moved.
+    """
+
+    def __init__(self, cache_path: Path) -> None:
+        self._cache_path = cache_path
+        self._entries: dict[str, tuple[int, int, str]] = {}
+        self._dirty = False
+
+    def load(self) -> None:
+        """Load cache from disk. No-op if the file doesn't exist."""
+        if not self._cache_path.exists():
+            return
+
+        try:
+            data = json.loads(self._cache_path.read_text(encoding="utf-8"))
+            if data.get("version") != _CACHE_VERSION:
+                msg = f"Unsupported cache version: {data.get('version')}"
+                raise ValueError(msg)
+            self._entries = {
+                key: (int(val[0]), int(val[1]), str(val[2]))
+                for key, val in data.get("files", {}).items()
+            }
+        except (OSError, json.JSONDecodeError, ValueError, TypeError, IndexError, AttributeError):
+            logger.warning("Corrupted hash cache at %s, starting fresh", self._cache_path)
+            self._entries = {}
+
+        self._dirty = False
+
+    def save(self) -> None:
+        """Save cache to disk if dirty."""
+        if not self._dirty:
+            return
+
+        data = {
+            "version": _CACHE_VERSION,
+            "files": {key: list(val) for key, val in self._entries.items()},
+        }
+        try:
+            atomic_write(self._cache_path, json.dumps(data))
+        except OSError:
+            logger.warning("Could not write hash cache to %s", self._cache_path)
+            return
+        self._dirty = False
+
+    def get_hash(self, key: str, path: Path) -> str:
+        """Return the SHA-256 of *path*, reusing the cached digest when possible.
+
+        Args:
+            key: Cache key for the file (e.g. its project-relative path).
+            path: File to stat and, on a cache miss, hash.
+
+        Raises:
+            OSError: If the file cannot be stat'ed or read.
+        """
+        st = os.stat(path)
+        cached = self._entries.get(key)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+
+        digest = hash_file(path)
+        if st.st_mtime_ns < time.time_ns() - RACY_WINDOW_NS:
+            self._entries[key] = (st.st_mtime_ns, st.st_size, digest)
+            self._dirty = True
+        elif cached is not None:
+            del self._entries[key]
+            self._dirty = True
+        return digest
+
+    def prune(self, live_keys: set[str]) -> None:
+        """Drop entries whose key is not in *live_keys*."""
+        stale = [k for k in self._entries if k not in live_keys]
+        for key in stale:
+            del self._entries[key]
+        if stale:
+            self._dirty = True
@@ -0,0 +1,74 @@
+"""Persistent library state stored in ``.lexibrary/.state.json``.
+
+Records facts about the last successful ``lexictl update`` that let later
+runs avoid a full project walk.  The file is a local cache: a missing or
+unreadable state file simply means "no fast path available".
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from lexibrarian.utils.atomic import atomic_write
+from lexibrarian.utils.paths import LEXIBRARY_DIR
+
+logger = logging.getLogger(__name__)
+
+STATE_FILENAME = ".state.json"
+
+_STATE_VERSION = 1
+
+
+@dataclass
+class LibraryState:
+    """Facts recorded after the last successful project update.
+
+    Attributes:
+        indexed_head: Git ``HEAD`` SHA the library was last fully synced to.
+        dirty_files: Project-relative paths that had uncommitted changes at
+            that time; they are re-checked on the next run because reverting
+            them would not show up in ``git diff``.
+        config_fingerprint: Hash of the configuration and ignore rules in
+            effect; a mismatch forces a full walk.
+    """
+
+    indexed_head: str | None = None
+    dirty_files: list[str] = field(default_factory=list)
+    config_fingerprint: str | None = None
+
+
+def state_path(project_root: Path) -> Path:
+    """Return the path of the state file for *project_root*."""
+    return project_root / LEXIBRARY_DIR / STATE_FILENAME
+
+
+def load_state(project_root: Path) -> LibraryState:
+    """Load the library state, returning an empty state if absent or invalid."""
+    path = state_path(project_root)
+    if not path.exists():
+        return LibraryState()
+
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if data.get("version") != _STATE_VERSION:
+            return LibraryState()
+        return LibraryState(
+            indexed_head=data.get("indexed_head"),
+            dirty_files=list(data.get("dirty_files", [])),
+            config_fingerprint=data.get("config_fingerprint"),
+        )
+    except (OSError, json.JSONDecodeError, AttributeError, TypeError):
+        logger.warning("Corrupted state file at %s, ignoring", path)
+        return LibraryState()
+
+
+def save_state(project_root: Path, state: LibraryState) -> None:
+    """Persist *state* atomically.  Write failures are logged, not raised."""
+    data = {"version": _STATE_VERSION, **asdict(state)}
+    try:
+        atomic_write(state_path(project_root), json.dumps(data, indent=2) + "\n")
+    except OSError:
+        logger.warning("Could not write state file %s", state_path(project_root))
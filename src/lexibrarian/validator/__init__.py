@@ -6,6 +6,11 @@ from collections.abc import Callable
 from pathlib import Path
 from typing import Literal
 
+from lexibrarian.validator.cache import (
+    library_fingerprint,
+    load_cached_report,
+    save_cached_report,
+)
 from lexibrarian.validator.checks import (
     check_aindex_coverage,
     check_concept_frontmatter,
@@ -53,6 +58,11 @@ AVAILABLE_CHECKS: dict[str, tuple[CheckFn, Severity]] = {
     "aindex_coverage": (check_aindex_coverage, "info"),
 }
 
+# Checks that always run, even when the rest of the report comes from the
+# cache.  aindex_coverage walks every directory, including empty and
+# gitignored ones that the cache fingerprint cannot see.
+_UNCACHED_CHECKS = frozenset({"aindex_coverage"})
+
 # Severity levels ordered from most to least severe.
 _SEVERITY_ORDER: dict[Severity, int] = {
     "error": 0,
@@ -67,6 +77,7 @@ def validate_library(
     *,
     severity_filter: str | None = None,
     check_filter: str | None = None,
+    use_cache: bool = False,
 ) -> ValidationReport:
     """Run all validation checks and return an aggregated report.
 
@@ -81,6 +92,10 @@ def validate_library(
             warnings), ``"info"`` (all -- the default when ``None``).
         check_filter: Run only the named check. Must be a key in
             ``AVAILABLE_CHECKS``. When ``None``, all checks are run.
+        use_cache: Reuse the report stored in ``.lexibrary/.validate_cache.json``
+            when nothing the checks read has changed since it was written,
+            and store the result of a fresh run there.  ``aindex_coverage``
+            is always run live.  See :mod:`lexibrarian.validator.cache`.
 
     Returns:
         A ValidationReport with all discovered issues.
@@ -118,16 +133,37 @@ def validate_library(
             if _SEVERITY_ORDER[sev] <= threshold
         }
 
-    # Run selected checks and aggregate issues
+    cacheable = {name for name in checks_to_run if name not in _UNCACHED_CHECKS}
+    fingerprint: str | None = None
+    cached_issues: dict[str, list[ValidationIssue]] | None = None
+    if use_cache and cacheable:
+        fingerprint = library_fingerprint(project_root, lexibrary_dir)
+        if fingerprint is not None:
+            cached = load_cached_report(lexibrary_dir, fingerprint, cacheable)
+            if cached is not None:
+                cached_issues = {name: [] for name in cacheable}
+                for issue in cached.issues:
+                    cached_issues[issue.check].append(issue)
+
+    # Run selected checks (or take their cached issues) and aggregate issues
     all_issues: list[ValidationIssue] = []
-    for _name, (check_fn, _sev) in checks_to_run.items():
+    for name, (check_fn, _sev) in checks_to_run.items():
+        if cached_issues is not None and name in cached_issues:
+            all_issues.extend(cached_issues[name])
+            continue
         try:
             issues = check_fn(project_root, lexibrary_dir)
-            all_issues.extend(issues)
         except Exception:
             # Individual check failures should not abort the entire run.
             # In a future iteration we could log these or add them as
             # issues themselves.
-            pass
-
-    return ValidationReport(issues=all_issues)
+            continue
+        all_issues.extend(issues)
+
+    report = ValidationReport(issues=all_issues)
+    if fingerprint is not None and cached_issues is None:
+        cacheable_issues = [issue for issue in all_issues if issue.check in cacheable]
+        save_cached_report(
+            lexibrary_dir, fingerprint, cacheable, ValidationReport(issues=cacheable_issues)
+        )
+    return report
@@ -0,0 +1,159 @@
+"""Fingerprint-keyed cache of validation reports.
+
+``lexictl status`` and ``lexictl validate`` both run the validator.  The
+report from the most recent run is stored in
+``.lexibrary/.validate_cache.json`` together with a fingerprint of
+everything the checks read, and is served again until that fingerprint
+changes.
+
+The fingerprint combines the git ``HEAD`` SHA, the ``(mtime_ns, size)`` of
+every file git reports as modified or untracked, every file under
+``.lexibrary/`` (other than its own caches) and the global config file.
+Outside a git work tree no fingerprint is available and the cache is
+bypassed.  Directories are not part of the fingerprint -- an empty or
+gitignored one never shows up in git output -- so ``aindex_coverage`` is
+never cached and always runs live.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+
+from lexibrarian.config.loader import GLOBAL_CONFIG_PATH
+from lexibrarian.utils.atomic import atomic_write
+from lexibrarian.utils.git import changed_files_since, head_commit
+from lexibrarian.utils.paths import LEXIBRARY_DIR
+from lexibrarian.validator.report import ValidationIssue, ValidationReport
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILENAME = ".validate_cache.json"
+
+_CACHE_VERSION = 1
+
+
+def _cache_path(lexibrary_dir: Path) -> Path:
+    return lexibrary_dir / CACHE_FILENAME
+
+
+def _is_sidecar(name: str) -> bool:
+    """Return True for top-level ``.lexibrary/.*.json`` cache files."""
+    return name.startswith(".") and name.endswith(".json")
+
+
+def _stat_line(key: str, path: Path | str) -> bytes:
+    """Return a fingerprint line for *path*'s ``(mtime_ns, size)``, or a missing marker."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        line = f"{key}\0-\n"
+    else:
+        line = f"{key}\0{st.st_mtime_ns}\0{st.st_size}\n"
+    return line.encode("utf-8", "surrogateescape")
+
+
+def library_fingerprint(project_root: Path, lexibrary_dir: Path) -> str | None:
+    """Return a fingerprint of all inputs the validator reads, or ``None``.
+
+    Returns ``None`` when *project_root* is not inside a git work tree, since
+    changes to source files could then go unnoticed.
+    """
+    head = head_commit(project_root)
+    if head is None:
+        return None
+    changed = changed_files_since(project_root, "HEAD")
+    if changed is None:
+        return None
+
+    digest = hashlib.sha256(head.encode("ascii"))
+    lexibrary_prefix = LEXIBRARY_DIR + "/"
+    for rel in changed:
+        # .lexibrary/ is covered by the full walk below
+        if not rel.startswith(lexibrary_prefix):
+            digest.update(_stat_line(rel, project_root / rel))
+
+    digest.update(b"\0lexibrary\0")
+    entries: list[tuple[str, str]] = []
+    pending: list[tuple[str, str]] = [(str(lexibrary_dir), "")]
+    while pending:
+        current, rel_dir = pending.pop()
+        try:
+            it = os.scandir(current)
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                rel = f"{rel_dir}{entry.name}"
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        # Top-level dot-directories (.llm_cache/) hold caches, not artifacts
+                        if rel_dir or not entry.name.startswith("."):
+                            pending.append((entry.path, rel + "/"))
+                        continue
+                except OSError:
+                    continue
+                if not rel_dir and _is_sidecar(entry.name):
+                    continue
+                entries.append((rel, entry.path))
+    for rel, path in sorted(entries):
+        digest.update(_stat_line(rel, path))
+
+    digest.update(_stat_line("\0global-config", GLOBAL_CONFIG_PATH))
+    return digest.hexdigest()
+
+
+def load_cached_report(
+    lexibrary_dir: Path,
+    fingerprint: str,
+    check_names: set[str],
+) -> ValidationReport | None:
+    """Return the cached report restricted to *check_names*, if usable.
+
+    The cached report is usable only when its fingerprint matches and it
+    was produced by a run that covered every check in *check_names*.
+    """
+    path = _cache_path(lexibrary_dir)
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except (OSError, json.JSONDecodeError):
+        logger.warning("Corrupted validation cache at %s, ignoring", path)
+        return None
+
+    try:
+        if data.get("version") != _CACHE_VERSION or data.get("fingerprint") != fingerprint:
+            return None
+        if not check_names <= set(data["checks"]):
+            return None
+        issues = [ValidationIssue(**issue) for issue in data["report"]["issues"]]
+    except (AttributeError, KeyError, TypeError):
+        logger.warning("Corrupted validation cache at %s, ignoring", path)
+        return None
+
+    logger.debug("Validation report served from cache (cached: true)")
+    return ValidationReport(issues=[i for i in issues if i.check in check_names])
+
+
+def save_cached_report(
+    lexibrary_dir: Path,
+    fingerprint: str,
+    check_names: set[str],
+    report: ValidationReport,
+) -> None:
+    """Persist *report*, produced by running *check_names*, under *fingerprint*."""
+    data = {
+        "version": _CACHE_VERSION,
+        "fingerprint": fingerprint,
+        "checks": sorted(check_names),
+        "report": report.to_dict(),
+    }
+    path = _cache_path(lexibrary_dir)
+    try:
+        atomic_write(path, json.dumps(data))
+    except OSError:
+        logger.warning("Could not write validation cache to %s", path)
@@ -35,6 +35,12 @@ _WIKILINK_RE = re.compile(r"\[\[(.+?)\]\]")
 # Regex to match YAML frontmatter block
 _FRONTMATTER_RE = re.compile(r"^---\n(.*?)\n---\n?", re.DOTALL)
 
+# Markdown files under .lexibrary/ that are never design files
+_SPECIAL_DESIGN_NAMES = frozenset({"START_HERE.md"})
+
+# Path components that mark stack posts and concepts rather than design files
+_NON_DESIGN_PARTS = frozenset({"stack", "concepts"})
+
 
 # ---------------------------------------------------------------------------
 # Error-severity checks
@@ -812,17 +818,13 @@ def _iter_design_files(lexibrary_dir: Path) -> list[Path]:
         return []
 
     results: list[Path] = []
-    special_names = {"START_HERE.md"}
 
     for md_path in sorted(lexibrary_dir.rglob("*.md")):
         # Skip special files
-        if md_path.name in special_names:
-            continue
-        # Skip stack posts
-        if "stack" in md_path.relative_to(lexibrary_dir).parts:
+        if md_path.name in _SPECIAL_DESIGN_NAMES:
             continue
-        # Skip concepts
-        if "concepts" in md_path.relative_to(lexibrary_dir).parts:
+        # Skip stack posts and concepts
+        if not _NON_DESIGN_PARTS.isdisjoint(md_path.relative_to(lexibrary_dir).parts):
             continue
         results.append(md_path)
 
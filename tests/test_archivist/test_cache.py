@@ -0,0 +1,199 @@
+"""Tests for the archivist LLM response cache."""
+
+from __future__ import annotations
+
+import os
+from dataclasses import replace
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from pydantic import ValidationError
+
+from lexibrarian.archivist.cache import CachedArchivistService, design_file_cache_key
+from lexibrarian.archivist.service import DesignFileRequest
+from lexibrarian.baml_client.types import DesignFileOutput
+from lexibrarian.config.schema import LLMConfig
+from lexibrarian.llm.rate_limiter import RateLimiter
+
+
+@pytest.fixture()
+def config() -> LLMConfig:
+    return LLMConfig(provider="anthropic")
+
+
+@pytest.fixture()
+def request_() -> DesignFileRequest:
+    return DesignFileRequest(
+        source_path="src/auth.py",
+        source_content="def login(): ...\n",
+        language="python",
+    )
+
+
+@pytest.fixture()
+def output() -> DesignFileOutput:
+    return DesignFileOutput(
+        summary="Handles login.",
+        interface_contract="def login(): ...",
+        dependencies=[],
+        wikilinks=[],
+        tags=["auth"],
+    )
+
+
+def _service(config: LLMConfig, cache_dir: Path, client: MagicMock) -> CachedArchivistService:
+    service = CachedArchivistService(
+        rate_limiter=RateLimiter(requests_per_minute=6000),
+        config=config,
+        cache_dir=cache_dir,
+    )
+    service._get_baml_client = MagicMock(return_value=client)  # type: ignore[method-assign]
+    return service
+
+
+# ---------------------------------------------------------------------------
+# Cache key
+# ---------------------------------------------------------------------------
+
+
+def test_key_is_deterministic(config: LLMConfig, request_: DesignFileRequest) -> None:
+    assert design_file_cache_key(config, request_) == design_file_cache_key(config, request_)
+
+
+def test_key_changes_with_content_and_model(config: LLMConfig, request_: DesignFileRequest) -> None:
+    key = design_file_cache_key(config, request_)
+    assert design_file_cache_key(config, replace(request_, source_content="x = 1\n")) != key
+    assert design_file_cache_key(LLMConfig(provider="anthropic", model="other"), request_) != key
+
+
+# ---------------------------------------------------------------------------
+# CachedArchivistService
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio()
+async def test_second_identical_request_is_served_from_cache(
+    tmp_path: Path,
+    config: LLMConfig,
+    request_: DesignFileRequest,
+    output: DesignFileOutput,
+) -> None:
+    client = MagicMock()
+    client.ArchivistGenerateDesignFile = AsyncMock(return_value=output)
+    service = _service(config, tmp_path / ".llm_cache", client)
+
+    first = await service.generate_design_file(request_)
+    second = await service.generate_design_file(request_)
+
+    assert client.ArchivistGenerateDesignFile.await_count == 1
+    assert second.design_file_output == first.design_file_output == output
+    key = design_file_cache_key(config, request_)
+    assert (tmp_path / ".llm_cache" / key[:2] / f"{key}.json").is_file()
+
+
+@pytest.mark.asyncio()
+async def test_failures_are_not_cached(
+    tmp_path: Path,
+    config: LLMConfig,
+    request_: DesignFileRequest,
+    output: DesignFileOutput,
+) -> None:
+    client = MagicMock()
+    client.ArchivistGenerateDesignFile = AsyncMock(side_effect=[RuntimeError("boom"), output])
+    service = _service(config, tmp_path, client)
+
+    failed = await service.generate_design_file(request_)
+    retried = await service.generate_design_file(request_)
+
+    assert failed.error
+    assert not retried.error
+    assert client.ArchivistGenerateDesignFile.await_count == 2
+
+
+@pytest.mark.asyncio()
+async def test_corrupted_entry_falls_through_to_llm(
+    tmp_path: Path,
+    config: LLMConfig,
+    request_: DesignFileRequest,
+    output: DesignFileOutput,
+) -> None:
+    key = design_file_cache_key(config, request_)
+    entry = tmp_path / key[:2] / f"{key}.json"
+    entry.parent.mkdir()
+    entry.write_text('{"summary": 1}')
+
+    client = MagicMock()
+    client.ArchivistGenerateDesignFile = AsyncMock(return_value=output)
+    service = _service(config, tmp_path, client)
+
+    result = await service.generate_design_file(request_)
+
+    assert result.design_file_output == output
+    client.ArchivistGenerateDesignFile.assert_awaited_once()
+
+
+@pytest.mark.asyncio()
+async def test_start_here_is_not_cached(tmp_path: Path, config: LLMConfig) -> None:
+    service = _service(config, tmp_path, MagicMock())
+    with patch(
+        "lexibrarian.archivist.service.ArchivistService.generate_start_here",
+        new=AsyncMock(),
+    ) as mock_start_here:
+        await service.generate_start_here(MagicMock())
+    mock_start_here.assert_awaited_once()
+    assert not any(tmp_path.iterdir())
+
+
+def test_response_cache_is_off_by_default() -> None:
+    assert LLMConfig().response_cache is False
+
+
+# ---------------------------------------------------------------------------
+# Pruning
+# ---------------------------------------------------------------------------
+
+
+def _write_entry(cache_dir: Path, key: str, mtime: float) -> Path:
+    entry = cache_dir / key[:2] / f"{key}.json"
+    entry.parent.mkdir(parents=True, exist_ok=True)
+    entry.write_text("{}")
+    os.utime(entry, (mtime, mtime))
+    return entry
+
+
+def test_prune_evicts_least_recently_used_beyond_limit(tmp_path: Path) -> None:
+    config = LLMConfig(response_cache_max_entries=2)
+    entries = [_write_entry(tmp_path, f"{i:02d}{'a' * 62}", 1000.0 + i) for i in range(4)]
+    service = _service(config, tmp_path, MagicMock())
+
+    assert service.prune() == 2
+
+    assert [e.exists() for e in entries] == [False, False, True, True]
+    assert service.prune() == 0
+
+
+@pytest.mark.asyncio()
+async def test_cache_hit_protects_entry_from_pruning(
+    tmp_path: Path,
+    request_: DesignFileRequest,
+    output: DesignFileOutput,
+) -> None:
+    config = LLMConfig(provider="anthropic", response_cache_max_entries=1)
+    key = design_file_cache_key(config, request_)
+    hit = _write_entry(tmp_path, key, 1000.0)
+    hit.write_text(output.model_dump_json())
+    os.utime(hit, (1000.0, 1000.0))
+    other = _write_entry(tmp_path, "ff" + "b" * 62, 2000.0)
+    service = _service(config, tmp_path, MagicMock())
+
+    await service.generate_design_file(request_)
+    service.prune()
+
+    assert hit.exists()
+    assert not other.exists()
+
+
+def test_max_entries_must_be_positive() -> None:
+    with pytest.raises(ValidationError):
+        LLMConfig(response_cache_max_entries=0)
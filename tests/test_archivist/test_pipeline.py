@@ -697,6 +697,69 @@ class TestUpdateProjectDiscovery:
         file_names = {p.name for p in calls}
         assert "foo.py.md" not in file_names
 
+    @pytest.mark.asyncio()
+    async def test_streams_files_in_sorted_order(self, tmp_path: Path) -> None:
+        """Files spanning several discovery batches arrive in sorted path order."""
+        for i in range(300):
+            _make_source_file(tmp_path, f"src/pkg{i % 3}/m{i:03d}.py", f"# {i}")
+        _make_source_file(tmp_path, "src/pkg0.py", "# sibling of pkg0/")
+        _make_source_file(tmp_path, "src/pkg0/sub/deep.py", "# deep")
+
+        config = _make_config(scope_root="src")
+        archivist = _mock_archivist()
+
+        calls: list[Path] = []
+
+        async def fake_update_file(
+            source_path: Path,
+            project_root: Path,
+            cfg: LexibraryConfig,
+            svc: ArchivistService,
+            **kwargs: object,
+        ) -> FileResult:
+            calls.append(source_path)
+            return FileResult(change=ChangeLevel.UNCHANGED)
+
+        with patch("lexibrarian.archivist.pipeline.update_file", side_effect=fake_update_file):
+            stats = await update_project(tmp_path, config, archivist)
+
+        expected = sorted(p for p in (tmp_path / "src").resolve().rglob("*") if p.is_file())
+        assert calls == expected
+        assert stats.files_scanned == 302
+
+    @pytest.mark.asyncio()
+    async def test_does_not_descend_into_ignored_directories(self, tmp_path: Path) -> None:
+        _make_source_file(tmp_path, "src/foo.py", "def foo(): pass")
+        _make_source_file(tmp_path, "vendor/lib.py", "def lib(): pass")
+        (tmp_path / ".gitignore").write_text("vendor/\n", encoding="utf-8")
+
+        config = _make_config()
+        archivist = _mock_archivist()
+
+        calls: list[Path] = []
+
+        async def fake_update_file(
+            source_path: Path,
+            project_root: Path,
+            cfg: LexibraryConfig,
+            svc: ArchivistService,
+            **kwargs: object,
+        ) -> FileResult:
+            calls.append(source_path)
+            return FileResult(change=ChangeLevel.UNCHANGED)
+
+        with (
+            patch("lexibrarian.archivist.pipeline.update_file", side_effect=fake_update_file),
+            patch("lexibrarian.archivist.pipeline._is_binary", wraps=_is_binary) as is_binary,
+        ):
+            await update_project(tmp_path, config, archivist)
+
+        assert "lib.py" not in {p.name for p in calls}
+        # The walker never lists vendor/, so none of its files reach the filters
+        listed = {call.args[0].name for call in is_binary.call_args_list}
+        assert "foo.py" in listed
+        assert "lib.py" not in listed
+
 
 # ---------------------------------------------------------------------------
 # update_project — stats accumulation
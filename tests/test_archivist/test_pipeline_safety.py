@@ -632,6 +632,72 @@ class TestUpdateFiles:
 
         mock_start_here.assert_not_called()
 
+    @pytest.mark.asyncio()
+    async def test_start_here_regeneration_when_requested(self, tmp_path: Path) -> None:
+        """update_files(regenerate_start_here=True) finishes like update_project()."""
+        source = _make_source_file(tmp_path, "src/foo.py", "def foo(): pass")
+
+        config = _make_config()
+        archivist = _mock_archivist()
+
+        async def fake_update_file(
+            source_path: Path,
+            project_root: Path,
+            cfg: LexibraryConfig,
+            svc: ArchivistService,
+            **kwargs: object,
+        ) -> FileResult:
+            return FileResult(change=ChangeLevel.UNCHANGED)
+
+        with (
+            patch(
+                "lexibrarian.archivist.pipeline.update_file",
+                side_effect=fake_update_file,
+            ),
+            patch(
+                "lexibrarian.archivist.pipeline.generate_start_here",
+                new_callable=AsyncMock,
+                side_effect=RuntimeError("boom"),
+            ) as mock_start_here,
+        ):
+            stats = await update_files(
+                [source], tmp_path, config, archivist, regenerate_start_here=True
+            )
+
+        mock_start_here.assert_awaited_once()
+        assert stats.start_here_failed is True
+
+    @pytest.mark.asyncio()
+    async def test_skips_oversized_files(self, tmp_path: Path) -> None:
+        """update_files() applies the same max_file_size_kb limit as update_project()."""
+        small = _make_source_file(tmp_path, "src/small.py", "x = 1")
+        big = _make_source_file(tmp_path, "src/big.py", "x" * 4096)
+
+        config = _make_config()
+        config.crawl.max_file_size_kb = 2
+        archivist = _mock_archivist()
+
+        calls: list[Path] = []
+
+        async def fake_update_file(
+            source_path: Path,
+            project_root: Path,
+            cfg: LexibraryConfig,
+            svc: ArchivistService,
+            **kwargs: object,
+        ) -> FileResult:
+            calls.append(source_path)
+            return FileResult(change=ChangeLevel.UNCHANGED)
+
+        with patch(
+            "lexibrarian.archivist.pipeline.update_file",
+            side_effect=fake_update_file,
+        ):
+            stats = await update_files([small, big], tmp_path, config, archivist)
+
+        assert stats.files_scanned == 1
+        assert [p.name for p in calls] == ["small.py"]
+
     @pytest.mark.asyncio()
     async def test_error_handling_per_file(self, tmp_path: Path) -> None:
         """Errors on individual files increment files_failed without stopping."""
@@ -186,6 +186,18 @@ class TestProviderRouting:
         service = ArchivistService(rate_limiter=rate_limiter, config=unknown_config)
         assert service._client_name is None
 
+    def test_anthropic_prompt_cache_disabled_selects_uncached_client(
+        self, rate_limiter: RateLimiter
+    ) -> None:
+        config = LLMConfig(provider="anthropic", prompt_cache=False)
+        service = ArchivistService(rate_limiter=rate_limiter, config=config)
+        assert service._client_name == "AnthropicArchivistUncached"
+
+    def test_prompt_cache_disabled_keeps_openai_client(self, rate_limiter: RateLimiter) -> None:
+        config = LLMConfig(provider="openai", prompt_cache=False)
+        service = ArchivistService(rate_limiter=rate_limiter, config=config)
+        assert service._client_name == "OpenAIArchivist"
+
     def test_provider_client_map_covers_expected_providers(self) -> None:
         assert "anthropic" in _PROVIDER_CLIENT_MAP
         assert "openai" in _PROVIDER_CLIENT_MAP
@@ -97,6 +97,19 @@ class TestParseAIndex:
         assert dir_entry.name == "bar"
         assert dir_entry.description == "A subdir"
 
+    def test_parse_rows_with_pipes_and_odd_spacing(self, tmp_path: Path) -> None:
+        entries = [
+            AIndexEntry(name="cli.py", entry_type="file", description="Parses a | b flags"),
+            AIndexEntry(name="docs", entry_type="dir", description=""),
+        ]
+        text = serialize_aindex(_aindex(entries=entries)).replace(
+            "| `docs/` | dir |  |", "|`docs/`|dir|   |"
+        )
+        p = _write_aindex(tmp_path, ".aindex", text)
+        result = parse_aindex(p)
+        assert result is not None
+        assert result.entries == entries
+
     def test_parse_dir_entry_strips_trailing_slash(self, tmp_path: Path) -> None:
         # The serializer outputs "`bar/`" in the table; parser should store "bar"
         entries = [AIndexEntry(name="bar", entry_type="dir", description="Dir")]
@@ -164,6 +177,24 @@ class TestParseAIndex:
         assert result is not None
         assert result.billboard == "Billboard text."
 
+    def test_metadata_footer_spanning_lines(self, tmp_path: Path) -> None:
+        content = (
+            "# src\n\nBillboard.\n\n## Child Map\n\n"
+            "| Name | Type | Description |\n| --- | --- | --- |\n"
+            "| `a.py` | file | Python source (1 lines) |\n\n"
+            "## Local Conventions\n\n- Keep it small\n\n"
+            '<!-- lexibrarian:meta source="src"\n'
+            'source_hash="h" generated="2026-01-01T00:00:00"\n'
+            'generator="g" -->'
+        )
+        p = _write_aindex(tmp_path, ".aindex", content)
+        result = parse_aindex(p)
+        assert result is not None
+        assert [e.name for e in result.entries] == ["a.py"]
+        assert result.local_conventions == ["Keep it small"]
+        assert result.metadata.source_hash == "h"
+        assert result.metadata.generator == "g"
+
 
 class TestParseAIndexMetadata:
     def test_returns_none_for_nonexistent_file(self, tmp_path: Path) -> None:
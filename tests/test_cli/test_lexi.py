@@ -6,11 +6,13 @@ import hashlib
 import os
 from datetime import datetime
 from pathlib import Path
+from unittest.mock import patch
 
 import yaml
 from typer.testing import CliRunner
 
 from lexibrarian.cli import lexi_app
+from lexibrarian.stack.index import StackIndex
 
 runner = CliRunner()
 
@@ -1064,6 +1066,28 @@ class TestStackPostCommand:
         assert result.exit_code == 0  # type: ignore[union-attr]
         assert "Problem" in result.output  # type: ignore[union-attr]
 
+    def test_create_post_slugifies_title(self, tmp_path: Path) -> None:
+        """Title punctuation and case collapse into a single-hyphen slug."""
+        _setup_stack_project(tmp_path)
+        result = self._invoke(
+            tmp_path,
+            ["stack", "post", "--title", "  Why does --Auth FAIL?! (v2) ", "--tag", "auth"],
+        )
+        assert result.exit_code == 0  # type: ignore[union-attr]
+        stack_dir = tmp_path / ".lexibrary" / "stack"
+        assert (stack_dir / "ST-001-why-does-auth-fail-v2.md").exists()
+
+    def test_create_post_slugifies_non_ascii_title(self, tmp_path: Path) -> None:
+        """Non-ASCII characters are replaced by hyphens."""
+        _setup_stack_project(tmp_path)
+        result = self._invoke(
+            tmp_path,
+            ["stack", "post", "--title", "Café Überblick", "--tag", "docs"],
+        )
+        assert result.exit_code == 0  # type: ignore[union-attr]
+        stack_dir = tmp_path / ".lexibrary" / "stack"
+        assert (stack_dir / "ST-001-caf-berblick.md").exists()
+
 
 # ---------------------------------------------------------------------------
 # Stack search command tests
@@ -1400,6 +1424,20 @@ class TestStackListCommand:
         assert result.exit_code == 1  # type: ignore[union-attr]
         assert "No .lexibrary/" in result.output  # type: ignore[union-attr]
 
+    def test_list_reuses_index_until_posts_change(self, tmp_path: Path) -> None:
+        """Repeated listings reuse the parsed index but pick up edited posts."""
+        _setup_stack_project(tmp_path)
+        _create_stack_post(tmp_path, post_id="ST-001", title="Bug one")
+        with patch("lexibrarian.stack.index.StackIndex.build", wraps=StackIndex.build) as build_spy:
+            self._invoke(tmp_path, ["stack", "list"])
+            self._invoke(tmp_path, ["stack", "list"])
+            assert build_spy.call_count == 1
+
+            _create_stack_post(tmp_path, post_id="ST-001", title="Bug one", votes=42)
+            result = self._invoke(tmp_path, ["stack", "list"])
+            assert build_spy.call_count == 2
+        assert "42" in result.output  # type: ignore[union-attr]
+
 
 # ---------------------------------------------------------------------------
 # Unified search command tests
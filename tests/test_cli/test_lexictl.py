@@ -4,10 +4,13 @@ from __future__ import annotations
 
 import hashlib
 import os
+import shutil
+import subprocess
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import AsyncMock, patch
 
+import pytest
 import yaml
 from typer.testing import CliRunner
 
@@ -50,6 +53,33 @@ class TestHelp:
         for cmd in ("lookup", "index", "concepts", "search", "stack", "concept", "describe"):
             assert cmd not in command_names, f"Agent command '{cmd}' should not be in lexictl"
 
+    def test_import_does_not_load_agent_app(self) -> None:
+        import sys
+
+        code = (
+            "import sys; from lexibrarian.cli import lexictl_app; "
+            "print('lexibrarian.cli._lexi_app' in sys.modules)"
+        )
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+        proc = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env
+        )
+        assert proc.stdout.strip() == "False"
+
+    def test_export_survives_direct_submodule_import(self) -> None:
+        import sys
+
+        code = (
+            "import typer, lexibrarian.cli._lexictl_app; "
+            "from lexibrarian.cli import lexictl_app; "
+            "print(isinstance(lexictl_app, typer.Typer))"
+        )
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+        proc = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env
+        )
+        assert proc.stdout.strip() == "True"
+
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -384,6 +414,138 @@ class TestUpdateCommand:
         assert "Failed" in result.output
 
 
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(["git", "-C", str(repo), *args], check=True, capture_output=True)
+
+
+def _setup_git_project(tmp_path: Path) -> Path:
+    """Create an archivist project committed to a fresh git repository."""
+    project = _setup_archivist_project(tmp_path)
+    (project / ".gitignore").write_text(".lexibrary/.*.json\n")
+    _git(project, "init", "-q")
+    _git(project, "config", "user.email", "test@example.com")
+    _git(project, "config", "user.name", "Test")
+    _git(project, "add", ".")
+    _git(project, "commit", "-q", "-m", "initial")
+    return project
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+class TestUpdateGitFastPath:
+    """`lexictl update` with no path re-checks only files git reports as changed."""
+
+    def _invoke(self, project: Path, args: list[str]) -> tuple[object, AsyncMock, AsyncMock]:
+        mock_update_project = AsyncMock(return_value=UpdateStats(files_scanned=2))
+        mock_update_files = AsyncMock(return_value=UpdateStats(files_scanned=1))
+        old_cwd = os.getcwd()
+        os.chdir(project)
+        try:
+            with (
+                patch("lexibrarian.archivist.pipeline.update_project", mock_update_project),
+                patch("lexibrarian.archivist.pipeline.update_files", mock_update_files),
+            ):
+                result = runner.invoke(lexictl_app, args)
+        finally:
+            os.chdir(old_cwd)
+        return result, mock_update_project, mock_update_files
+
+    def test_first_run_walks_project_and_records_head(self, tmp_path: Path) -> None:
+        project = _setup_git_project(tmp_path)
+        result, mock_project, mock_files = self._invoke(project, ["update"])
+
+        assert result.exit_code == 0  # type: ignore[union-attr]
+        mock_project.assert_awaited_once()
+        mock_files.assert_not_awaited()
+        assert (project / ".lexibrary" / ".state.json").exists()
+
+    def test_second_run_updates_only_changed_files(self, tmp_path: Path) -> None:
+        project = _setup_git_project(tmp_path)
+        self._invoke(project, ["update"])
+
+        (project / "src" / "main.py").write_text("def hello():\n    return 1\n")
+        (project / "src" / "new.py").write_text("y = 2\n")
+        result, mock_project, mock_files = self._invoke(project, ["update"])
+
+        assert result.exit_code == 0  # type: ignore[union-attr]
+        mock_project.assert_not_awaited()
+        mock_files.assert_awaited_once()
+        paths = mock_files.await_args.args[0]  # type: ignore[union-attr]
+        assert paths == [project / "src" / "main.py", project / "src" / "new.py"]
+        assert mock_files.await_args.kwargs["regenerate_start_here"] is True  # type: ignore[union-attr]
+
+    def test_no_changes_reports_up_to_date(self, tmp_path: Path) -> None:
+        project = _setup_git_project(tmp_path)
+        self._invoke(project, ["update"])
+
+        with patch("lexibrarian.archivist.service.ArchivistService") as mock_service:
+            result, mock_project, mock_files = self._invoke(project, ["update"])
+
+        assert result.exit_code == 0  # type: ignore[union-attr]
+        assert "up to date" in result.output  # type: ignore[union-attr]
+        mock_project.assert_not_awaited()
+        mock_files.assert_not_awaited()
+        # Nothing to do: the LLM client is never constructed
+        mock_service.assert_not_called()
+
+    def test_deleted_design_file_maps_back_to_source(self, tmp_path: Path) -> None:
+        project = _setup_git_project(tmp_path)
+        design = project / ".lexibrary" / "src" / "utils.py.md"
+        design.parent.mkdir(parents=True)
+        design.write_text("design\n")
+        _git(project, "add", ".")
+        _git(project, "commit", "-q", "-m", "design")
+        self._invoke(project, ["update"])
+
+        design.unlink()
+        _, _, mock_files = self._invoke(project, ["update"])
+
+        assert mock_files.await_args.args[0] == [project / "src" / "utils.py"]  # type: ignore[union-attr]
+
+    def test_full_flag_forces_project_walk(self, tmp_path: Path) -> None:
+        project = _setup_git_project(tmp_path)
+        self._invoke(project, ["update"])
+
+        _, mock_project, mock_files = self._invoke(project, ["update", "--full"])
+
+        mock_project.assert_awaited_once()
+        mock_files.assert_not_awaited()
+
+    def test_config_change_forces_project_walk(self, tmp_path: Path) -> None:
+        project = _setup_git_project(tmp_path)
+        self._invoke(project, ["update"])
+
+        (project / ".lexibrary" / "config.yaml").write_text("scope_root: src\n")
+        _, mock_project, mock_files = self._invoke(project, ["update"])
+
+        mock_project.assert_awaited_once()
+        mock_files.assert_not_awaited()
+
+    def test_gitignore_change_forces_project_walk(self, tmp_path: Path) -> None:
+        project = _setup_git_project(tmp_path)
+        self._invoke(project, ["update"])
+
+        (project / ".gitignore").write_text(".lexibrary/.*.json\n*.tmp\n")
+        _, mock_project, _ = self._invoke(project, ["update"])
+
+        mock_project.assert_awaited_once()
+
+    def test_failed_run_does_not_record_head(self, tmp_path: Path) -> None:
+        project = _setup_git_project(tmp_path)
+        old_cwd = os.getcwd()
+        os.chdir(project)
+        try:
+            with patch(
+                "lexibrarian.archivist.pipeline.update_project",
+                AsyncMock(return_value=UpdateStats(files_scanned=1, files_failed=1)),
+            ):
+                result = runner.invoke(lexictl_app, ["update"])
+        finally:
+            os.chdir(old_cwd)
+
+        assert result.exit_code == 1
+        assert not (project / ".lexibrary" / ".state.json").exists()
+
+
 # ---------------------------------------------------------------------------
 # Validate command tests
 # ---------------------------------------------------------------------------
@@ -633,6 +795,15 @@ Project root
         for issue in parsed["issues"]:
             assert issue["check"] == "concept_frontmatter"
 
+    def test_validate_no_cache_runs_every_check(self, tmp_path: Path) -> None:
+        """--no-cache bypasses the stored report and does not write one."""
+        project = _setup_validate_project(tmp_path)
+        with patch("lexibrarian.validator.library_fingerprint") as mock_fingerprint:
+            result = self._invoke(project, ["validate", "--no-cache", "--json"])
+        assert result.exit_code in (0, 1, 2)  # type: ignore[union-attr]
+        mock_fingerprint.assert_not_called()
+        assert not (project / ".lexibrary" / ".validate_cache.json").exists()
+
     def test_validate_invalid_check_name_shows_available(self, tmp_path: Path) -> None:
         """An invalid --check name shows available checks and exits 1."""
         project = _setup_validate_project(tmp_path)
@@ -743,6 +914,19 @@ class TestStatusCommand:
         assert output == "lexictl: library healthy"
         assert result.exit_code == 0  # type: ignore[union-attr]
 
+    def test_status_quiet_skips_artifact_walk(self, tmp_path: Path) -> None:
+        """Quiet mode only reports validation counts, so design files are not walked."""
+        project = _setup_status_project(tmp_path)
+        (project / "src" / "main.py").write_text("x = 1\n")
+        _create_design_file(project, "src/main.py", "x = 1\n")
+
+        with patch("lexibrarian.cli._lexictl_app._iter_design_md") as mock_walk:
+            result = self._invoke(project, ["status", "--quiet"])
+
+        mock_walk.assert_not_called()
+        assert result.exit_code == 0  # type: ignore[union-attr]
+        assert not (project / ".lexibrary" / ".status_cache.json").exists()
+
     def test_status_quiet_with_warnings(self, tmp_path: Path) -> None:
         """Quiet mode with warnings shows count and suggests lexictl validate."""
         project = _setup_status_project(tmp_path)
@@ -778,6 +962,73 @@ class TestStatusCommand:
         assert "2 tracked" in output
         assert "1 stale" in output
 
+    def test_status_reuses_cached_source_hashes(self, tmp_path: Path) -> None:
+        """A second status run does not re-hash sources whose stat is unchanged."""
+        project = _setup_status_project(tmp_path)
+        source = project / "src" / "main.py"
+        source.write_text("x = 1\n")
+        _create_design_file(project, "src/main.py", "x = 1\n")
+        past = datetime.now().timestamp() - 60
+        os.utime(source, (past, past))
+
+        self._invoke(project, ["status"])
+        assert (project / ".lexibrary" / ".status_cache.json").exists()
+
+        with patch("lexibrarian.utils.hash_cache.hash_file") as mock_hash:
+            result = self._invoke(project, ["status"])
+            mock_hash.assert_not_called()
+        assert "Files: 1 tracked" in result.output  # type: ignore[union-attr]
+
+    def test_status_mixed_naive_and_aware_generated_timestamps(self, tmp_path: Path) -> None:
+        """Naive and timezone-aware ``generated`` values can be compared."""
+        project = _setup_status_project(tmp_path)
+        for rel in ("src/a.py", "src/b.py"):
+            (project / rel).write_text("x = 1\n")
+        _create_design_file(project, "src/a.py", "x = 1\n")
+        aware = _create_design_file(project, "src/b.py", "x = 1\n")
+        text = aware.read_text()
+        naive_line = next(line for line in text.splitlines() if line.startswith("generated:"))
+        aware.write_text(text.replace(naive_line, "generated: 2020-01-01T00:00:00+00:00"))
+
+        result = self._invoke(project, ["status"])
+        assert result.exit_code == 0  # type: ignore[union-attr]
+        # The newest (naive, local-now) timestamp wins over the 2020 one
+        assert "second" in result.output  # type: ignore[union-attr]
+
+    def test_status_counts_nested_design_files_only(self, tmp_path: Path) -> None:
+        """Nested design files are counted; concepts/, stack/ and START_HERE.md are not."""
+        project = _setup_status_project(tmp_path)
+
+        (project / "src" / "pkg" / "sub").mkdir(parents=True)
+        for rel in ("src/a.py", "src/pkg/b.py", "src/pkg/sub/c.py"):
+            (project / rel).write_text("x = 1\n")
+            _create_design_file(project, rel, "x = 1\n")
+
+        # Design-shaped files in excluded locations must not be counted
+        (project / "concepts").mkdir()
+        (project / "concepts" / "d.py").write_text("x = 1\n")
+        _create_design_file(project, "concepts/d.py", "x = 1\n")
+        start_here = project / ".lexibrary" / "START_HERE.md"
+        start_here.write_text((project / ".lexibrary" / "src" / "a.py.md").read_text())
+
+        result = self._invoke(project, ["status"])
+        output = result.output  # type: ignore[union-attr]
+        assert "Files: 3 tracked" in output
+
+    def test_status_stale_count_with_many_sources(self, tmp_path: Path) -> None:
+        """Staleness is aggregated correctly when sources are hashed in parallel."""
+        project = _setup_status_project(tmp_path)
+        for i in range(40):
+            rel = f"src/m{i}.py"
+            (project / rel).write_text(f"x = {i}\n")
+            _create_design_file(project, rel, f"x = {i}\n")
+        for i in range(0, 40, 4):
+            (project / f"src/m{i}.py").write_text("changed\n")
+        (project / "src" / "m1.py").unlink()  # missing sources are not stale
+
+        result = self._invoke(project, ["status"])
+        assert "Files: 40 tracked, 10 stale" in result.output  # type: ignore[union-attr]
+
     def test_status_concept_status_breakdown(self, tmp_path: Path) -> None:
         """Status shows concept counts broken down by status."""
         project = _setup_status_project(tmp_path)
@@ -793,6 +1044,30 @@ class TestStatusCommand:
         assert "1 deprecated" in output
         assert "1 draft" in output
 
+    def test_status_counts_artifacts_without_plain_status_line(self, tmp_path: Path) -> None:
+        """Quoted, defaulted and invalid statuses match the full parser's result."""
+        project = _setup_status_project(tmp_path)
+        concepts_dir = project / ".lexibrary" / "concepts"
+        concepts_dir.mkdir(parents=True)
+        (concepts_dir / "Quoted.md").write_text(
+            '---\ntitle: Quoted\naliases: []\ntags: []\nstatus: "active"\n---\n\nBody\n'
+        )
+        # No status key: the model default ("draft") applies
+        (concepts_dir / "Implicit.md").write_text(
+            "---\ntitle: Implicit\naliases: []\ntags: []\n---\n\nBody\n"
+        )
+        # Invalid status: the full parser rejects the file
+        (concepts_dir / "Bogus.md").write_text(
+            "---\ntitle: Bogus\naliases: []\ntags: []\nstatus: bogus\n---\n\nBody\n"
+        )
+        _create_stack_post(project, post_id="ST-001", status="resolved")
+        _create_stack_post(project, post_id="ST-002", title="Other", status="outdated")
+
+        result = self._invoke(project, ["status"])
+        output = result.output  # type: ignore[union-attr]
+        assert "Concepts: 1 active, 1 draft" in output
+        assert "Stack: 2 posts (1 resolved, 0 open)" in output
+
     def test_status_no_validate_suggestion_when_clean(self, tmp_path: Path) -> None:
         """When no issues, the 'Run lexictl validate' suggestion is not shown."""
         project = _setup_status_project(tmp_path)
@@ -1066,6 +1341,30 @@ class TestUpdateChangedOnly:
         call_args = mock_update_files.call_args
         assert len(call_args[0][0]) == 2  # first positional arg is the list of paths
 
+    def test_changed_only_deduplicates_paths(self, tmp_path: Path) -> None:
+        """Repeated and equivalent paths are passed to update_files() once, in order."""
+        project = _setup_archivist_project(tmp_path)
+        mock_update_files = AsyncMock(return_value=UpdateStats(files_scanned=2))
+
+        with patch("lexibrarian.archivist.pipeline.update_files", mock_update_files):
+            result = self._invoke(
+                project,
+                [
+                    "update",
+                    "--changed-only",
+                    "src/utils.py",
+                    "--changed-only",
+                    "src/main.py",
+                    "--changed-only",
+                    "src/../src/utils.py",
+                ],
+            )
+
+        assert result.exit_code == 0  # type: ignore[union-attr]
+        paths = mock_update_files.call_args[0][0]
+        root = project.resolve()
+        assert paths == [root / "src" / "utils.py", root / "src" / "main.py"]
+
     def test_changed_only_mutual_exclusivity(self, tmp_path: Path) -> None:
         """path and --changed-only cannot be used together."""
         project = _setup_archivist_project(tmp_path)
@@ -1329,6 +1628,30 @@ class TestDaemonCommand:
         assert "Stale" in output or "stale" in output.lower()
         assert not (tmp_path / ".lexibrarian.pid").exists()
 
+    def test_daemon_status_pid_with_trailing_newline(self, tmp_path: Path) -> None:
+        """``daemon status`` accepts a PID file with surrounding whitespace."""
+        (tmp_path / ".lexibrary").mkdir()
+        (tmp_path / ".lexibrary" / "config.yaml").write_text("")
+        (tmp_path / ".lexibrarian.pid").write_text("12345\n")
+
+        with patch("os.kill") as mock_kill:
+            result = self._invoke(tmp_path, ["daemon", "status"])
+
+        assert result.exit_code == 0  # type: ignore[union-attr]
+        mock_kill.assert_called_once_with(12345, 0)
+
+    def test_daemon_status_corrupt_pid_file(self, tmp_path: Path) -> None:
+        """``daemon status`` with an unparseable PID file exits 1 and removes it."""
+        (tmp_path / ".lexibrary").mkdir()
+        (tmp_path / ".lexibrary" / "config.yaml").write_text("")
+        (tmp_path / ".lexibrarian.pid").write_text("not-a-pid")
+
+        result = self._invoke(tmp_path, ["daemon", "status"])
+
+        assert result.exit_code == 1  # type: ignore[union-attr]
+        assert "Cannot read PID file" in result.output  # type: ignore[union-attr]
+        assert not (tmp_path / ".lexibrarian.pid").exists()
+
     def test_daemon_no_project_root(self, tmp_path: Path) -> None:
         """daemon without .lexibrary/ exits 1."""
         result = self._invoke(tmp_path, ["daemon"])
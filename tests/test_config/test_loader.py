@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
+import os
+import subprocess
+import sys
 from pathlib import Path
+from unittest.mock import patch
 
-from lexibrarian.config.loader import load_config
+from lexibrarian.config import loader
+from lexibrarian.config.loader import _load_yaml, find_config_file, load_config
 from lexibrarian.config.schema import LexibraryConfig
 
 
@@ -19,6 +24,17 @@ def test_load_config_defaults_only(tmp_path: Path) -> None:
     assert config.daemon.debounce_seconds == 2.0
 
 
+def test_load_config_defaults_are_independent(tmp_path: Path) -> None:
+    """Default configs are not shared between load_config calls."""
+    missing = tmp_path / "nonexistent_global.yaml"
+    first = load_config(project_root=tmp_path, global_config_path=missing)
+    first.llm.provider = "openai"
+
+    second = load_config(project_root=tmp_path, global_config_path=missing)
+    assert second is not first
+    assert second.llm.provider == "anthropic"
+
+
 def test_load_config_global_only(tmp_path: Path) -> None:
     """load_config loads values from global config when no project config."""
     global_cfg = tmp_path / "global.yaml"
@@ -91,3 +107,128 @@ def test_load_config_extra_fields_ignored(tmp_path: Path) -> None:
     config = load_config(project_root=None, global_config_path=global_cfg)
     assert config.llm.provider == "anthropic"
     assert not hasattr(config.llm, "unknown_field")
+
+
+def test_load_config_reuses_parsed_file_until_it_changes(tmp_path: Path) -> None:
+    """Unchanged config files are parsed once; edits are picked up."""
+    config_dir = tmp_path / ".lexibrary"
+    config_dir.mkdir()
+    project_cfg = config_dir / "config.yaml"
+    project_cfg.write_text("llm:\n  provider: openai\n")
+    global_cfg = tmp_path / "missing_global.yaml"
+
+    with patch("lexibrarian.config.loader._load_yaml", wraps=_load_yaml) as mock_load:
+        first = load_config(project_root=tmp_path, global_config_path=global_cfg)
+        second = load_config(project_root=tmp_path, global_config_path=global_cfg)
+        assert mock_load.call_count == 1
+
+        project_cfg.write_text("llm:\n  provider: anthropic\n  model: other\n")
+        third = load_config(project_root=tmp_path, global_config_path=global_cfg)
+        assert mock_load.call_count == 2
+
+    assert first.llm.provider == second.llm.provider == "openai"
+    assert third.llm.model == "other"
+
+
+def test_load_config_returns_independent_instances(tmp_path: Path) -> None:
+    """Mutating one loaded config does not leak into later loads."""
+    global_cfg = tmp_path / "global.yaml"
+    global_cfg.write_text("daemon:\n  debounce_seconds: 5.0\n")
+
+    first = load_config(project_root=None, global_config_path=global_cfg)
+    first.daemon.debounce_seconds = 99.0
+
+    second = load_config(project_root=None, global_config_path=global_cfg)
+    assert second.daemon.debounce_seconds == 5.0
+
+
+def test_load_yaml_reads_utf8_bytes(tmp_path: Path) -> None:
+    """Config files are decoded as UTF-8 regardless of the locale encoding."""
+    path = tmp_path / "config.yaml"
+    path.write_bytes("project_name: café\n".encode())
+
+    assert _load_yaml(path) == {"project_name": "café"}
+
+
+def test_load_config_reads_project_toml(tmp_path: Path) -> None:
+    """A .lexibrary/config.toml is loaded and takes precedence over config.yaml."""
+    config_dir = tmp_path / ".lexibrary"
+    config_dir.mkdir()
+    (config_dir / "config.yaml").write_text("llm:\n  provider: openai\n")
+    (config_dir / "config.toml").write_text('[llm]\nprovider = "ollama"\n')
+
+    config = load_config(project_root=tmp_path, global_config_path=tmp_path / "missing.yaml")
+    assert config.llm.provider == "ollama"
+
+
+def test_find_config_file_finds_toml(tmp_path: Path) -> None:
+    """find_config_file discovers a TOML project config from a subdirectory."""
+    (tmp_path / ".lexibrary").mkdir()
+    (tmp_path / ".lexibrary" / "config.toml").write_text("")
+    nested = tmp_path / "src" / "pkg"
+    nested.mkdir(parents=True)
+
+    assert find_config_file(nested) == tmp_path.resolve() / ".lexibrary" / "config.toml"
+
+
+def test_parsed_config_cache_is_bounded(tmp_path: Path) -> None:
+    """The parsed-file cache evicts least recently used entries past its limit."""
+    paths = []
+    for i in range(loader._PARSED_CACHE_MAXSIZE + 5):
+        path = tmp_path / f"global{i}.yaml"
+        path.write_text(f"project_name: p{i}\n")
+        paths.append(path)
+        load_config(project_root=None, global_config_path=path)
+
+    assert len(loader._parsed_cache) <= loader._PARSED_CACHE_MAXSIZE
+    assert paths[-1] in loader._parsed_cache
+    assert paths[0] not in loader._parsed_cache
+
+
+def test_find_config_file_prefers_nearest_ancestor(tmp_path: Path) -> None:
+    """The closest .lexibrary/ config wins over ones further up the tree."""
+    (tmp_path / ".lexibrary").mkdir()
+    (tmp_path / ".lexibrary" / "config.yaml").write_text("")
+    inner = tmp_path / "sub"
+    (inner / ".lexibrary").mkdir(parents=True)
+    (inner / ".lexibrary" / "config.yaml").write_text("")
+
+    found = find_config_file(inner)
+    assert found == inner.resolve() / ".lexibrary" / "config.yaml"
+
+
+def test_find_config_file_sees_configs_created_later(tmp_path: Path) -> None:
+    """A nearer or higher-precedence config created between lookups is found."""
+    (tmp_path / ".lexibrary").mkdir()
+    (tmp_path / ".lexibrary" / "config.yaml").write_text("")
+    sub = tmp_path / "sub"
+    sub.mkdir()
+    assert find_config_file(sub) == tmp_path.resolve() / ".lexibrary" / "config.yaml"
+
+    (tmp_path / ".lexibrary" / "config.toml").write_text("")
+    assert find_config_file(sub) == tmp_path.resolve() / ".lexibrary" / "config.toml"
+
+    (sub / ".lexibrary").mkdir()
+    (sub / ".lexibrary" / "config.yaml").write_text("")
+    assert find_config_file(sub) == sub.resolve() / ".lexibrary" / "config.yaml"
+
+
+def test_importing_loader_does_not_build_schema() -> None:
+    """The Pydantic schema is only imported once a config is loaded."""
+    code = (
+        "import sys; import lexibrarian.config.loader; "
+        "print('lexibrarian.config.schema' in sys.modules)"
+    )
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    proc = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env
+    )
+    assert proc.stdout.strip() == "False"
+
+
+def test_package_exports_resolve_lazily() -> None:
+    """Names re-exported from lexibrarian.config still resolve."""
+    import lexibrarian.config as config_pkg
+
+    assert config_pkg.LexibraryConfig is LexibraryConfig
+    assert config_pkg.load_config is load_config
@@ -110,6 +110,21 @@ def test_invalid_type_raises_validation_error() -> None:
         LLMConfig(max_retries="not_a_number")  # type: ignore[arg-type]
 
 
+@pytest.mark.parametrize(
+    "override",
+    [{"rpm_limit": 0}, {"rpm_limit": -5}, {"tpm_limit": 0}, {"tpm_limit": -1000}],
+)
+def test_rate_limits_must_be_positive(override: dict[str, int]) -> None:
+    with pytest.raises(ValidationError):
+        LLMConfig.model_validate(override)
+
+
+def test_rate_limits_accept_positive_and_unset_tpm() -> None:
+    config = LLMConfig(rpm_limit=10, tpm_limit=None)
+    assert config.rpm_limit == 10
+    assert config.tpm_limit is None
+
+
 def test_extra_fields_ignored() -> None:
     config = LLMConfig.model_validate({"provider": "x", "unknown": "y"})
     assert config.provider == "x"
@@ -124,7 +139,12 @@ def test_crawl_config_defaults() -> None:
 
 def test_crawl_config_custom_extensions() -> None:
     config = LexibraryConfig.model_validate({"crawl": {"binary_extensions": [".bin"]}})
-    assert config.crawl.binary_extensions == [".bin"]
+    assert config.crawl.binary_extensions == frozenset({".bin"})
+
+
+def test_crawl_config_binary_extensions_dump_sorted() -> None:
+    config = CrawlConfig.model_validate({"binary_extensions": [".zip", ".bin", ".png"]})
+    assert config.model_dump()["binary_extensions"] == [".bin", ".png", ".zip"]
 
 
 def test_crawl_config_extra_fields_ignored() -> None:
@@ -3,9 +3,15 @@
 from __future__ import annotations
 
 import json
+import os
+from dataclasses import asdict
 from pathlib import Path
+from unittest.mock import patch
 
-from lexibrarian.crawler.change_detector import ChangeDetector
+import pytest
+
+from lexibrarian.crawler.change_detector import ChangeDetector, FileState
+from lexibrarian.utils.hashing import hash_file
 
 
 def test_new_file_detected_as_changed(tmp_path: Path) -> None:
@@ -80,6 +86,17 @@ def test_corrupted_cache_starts_fresh(tmp_path: Path) -> None:
     assert detector.get_cached(Path("anything")) is None
 
 
+def test_non_object_cache_starts_fresh(tmp_path: Path) -> None:
+    """A cache file holding valid JSON that is not an object is discarded."""
+    cache_path = tmp_path / "cache.json"
+    cache_path.write_text("[]", encoding="utf-8")
+
+    detector = ChangeDetector(cache_path)
+    detector.load()
+
+    assert detector.get_cached(Path("anything")) is None
+
+
 def test_wrong_version_starts_fresh(tmp_path: Path) -> None:
     """Cache with incompatible version results in empty cache."""
     cache_path = tmp_path / "cache.json"
@@ -139,3 +156,246 @@ def test_update_stores_iso_timestamp(tmp_path: Path) -> None:
     from datetime import datetime
 
     datetime.fromisoformat(cached.last_indexed)
+
+
+def _age(path: Path, seconds: int = 60) -> None:
+    """Backdate *path*'s mtime so it falls outside the racy-stat window."""
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns - seconds * 1_000_000_000))
+
+
+def _index(detector: ChangeDetector, path: Path) -> None:
+    """Mimic the crawler: check, then record the file's current hash."""
+    assert detector.has_changed(path) is True
+    detector.update(path, hash_file(path), tokens=1, summary="s")
+
+
+def test_matching_stat_skips_hashing(tmp_path: Path) -> None:
+    """A file whose mtime and size match the cache is not read."""
+    f = tmp_path / "stable.py"
+    f.write_text("pass\n")
+    _age(f)
+    detector = ChangeDetector(tmp_path / "cache.json")
+    detector.update(f, "stale", tokens=1, summary="s")
+    _index(detector, f)
+
+    with patch("lexibrarian.crawler.change_detector.hash_file") as mock_hash:
+        assert detector.has_changed(f) is False
+    mock_hash.assert_not_called()
+
+
+def test_same_size_edit_with_new_mtime_is_detected(tmp_path: Path) -> None:
+    """An edit that keeps the size but moves the mtime is re-hashed."""
+    f = tmp_path / "mod.py"
+    f.write_text("v1\n")
+    _age(f, 120)
+    detector = ChangeDetector(tmp_path / "cache.json")
+    detector.update(f, "stale", tokens=1, summary="s")
+    _index(detector, f)
+
+    f.write_text("v2\n")
+    _age(f)
+    assert detector.has_changed(f) is True
+
+
+def test_recent_mtime_is_not_trusted(tmp_path: Path) -> None:
+    """Files modified within the racy window are always re-hashed."""
+    f = tmp_path / "fresh.py"
+    f.write_text("pass\n")
+    detector = ChangeDetector(tmp_path / "cache.json")
+    detector.update(f, "stale", tokens=1, summary="s")
+    _index(detector, f)
+
+    with patch("lexibrarian.crawler.change_detector.hash_file", wraps=hash_file) as mock_hash:
+        assert detector.has_changed(f) is False
+    mock_hash.assert_called_once()
+
+
+def test_legacy_entries_without_stat_load_and_rehash(tmp_path: Path) -> None:
+    """Caches written before stat fields existed still load."""
+    f = tmp_path / "old.py"
+    f.write_text("pass\n")
+    _age(f)
+    cache_path = tmp_path / "cache.json"
+    entry = {"hash": hash_file(f), "tokens": 1, "summary": "s", "last_indexed": "x"}
+    cache_path.write_text(json.dumps({"version": 1, "files": {str(f): entry}}))
+
+    detector = ChangeDetector(cache_path)
+    detector.load()
+    assert detector.has_changed(f) is False
+    cached = detector.get_cached(f)
+    assert cached is not None
+    assert cached.mtime_ns == f.stat().st_mtime_ns
+
+
+def test_check_many_matches_has_changed_across_thread_pool(tmp_path: Path) -> None:
+    """Batch checks agree with per-file checks, including the threaded path."""
+    detector = ChangeDetector(tmp_path / "cache.json")
+    files = []
+    for i in range(40):
+        f = tmp_path / f"f{i}.py"
+        f.write_text(f"v{i}\n")
+        files.append(f)
+        if i % 4:  # every fourth file stays uncached (new)
+            detector.update(f, hash_file(f), tokens=1, summary="s")
+    for f in files[:10]:
+        f.write_text("edited\n")
+    missing = tmp_path / "gone.py"
+    detector.update(missing, "h", tokens=1, summary="s")
+
+    results = detector.check_many([*files, missing])
+
+    expected = {f: (i % 4 == 0 or i < 10) for i, f in enumerate(files)}
+    expected[missing] = True
+    assert results == expected
+    assert all(detector.has_changed(f) == changed for f, changed in expected.items())
+
+
+def test_file_state_as_dict_matches_asdict() -> None:
+    """FileState.as_dict covers every dataclass field."""
+    state = FileState(hash="h", tokens=3, summary="s", last_indexed="t", mtime_ns=5, size=7)
+    assert state.as_dict() == asdict(state)
+
+
+def test_loaded_entries_share_timestamp_strings(tmp_path: Path) -> None:
+    """Entries written in one sweep share a single last_indexed string after load."""
+    cache_path = tmp_path / "cache.json"
+    entry = {"hash": "h", "tokens": 1, "summary": "s", "last_indexed": "2025-01-01T00:00:00"}
+    files = {"/a.py": dict(entry), "/b.py": dict(entry)}
+    cache_path.write_text(json.dumps({"version": 1, "files": files}))
+
+    detector = ChangeDetector(cache_path)
+    detector.load()
+    a = detector.get_cached(Path("/a.py"))
+    b = detector.get_cached(Path("/b.py"))
+    assert a is not None and b is not None
+    assert a.last_indexed is b.last_indexed
+    assert not hasattr(a, "__dict__")
+
+
+def test_updates_within_a_sweep_share_one_timestamp(tmp_path: Path) -> None:
+    """Entries written between begin_sweep and end_sweep reuse the sweep's timestamp."""
+    detector = ChangeDetector(tmp_path / "cache.json")
+    detector.begin_sweep()
+    detector.update(tmp_path / "a.py", "h1", tokens=1, summary="")
+    detector.update(tmp_path / "b.py", "h2", tokens=1, summary="")
+    detector.end_sweep()
+
+    a = detector.get_cached(tmp_path / "a.py")
+    b = detector.get_cached(tmp_path / "b.py")
+    assert a is not None and b is not None
+    assert a.last_indexed is b.last_indexed
+
+    detector.update(
+        tmp_path / "c.py", "h3", tokens=1, summary="", last_indexed="2020-01-01T00:00:00"
+    )
+    c = detector.get_cached(tmp_path / "c.py")
+    assert c is not None
+    assert c.last_indexed == "2020-01-01T00:00:00"
+
+
+def test_failed_save_keeps_previous_cache(tmp_path: Path) -> None:
+    """A save interrupted before the swap leaves the old cache file intact."""
+    cache_path = tmp_path / "cache.json"
+    detector = ChangeDetector(cache_path)
+    detector.update(tmp_path / "a.py", "h1", tokens=1, summary="")
+    detector.save()
+    before = cache_path.read_bytes()
+
+    detector.clear()  # forces a snapshot rewrite
+    with (
+        patch("lexibrarian.utils.atomic.os.replace", side_effect=OSError("disk full")),
+        pytest.raises(OSError),
+    ):
+        detector.save()
+
+    assert cache_path.read_bytes() == before
+    assert [p.name for p in tmp_path.iterdir()] == ["cache.json"]
+
+
+def test_incremental_save_appends_to_journal(tmp_path: Path) -> None:
+    """Saves after the first append changed entries instead of rewriting the snapshot."""
+    cache_path = tmp_path / "cache.json"
+    detector = ChangeDetector(cache_path)
+    detector.update(Path("/a.py"), "h1", tokens=1, summary="a")
+    detector.update(Path("/b.py"), "h2", tokens=1, summary="b")
+    detector.save()
+    snapshot = cache_path.read_bytes()
+
+    detector.update(Path("/a.py"), "h1-new", tokens=2, summary="a2")
+    detector.prune_deleted({"/a.py"})
+    detector.save()
+
+    assert cache_path.read_bytes() == snapshot
+    journal = tmp_path / "cache.json.journal"
+    assert len(journal.read_bytes().splitlines()) == 2
+
+    reloaded = ChangeDetector(cache_path)
+    reloaded.load()
+    a = reloaded.get_cached(Path("/a.py"))
+    assert a is not None
+    assert (a.hash, a.tokens, a.summary) == ("h1-new", 2, "a2")
+    assert reloaded.get_cached(Path("/b.py")) is None
+
+
+def test_torn_journal_tail_is_ignored_and_compacted(tmp_path: Path) -> None:
+    """A partially written journal record is dropped; earlier records still apply."""
+    cache_path = tmp_path / "cache.json"
+    detector = ChangeDetector(cache_path)
+    detector.update(Path("/a.py"), "h1", tokens=1, summary="a")
+    detector.save()
+    detector.update(Path("/b.py"), "h2", tokens=1, summary="b")
+    detector.save()
+    journal = tmp_path / "cache.json.journal"
+    with journal.open("ab") as f:
+        f.write(b'{"path": "/c.py", "sta')
+
+    reloaded = ChangeDetector(cache_path)
+    reloaded.load()
+    assert reloaded.get_cached(Path("/b.py")) is not None
+    assert reloaded.get_cached(Path("/c.py")) is None
+
+    reloaded.save()
+    assert not journal.exists()
+    assert set(json.loads(cache_path.read_text(encoding="utf-8"))["files"]) == {"/a.py", "/b.py"}
+
+
+def test_long_journal_is_compacted(tmp_path: Path) -> None:
+    """Once the journal outgrows the cache it is folded back into the snapshot."""
+    cache_path = tmp_path / "cache.json"
+    detector = ChangeDetector(cache_path)
+    detector.update(Path("/a.py"), "h0", tokens=1, summary="a")
+    detector.save()
+
+    with patch("lexibrarian.crawler.change_detector._JOURNAL_COMPACT_MIN", 3):
+        for i in range(1, 5):
+            detector.update(Path("/a.py"), f"h{i}", tokens=1, summary="a")
+            detector.save()
+
+    journal = tmp_path / "cache.json.journal"
+    assert not journal.exists()
+    data = json.loads(cache_path.read_text(encoding="utf-8"))
+    assert data["files"]["/a.py"]["hash"] == "h4"
+
+
+def test_unrecorded_change_is_not_rehashed(tmp_path: Path) -> None:
+    """A changed file left unrecorded (e.g. a failed summary) is not hashed again."""
+    f = tmp_path / "edited.py"
+    f.write_text("v1\n")
+    _age(f)
+    detector = ChangeDetector(tmp_path / "cache.json")
+    _index(detector, f)
+
+    f.write_text("v2 longer\n")
+    _age(f)
+    assert detector.has_changed(f) is True
+
+    with patch("lexibrarian.crawler.change_detector.hash_file", wraps=hash_file) as mock_hash:
+        assert detector.has_changed(f) is True
+    mock_hash.assert_not_called()
+
+    f.write_text("v3 longer still\n")
+    _age(f)
+    with patch("lexibrarian.crawler.change_detector.hash_file", wraps=hash_file) as mock_hash:
+        assert detector.has_changed(f) is True
+    mock_hash.assert_called_once()
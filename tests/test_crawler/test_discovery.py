@@ -114,3 +114,27 @@ def test_directories_not_listed_as_files(tmp_path: Path) -> None:
 
     assert [f.name for f in indexable] == ["file.txt"]
     assert skipped == []
+
+
+def test_symlinked_files_listed_in_name_order(tmp_path: Path) -> None:
+    """Symlinks to files are listed like files, and results are sorted by name."""
+    (tmp_path / "b.py").write_text("pass\n")
+    (tmp_path / "a.py").symlink_to(tmp_path / "b.py")
+    (tmp_path / "dangling.py").symlink_to(tmp_path / "missing.py")
+
+    matcher = _make_matcher(tmp_path)
+    indexable, skipped = list_directory_files(tmp_path, matcher, binary_extensions=set())
+
+    assert [f.name for f in indexable] == ["a.py", "b.py"]
+    assert skipped == []
+
+
+def test_same_depth_directories_sorted_alphabetically(tmp_path: Path) -> None:
+    """Directories at equal depth are ordered by path."""
+    for name in ("c", "a", "b"):
+        (tmp_path / name).mkdir()
+
+    matcher = _make_matcher(tmp_path)
+    dirs = discover_directories_bottom_up(tmp_path, matcher)
+
+    assert [d.name for d in dirs[:3]] == ["a", "b", "c"]
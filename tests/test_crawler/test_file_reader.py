@@ -4,10 +4,14 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pytest
+
 from lexibrarian.crawler.file_reader import (
     is_binary_file,
+    read_and_hash,
     read_file_for_indexing,
 )
+from lexibrarian.utils.hashing import hash_file
 
 
 def test_text_file_not_binary(tmp_path: Path) -> None:
@@ -61,15 +65,24 @@ def test_read_binary_file_returns_none(tmp_path: Path) -> None:
     assert result is None
 
 
-def test_read_latin1_fallback(tmp_path: Path) -> None:
-    """Files that fail UTF-8 but pass Latin-1 are read with Latin-1."""
+def test_read_invalid_utf8_replaced(tmp_path: Path) -> None:
+    """Bytes that are not valid UTF-8 are replaced, not re-decoded as Latin-1."""
     f = tmp_path / "latin.txt"
     # Latin-1 character not valid in UTF-8
     f.write_bytes(b"caf\xe9\n")
     result = read_file_for_indexing(f)
     assert result is not None
-    assert result.encoding == "latin-1"
-    assert "caf" in result.content
+    assert result.encoding == "utf-8"
+    assert result.content == "caf\ufffd\n"
+
+
+def test_truncation_mid_character_keeps_rest_of_text(tmp_path: Path) -> None:
+    """A multi-byte character split by truncation only loses that character."""
+    f = tmp_path / "accents.txt"
+    f.write_bytes(b"a" * 1023 + "\u00e9t\u00e9".encode())
+    result = read_file_for_indexing(f, max_size_kb=1)
+    assert result is not None
+    assert result.content == "a" * 1023 + "\ufffd"
 
 
 def test_read_unreadable_file_returns_none(tmp_path: Path) -> None:
@@ -97,3 +110,71 @@ def test_file_content_size_bytes(tmp_path: Path) -> None:
     result = read_file_for_indexing(f)
     assert result is not None
     assert result.size_bytes == len(content.encode("utf-8"))
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"",
+        "caf\u00e9\n".encode(),
+        b"caf\xe9\n",
+        b"\x89PNG\r\n\x1a\n\x00\x00",
+        b"line\n" * 300_000,
+    ],
+    ids=["empty", "utf8", "latin1", "binary", "truncated"],
+)
+def test_read_and_hash_matches_separate_calls(tmp_path: Path, data: bytes) -> None:
+    """read_and_hash agrees with hash_file plus read_file_for_indexing."""
+    f = tmp_path / "file"
+    f.write_bytes(data)
+
+    file_hash, content = read_and_hash(f, max_size_kb=1)
+
+    assert file_hash == hash_file(f)
+    assert content == read_file_for_indexing(f, max_size_kb=1)
+
+
+def test_read_and_hash_missing_file_raises(tmp_path: Path) -> None:
+    """A file that cannot be opened raises OSError, like hash_file."""
+    with pytest.raises(OSError):
+        read_and_hash(tmp_path / "missing.txt")
+
+
+def test_truncated_read_reports_full_size(tmp_path: Path) -> None:
+    """A truncated read still reports the size of the whole file."""
+    f = tmp_path / "big.log"
+    f.write_bytes(b"y" * (1024 * 1024))
+
+    result = read_file_for_indexing(f, max_size_kb=1)
+
+    assert result is not None
+    assert result.size_bytes == 1024 * 1024
+    assert len(result.content) == 1024
+    assert result.is_truncated is True
+
+
+def test_reused_read_buffer_does_not_leak_previous_content(tmp_path: Path) -> None:
+    """A short file read after a long one returns only its own bytes."""
+    long_file = tmp_path / "long.txt"
+    long_file.write_text("L" * 5000, encoding="utf-8")
+    short_file = tmp_path / "short.txt"
+    short_file.write_text("short\n", encoding="utf-8")
+
+    first = read_file_for_indexing(long_file, max_size_kb=8)
+    second = read_file_for_indexing(short_file, max_size_kb=1)
+
+    assert first is not None and first.content == "L" * 5000
+    assert second is not None and second.content == "short\n"
+    assert second.size_bytes == 6
+
+
+def test_null_byte_after_binary_check_window_is_text(tmp_path: Path) -> None:
+    """Only the first 8 KiB decide binary-ness, as with is_binary_file."""
+    f = tmp_path / "late_null.txt"
+    f.write_bytes(b"a" * 9000 + b"\x00tail")
+
+    result = read_file_for_indexing(f, max_size_kb=16)
+
+    assert is_binary_file(f) is False
+    assert result is not None
+    assert result.content.endswith("\x00tail")
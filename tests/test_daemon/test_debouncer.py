@@ -100,3 +100,73 @@ def test_callback_exception_is_contained() -> None:
     debouncer.notify(Path("/b"))
     assert second_fired.wait(timeout=2.0)
     assert call_count == 2
+
+
+def test_burst_uses_a_single_worker_thread() -> None:
+    """A burst of notifications starts one worker, which exits after firing."""
+    fired = threading.Event()
+    debouncer = Debouncer(delay=0.05, callback=lambda dirs: fired.set())
+
+    before = threading.active_count()
+    for i in range(50):
+        debouncer.notify(Path(f"/d{i}"))
+    assert threading.active_count() <= before + 1
+
+    assert fired.wait(timeout=2.0)
+    deadline = time.monotonic() + 2.0
+    while debouncer._worker is not None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert debouncer._worker is None
+
+
+def test_overflow_replaces_directory_callback() -> None:
+    """Exceeding max_pending drops the directory set and fires on_overflow once."""
+    fired = threading.Event()
+    callback = MagicMock()
+    on_overflow = MagicMock(side_effect=lambda: fired.set())
+    debouncer = Debouncer(delay=0.05, callback=callback, max_pending=3, on_overflow=on_overflow)
+
+    for i in range(10):
+        debouncer.notify(Path(f"/d{i}"))
+    assert len(debouncer._pending) == 0
+
+    assert fired.wait(timeout=2.0)
+    time.sleep(0.05)
+    on_overflow.assert_called_once_with()
+    callback.assert_not_called()
+
+
+def test_within_max_pending_fires_directories() -> None:
+    """Bursts within max_pending still deliver the individual directories."""
+    fired = threading.Event()
+    received: list[set[Path]] = []
+
+    def callback(dirs: set[Path]) -> None:
+        received.append(dirs)
+        fired.set()
+
+    on_overflow = MagicMock()
+    debouncer = Debouncer(delay=0.05, callback=callback, max_pending=3, on_overflow=on_overflow)
+    for name in ("/a", "/b", "/a"):
+        debouncer.notify(Path(name))
+
+    assert fired.wait(timeout=2.0)
+    assert received == [{Path("/a"), Path("/b")}]
+    on_overflow.assert_not_called()
+
+
+def test_string_and_path_notifications_coalesce() -> None:
+    """A directory notified as str and as Path is delivered once, as a Path."""
+    fired = threading.Event()
+    received: list[set[Path]] = []
+
+    def callback(dirs: set[Path]) -> None:
+        received.append(dirs)
+        fired.set()
+
+    debouncer = Debouncer(delay=0.05, callback=callback)
+    debouncer.notify("/a")
+    debouncer.notify(Path("/a"))
+
+    assert fired.wait(timeout=2.0)
+    assert received == [{Path("/a")}]
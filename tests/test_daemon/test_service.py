@@ -4,8 +4,11 @@ from __future__ import annotations
 
 import os
 import signal
+import threading
 from pathlib import Path
 
+import pytest
+
 from lexibrarian.daemon.service import _PID_FILENAME, DaemonService
 
 
@@ -22,6 +25,18 @@ def test_pid_file_created_on_start(tmp_path: Path) -> None:
     svc._remove_pid_file()
 
 
+def test_pid_file_replaces_stale_pid_atomically(tmp_path: Path) -> None:
+    """A stale PID file is replaced whole and no temp file is left behind."""
+    pid_path = tmp_path / _PID_FILENAME
+    pid_path.write_text("9999999", encoding="utf-8")
+
+    svc = DaemonService(root=tmp_path)
+    svc._write_pid_file()
+
+    assert pid_path.read_text(encoding="utf-8") == str(os.getpid())
+    assert sorted(p.name for p in tmp_path.iterdir()) == [_PID_FILENAME]
+
+
 def test_pid_file_removed_on_stop(tmp_path: Path) -> None:
     """PID file is removed when the daemon stops."""
     pid_path = tmp_path / _PID_FILENAME
@@ -50,6 +65,51 @@ def test_signal_handler_triggers_shutdown(tmp_path: Path) -> None:
     assert svc._shutdown_event.is_set()
 
 
+@pytest.mark.skipif(not hasattr(signal, "sigwait"), reason="requires signal.sigwait")
+def test_signal_thread_triggers_shutdown(tmp_path: Path) -> None:
+    """A blocked SIGTERM is picked up by the sigwait thread and sets the event."""
+    svc = DaemonService(root=tmp_path)
+
+    # Install from a helper thread so the test runner's own mask is untouched
+    installer = threading.Thread(target=svc._install_signal_handling)
+    installer.start()
+    installer.join()
+    assert svc._signal_thread is not None
+    assert svc._signal_thread.ident is not None
+
+    signal.pthread_kill(svc._signal_thread.ident, signal.SIGTERM)
+
+    assert svc._shutdown_event.wait(timeout=2.0)
+    svc._signal_thread.join(timeout=2.0)
+    assert not svc._signal_thread.is_alive()
+
+
+@pytest.mark.skipif(not hasattr(signal, "sigwait"), reason="requires signal.sigwait")
+def test_stop_restores_signal_mask(tmp_path: Path) -> None:
+    """stop() unblocks SIGTERM/SIGINT again and ends the sigwait thread."""
+    svc = DaemonService(root=tmp_path)
+    masks: dict[str, set[int]] = {}
+
+    # Run in a helper thread: the mask is per-thread and must not leak into the runner
+    def _install_and_stop() -> None:
+        masks["before"] = set(signal.pthread_sigmask(signal.SIG_BLOCK, []))
+        svc._install_signal_handling()
+        masks["installed"] = set(signal.pthread_sigmask(signal.SIG_BLOCK, []))
+        svc.stop()
+        masks["after"] = set(signal.pthread_sigmask(signal.SIG_BLOCK, []))
+
+    installer = threading.Thread(target=_install_and_stop)
+    installer.start()
+    installer.join(timeout=10.0)
+
+    assert {signal.SIGTERM, signal.SIGINT} <= masks["installed"]
+    assert masks["after"] == masks["before"]
+    assert svc._signal_thread is None
+    assert not any(t.name == "lexibrarian-signals" for t in threading.enumerate())
+    # Waking the waiter is not mistaken for a shutdown request
+    assert not svc._shutdown_event.is_set()
+
+
 def test_shutdown_completes_with_none_components(tmp_path: Path) -> None:
     """stop() completes without error when no components are initialized."""
     svc = DaemonService(root=tmp_path)
@@ -2,11 +2,22 @@
 
 from __future__ import annotations
 
+import asyncio
+import os
+import threading
 import time
+from concurrent.futures import CancelledError
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
-from lexibrarian.daemon.service import DaemonService, _has_changes
+from lexibrarian.config.schema import LexibraryConfig
+from lexibrarian.daemon.service import (
+    DaemonService,
+    _has_changes,
+    _scan,
+    _write_last_sweep,
+)
+from lexibrarian.ignore import create_ignore_matcher
 
 # ---------------------------------------------------------------------------
 # _has_changes tests
@@ -66,6 +77,65 @@ class TestHasChanges:
         last_sweep = f.stat().st_mtime - 10
         assert _has_changes(tmp_path, last_sweep) is True
 
+    def test_skips_lexibrary_through_symlinked_root(self, tmp_path: Path) -> None:
+        """The .lexibrary/ skip still applies when *root* is reached via a symlink."""
+        project = tmp_path / "project"
+        (project / ".lexibrary").mkdir(parents=True)
+        f = project / ".lexibrary" / "something.md"
+        f.write_text("design file", encoding="utf-8")
+        link = tmp_path / "link"
+        link.symlink_to(project, target_is_directory=True)
+
+        last_sweep = f.stat().st_mtime - 10
+        assert _has_changes(link, last_sweep) is False
+
+    def test_service_check_uses_precomputed_paths(self, tmp_path: Path) -> None:
+        """The service's check skips .lexibrary/ via the strings resolved at construction."""
+        (tmp_path / ".lexibrary").mkdir()
+        f = tmp_path / ".lexibrary" / "design.md"
+        f.write_text("design", encoding="utf-8")
+        svc = DaemonService(root=tmp_path)
+        assert svc._lexibrary_abs_str == str(tmp_path.resolve() / ".lexibrary")
+
+        svc._last_sweep = f.stat().st_mtime - 10
+        assert svc._has_changes(LexibraryConfig()) is False
+        (tmp_path / "hello.py").write_text("x = 1", encoding="utf-8")
+        assert svc._has_changes(LexibraryConfig()) is True
+
+    def test_parallel_scan_finds_file_in_any_subtree(self, tmp_path: Path) -> None:
+        """With several top-level directories, a newer file in any one is found."""
+        for name in ("a", "b", "c", "d"):
+            (tmp_path / name / "deep").mkdir(parents=True)
+            (tmp_path / name / "deep" / "old.py").write_text("x", encoding="utf-8")
+        newest = tmp_path / "c" / "deep" / "new.py"
+        newest.write_text("y", encoding="utf-8")
+        mtime = newest.stat().st_mtime
+        for old in tmp_path.glob("*/deep/old.py"):
+            os.utime(old, (mtime - 100, mtime - 100))
+
+        assert _has_changes(tmp_path, mtime - 10) is True
+        os.utime(newest, (mtime - 100, mtime - 100))
+        assert _has_changes(tmp_path, mtime - 10) is False
+
+    def test_stopped_scan_returns_false(self, tmp_path: Path) -> None:
+        """A walker whose stop event is set gives up without reporting a change."""
+        (tmp_path / "new.py").write_text("x", encoding="utf-8")
+        stop = threading.Event()
+        stop.set()
+        assert _scan(str(tmp_path), str(tmp_path / ".lexibrary"), 0.5, stop=stop) is False
+
+    def test_matcher_prunes_ignored_directories(self, tmp_path: Path) -> None:
+        """Directories the ignore matcher would not descend into are skipped."""
+        git_dir = tmp_path / ".git"
+        git_dir.mkdir()
+        f = git_dir / "index"
+        f.write_text("x", encoding="utf-8")
+        last_sweep = f.stat().st_mtime - 10
+
+        matcher = create_ignore_matcher(LexibraryConfig(), tmp_path)
+        assert _has_changes(tmp_path, last_sweep) is True
+        assert _has_changes(tmp_path, last_sweep, matcher) is False
+
 
 # ---------------------------------------------------------------------------
 # DaemonService.run_once tests
@@ -87,7 +157,7 @@ class TestRunOnce:
         config.scope_root = "."
         return config
 
-    @patch("lexibrarian.daemon.service.update_project")
+    @patch("lexibrarian.daemon.service.update_project", new_callable=MagicMock)
     @patch("lexibrarian.daemon.service.setup_daemon_logging")
     @patch("lexibrarian.daemon.service.load_config")
     def test_run_once_skips_when_no_changes(
@@ -110,7 +180,7 @@ class TestRunOnce:
         mock_update_project.assert_not_called()
 
     @patch("lexibrarian.daemon.service._current_time", return_value=1000.0)
-    @patch("lexibrarian.daemon.service.update_project")
+    @patch("lexibrarian.daemon.service.update_project", new_callable=MagicMock)
     @patch("lexibrarian.daemon.service.setup_daemon_logging")
     @patch("lexibrarian.daemon.service.load_config")
     def test_run_once_runs_when_changes_detected(
@@ -140,7 +210,7 @@ class TestRunOnce:
         assert svc._last_sweep == 1000.0
 
     @patch("lexibrarian.daemon.service._current_time", return_value=2000.0)
-    @patch("lexibrarian.daemon.service.update_project")
+    @patch("lexibrarian.daemon.service.update_project", new_callable=MagicMock)
     @patch("lexibrarian.daemon.service.setup_daemon_logging")
     @patch("lexibrarian.daemon.service.load_config")
     def test_run_once_always_runs_when_skip_disabled(
@@ -165,7 +235,7 @@ class TestRunOnce:
         # _last_sweep should have been updated (sweep ran)
         assert svc._last_sweep == 2000.0
 
-    @patch("lexibrarian.daemon.service.update_project")
+    @patch("lexibrarian.daemon.service.update_project", new_callable=MagicMock)
     @patch("lexibrarian.daemon.service.setup_daemon_logging")
     @patch("lexibrarian.daemon.service.load_config")
     def test_run_once_first_run_always_sweeps(
@@ -188,6 +258,155 @@ class TestRunOnce:
         # asyncio.run was called (sweep ran)
 
 
+class TestLastSweepPersistence:
+    """Tests for the last sweep time kept under .lexibrary/."""
+
+    @patch("lexibrarian.daemon.service._current_time", return_value=1234.5)
+    @patch("lexibrarian.daemon.service.update_project", new_callable=MagicMock)
+    def test_full_sweep_time_survives_restart(
+        self,
+        mock_update_project: MagicMock,
+        mock_current_time: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        """A new service picks up the time of the previous full sweep."""
+        (tmp_path / ".lexibrary").mkdir()
+        with patch("lexibrarian.daemon.service.asyncio.run", return_value=MagicMock()):
+            DaemonService(root=tmp_path)._run_sweep(MagicMock())
+
+        assert DaemonService(root=tmp_path)._last_sweep == 1234.5
+
+    def test_missing_lexibrary_dir_is_not_created(self, tmp_path: Path) -> None:
+        """Recording the sweep time never creates .lexibrary/ itself."""
+        _write_last_sweep(tmp_path, 1.0)
+        assert not (tmp_path / ".lexibrary").exists()
+
+    def test_corrupt_file_reads_as_first_run(self, tmp_path: Path) -> None:
+        """An unreadable timestamp falls back to 0.0 (always sweep)."""
+        (tmp_path / ".lexibrary").mkdir()
+        (tmp_path / ".lexibrary" / ".last_sweep").write_text("garbage", encoding="utf-8")
+        assert DaemonService(root=tmp_path)._last_sweep == 0.0
+
+
+# ---------------------------------------------------------------------------
+# Incremental (debounced) sweep tests
+# ---------------------------------------------------------------------------
+
+
+class TestIncrementalSweep:
+    """Tests for _run_sweep() with the debouncer's changed directories."""
+
+    @patch("lexibrarian.daemon.service.update_project", new_callable=MagicMock)
+    @patch("lexibrarian.daemon.service.update_files", new_callable=MagicMock)
+    def test_changed_dirs_update_only_their_files(
+        self,
+        mock_update_files: MagicMock,
+        mock_update_project: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        """Only files directly inside the changed directories are updated."""
+        (tmp_path / "src" / "pkg").mkdir(parents=True)
+        (tmp_path / "src" / "b.py").write_text("b = 1", encoding="utf-8")
+        (tmp_path / "src" / "a.py").write_text("a = 1", encoding="utf-8")
+        (tmp_path / "src" / "pkg" / "c.py").write_text("c = 1", encoding="utf-8")
+        (tmp_path / "other.py").write_text("o = 1", encoding="utf-8")
+
+        svc = DaemonService(root=tmp_path)
+        config = MagicMock()
+        config.llm.response_cache = False
+        with patch.object(svc, "_run_coroutine") as mock_run:
+            svc._run_sweep(config, changed_dirs={tmp_path / "src", tmp_path / "gone"})
+
+        mock_update_project.assert_not_called()
+        files = mock_update_files.call_args.args[0]
+        assert [f.relative_to(tmp_path).as_posix() for f in files] == ["src/a.py", "src/b.py"]
+        mock_run.assert_called_once()
+        # A partial update does not count as a full sweep
+        assert svc._last_sweep == 0.0
+
+
+# ---------------------------------------------------------------------------
+# Shared sweep event loop tests
+# ---------------------------------------------------------------------------
+
+
+class TestSweepLoop:
+    """Tests for the long-lived event loop used by watch-mode sweeps."""
+
+    def test_sweeps_share_one_loop(self, tmp_path: Path) -> None:
+        """Coroutines run on the same loop thread until the loop is stopped."""
+        svc = DaemonService(root=tmp_path)
+        svc._start_loop()
+        try:
+
+            async def _current_loop() -> asyncio.AbstractEventLoop:
+                return asyncio.get_running_loop()
+
+            with patch("lexibrarian.daemon.service.asyncio.run") as mock_run:
+                first = svc._run_coroutine(_current_loop())
+                second = svc._run_coroutine(_current_loop())
+            mock_run.assert_not_called()
+            assert first is second
+        finally:
+            svc._stop_loop()
+
+        assert first.is_closed()
+        assert svc._loop is None
+
+    def test_stop_joins_to_thread_workers(self, tmp_path: Path) -> None:
+        """_stop_loop() waits for to_thread() work still running on the loop."""
+        svc = DaemonService(root=tmp_path)
+        svc._start_loop()
+        workers: list[threading.Thread] = []
+
+        def _slow() -> None:
+            workers.append(threading.current_thread())
+            time.sleep(0.2)
+
+        async def _start_background_work() -> None:
+            asyncio.ensure_future(asyncio.to_thread(_slow))
+            while not workers:
+                await asyncio.sleep(0.01)
+
+        svc._run_coroutine(_start_background_work())
+        svc._stop_loop()
+
+        assert not workers[0].is_alive()
+
+    def test_stop_cancels_in_flight_coroutine(self, tmp_path: Path) -> None:
+        """_stop_loop() cancels a running sweep so its waiting thread returns."""
+        svc = DaemonService(root=tmp_path)
+        svc._start_loop()
+        started = threading.Event()
+        cancelled: list[BaseException] = []
+
+        async def _forever() -> None:
+            started.set()
+            await asyncio.sleep(3600)
+
+        def _sweep() -> None:
+            try:
+                svc._run_coroutine(_forever())
+            except CancelledError as exc:
+                cancelled.append(exc)
+
+        sweeper = threading.Thread(target=_sweep)
+        sweeper.start()
+        assert started.wait(timeout=2.0)
+
+        svc._stop_loop()
+        sweeper.join(timeout=2.0)
+
+        assert not sweeper.is_alive()
+        assert len(cancelled) == 1
+
+    def test_stop_without_loop_is_noop(self, tmp_path: Path) -> None:
+        """_stop_loop() tolerates a service that never started a loop."""
+        svc = DaemonService(root=tmp_path)
+        svc._stop_loop()
+        assert svc._loop is None
+
+
 # ---------------------------------------------------------------------------
 # DaemonService constructor tests
 # ---------------------------------------------------------------------------
@@ -6,10 +6,18 @@ from pathlib import Path
 from unittest.mock import MagicMock, create_autospec
 
 import pathspec
-from watchdog.events import DirCreatedEvent, FileCreatedEvent, FileModifiedEvent
+from watchdog.events import (
+    DirCreatedEvent,
+    FileClosedNoWriteEvent,
+    FileCreatedEvent,
+    FileDeletedEvent,
+    FileModifiedEvent,
+    FileMovedEvent,
+    FileOpenedEvent,
+)
 
 from lexibrarian.daemon.debouncer import Debouncer
-from lexibrarian.daemon.watcher import LexibrarianEventHandler
+from lexibrarian.daemon.watcher import WATCHED_EVENT_TYPES, LexibrarianEventHandler
 from lexibrarian.ignore.matcher import IgnoreMatcher
 
 
@@ -63,7 +71,7 @@ def test_notifies_debouncer_for_valid_changes() -> None:
     event = FileCreatedEvent(src_path="/project/src/main.py")
     handler.on_any_event(event)
 
-    debouncer.notify.assert_called_once_with(Path("/project/src"))
+    debouncer.notify.assert_called_once_with("/project/src")
 
 
 def test_ignores_gitignored_files() -> None:
@@ -77,3 +85,28 @@ def test_ignores_gitignored_files() -> None:
     handler.on_any_event(event)
 
     debouncer.notify.assert_not_called()
+
+
+def test_ignores_open_and_close_events() -> None:
+    """Reads (opened / closed events) never reach the debouncer."""
+    handler, debouncer = _make_handler()
+    handler.dispatch(FileOpenedEvent(src_path="/project/src/main.py"))
+    handler.dispatch(FileClosedNoWriteEvent(src_path="/project/src/main.py"))
+    debouncer.notify.assert_not_called()
+
+
+def test_dispatch_forwards_content_changes() -> None:
+    """dispatch() routes created / modified / deleted / moved events through the filters."""
+    handler, debouncer = _make_handler()
+    for event in (
+        FileModifiedEvent(src_path="/project/src/a.py"),
+        FileDeletedEvent(src_path="/project/src/b.py"),
+        FileMovedEvent(src_path="/project/src/c.py", dest_path="/project/src/d.py"),
+    ):
+        handler.dispatch(event)
+    assert debouncer.notify.call_count == 3
+
+
+def test_watched_event_types_exclude_directories() -> None:
+    """The observer's event filter lets no directory events through."""
+    assert all(not cls.is_directory for cls in WATCHED_EVENT_TYPES)
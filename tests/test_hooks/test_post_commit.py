@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
+import os
+import shutil
 import stat
+import subprocess
+import time
 from pathlib import Path
 
+import pytest
+
 from lexibrarian.hooks.post_commit import (
     HOOK_MARKER,
     HOOK_SCRIPT_TEMPLATE,
@@ -120,6 +126,41 @@ def test_existing_content_preserved_on_append(tmp_path: Path) -> None:
         assert line in content, f"Line '{line}' should be preserved"
 
 
+def test_non_utf8_hook_preserved_on_append(tmp_path: Path) -> None:
+    """A hook that is not valid UTF-8 is appended to byte-for-byte."""
+    root = _make_git_repo(tmp_path)
+    hook_path = root / ".git" / "hooks" / "post-commit"
+    original = b"#!/bin/sh\n# caf\xe9\n"
+    hook_path.write_bytes(original)
+
+    result = install_post_commit_hook(root)
+
+    assert result.installed is True
+    content = hook_path.read_bytes()
+    assert content.startswith(original)
+    assert HOOK_MARKER.encode() in content
+
+
+def test_symlinked_hook_updates_target_and_keeps_link(tmp_path: Path) -> None:
+    """Appending to a symlinked hook rewrites the link's target, not the link."""
+    root = _make_git_repo(tmp_path / "project")
+    shared = tmp_path / "shared-hooks"
+    shared.mkdir()
+    target = shared / "post-commit"
+    target.write_text("#!/bin/sh\necho shared\n")
+    target.chmod(0o755)
+    hook_path = root / ".git" / "hooks" / "post-commit"
+    hook_path.symlink_to(target)
+
+    install_post_commit_hook(root)
+
+    assert hook_path.is_symlink()
+    content = target.read_text()
+    assert content.startswith("#!/bin/sh\necho shared\n")
+    assert HOOK_MARKER in content
+    assert sorted(p.name for p in shared.iterdir()) == ["post-commit"]
+
+
 # ---------------------------------------------------------------------------
 # Idempotent installation
 # ---------------------------------------------------------------------------
@@ -186,7 +227,7 @@ def test_script_uses_git_diff_tree(tmp_path: Path) -> None:
     install_post_commit_hook(root)
 
     content = (root / ".git" / "hooks" / "post-commit").read_text()
-    assert "git diff-tree --no-commit-id --name-only -r HEAD" in content
+    assert "git diff-tree --no-commit-id --name-only -r -z HEAD" in content
 
 
 def test_script_uses_changed_only_flag(tmp_path: Path) -> None:
@@ -198,6 +239,50 @@ def test_script_uses_changed_only_flag(tmp_path: Path) -> None:
     assert "--changed-only" in content
 
 
+@pytest.mark.skipif(shutil.which("git") is None, reason="requires git")
+def test_script_passes_each_changed_file_to_lexictl(tmp_path: Path) -> None:
+    """Running the hook hands every committed file, spaces intact, to lexictl."""
+    root = tmp_path / "repo"
+    root.mkdir()
+    for args in (
+        ["init", "-q"],
+        ["config", "user.email", "dev@example.com"],
+        ["config", "user.name", "Dev"],
+    ):
+        subprocess.run(["git", *args], cwd=root, check=True)
+    (root / "seed.txt").write_text("seed\n")
+    subprocess.run(["git", "add", "."], cwd=root, check=True)
+    subprocess.run(["git", "commit", "-q", "-m", "seed"], cwd=root, check=True)
+    (root / "a b.py").write_text("a = 1\n")
+    (root / "c.py").write_text("c = 1\n")
+    subprocess.run(["git", "add", "."], cwd=root, check=True)
+    subprocess.run(["git", "commit", "-q", "-m", "change"], cwd=root, check=True)
+
+    # Fake lexictl that records its argv, one argument per line
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    record = tmp_path / "argv.txt"
+    fake = bin_dir / "lexictl"
+    fake.write_text(
+        f'#!/bin/sh\nprintf "%s\\n" "$@" > "{record}.tmp"\nmv "{record}.tmp" "{record}"\n'
+    )
+    fake.chmod(0o755)
+
+    env = {**os.environ, "PATH": f"{bin_dir}{os.pathsep}{os.environ['PATH']}"}
+    subprocess.run(["sh", "-c", HOOK_SCRIPT_TEMPLATE], cwd=root, env=env, check=True)
+
+    deadline = time.monotonic() + 10.0
+    while not record.exists() and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert record.read_text().splitlines() == [
+        "update",
+        "--changed-only",
+        "a b.py",
+        "--changed-only",
+        "c.py",
+    ]
+
+
 def test_script_runs_in_background(tmp_path: Path) -> None:
     """Hook script runs lexictl update in the background (&)."""
     root = _make_git_repo(tmp_path)
@@ -247,6 +332,34 @@ def test_creates_hooks_dir_if_missing(tmp_path: Path) -> None:
     assert (tmp_path / ".git" / "hooks" / "post-commit").is_file()
 
 
+# ---------------------------------------------------------------------------
+# Atomic write
+# ---------------------------------------------------------------------------
+
+
+def test_no_temp_files_left_behind(tmp_path: Path) -> None:
+    """Creating and appending leave only the hook file in the hooks dir."""
+    root = _make_git_repo(tmp_path)
+    hooks_dir = root / ".git" / "hooks"
+    (hooks_dir / "post-commit").write_text("#!/bin/sh\necho hi\n")
+
+    install_post_commit_hook(root)
+
+    assert [p.name for p in hooks_dir.iterdir()] == ["post-commit"]
+
+
+def test_append_preserves_existing_permissions(tmp_path: Path) -> None:
+    """Appending keeps the existing hook's permission bits and adds execute."""
+    root = _make_git_repo(tmp_path)
+    hook_path = root / ".git" / "hooks" / "post-commit"
+    hook_path.write_text("#!/bin/sh\necho hi\n")
+    hook_path.chmod(0o700)
+
+    install_post_commit_hook(root)
+
+    assert stat.S_IMODE(hook_path.stat().st_mode) == 0o711
+
+
 # ---------------------------------------------------------------------------
 # Template constant
 # ---------------------------------------------------------------------------
@@ -5,6 +5,7 @@ from __future__ import annotations
 from pathlib import Path
 
 import pathspec
+import pytest
 
 from lexibrarian.config.schema import IgnoreConfig
 from lexibrarian.ignore import create_ignore_matcher
@@ -173,3 +174,158 @@ def test_three_layer_ignore_merge(tmp_path: Path) -> None:
     assert matcher.is_ignored(tmp_path / "scratch.tmp")
     # Not matched by any layer
     assert not matcher.is_ignored(tmp_path / "src" / "main.py")
+
+
+def test_paths_under_root_match_without_resolving(tmp_path: Path) -> None:
+    """Paths already under the resolved root are matched by name, not by link target."""
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    root = tmp_path / "project"
+    root.mkdir()
+    (root / "vendor").symlink_to(outside, target_is_directory=True)
+    spec = pathspec.PathSpec.from_lines("gitignore", ["vendor/"])
+    matcher = IgnoreMatcher(root, spec, [])
+
+    assert matcher.is_ignored(root / "vendor" / "lib.py")
+    assert not matcher.should_descend(root / "vendor")
+
+
+def test_relative_path_outside_root_is_kept(tmp_path: Path) -> None:
+    """Paths outside the root are matched against their own string."""
+    root = tmp_path / "project"
+    root.mkdir()
+    matcher = IgnoreMatcher(root, pathspec.PathSpec.from_lines("gitignore", []), [])
+
+    assert matcher._relative_path(tmp_path / "elsewhere") == str(tmp_path / "elsewhere")
+    assert matcher._relative_path(root / "src", is_dir=True) == "src/"
+
+
+def test_nested_gitignore_applies_through_symlinked_root(tmp_path: Path) -> None:
+    """Gitignore directories found under a symlinked root still scope correctly."""
+    project = tmp_path / "project"
+    (project / "sub").mkdir(parents=True)
+    (project / "sub" / ".gitignore").write_text("*.log\n")
+    link = tmp_path / "link"
+    link.symlink_to(project, target_is_directory=True)
+
+    from lexibrarian.config.schema import LexibraryConfig
+
+    matcher = create_ignore_matcher(LexibraryConfig(), link)
+
+    assert matcher.is_ignored(project / "sub" / "debug.log")
+    assert matcher.is_ignored(link / "sub" / "debug.log")
+    assert not matcher.is_ignored(project / "debug.log")
+
+
+def test_compiled_spec_agrees_with_pathspec() -> None:
+    """The single-regex predicate gives the same answers as PathSpec.match_file."""
+    from lexibrarian.ignore.matcher import _compile_spec
+
+    paths = [
+        "src/main.py",
+        "node_modules/pkg/index.js",
+        "build/",
+        "app/build/out.o",
+        "keep.log",
+        "debug.log",
+        "logs/keep.log",
+        ".lexibrary/src/a.py.md",
+        "/outside/root/debug.log",
+        "docs/README.md",
+    ]
+    for lines in (
+        ["node_modules/", "*.log", "build/", ".lexibrary/**/*.md"],
+        ["*.log", "!keep.log", "/docs/"],
+        ["# only a comment", ""],
+    ):
+        spec = pathspec.PathSpec.from_lines("gitignore", lines)
+        match = _compile_spec(spec)
+        for path in paths:
+            assert match(path) == spec.match_file(path), (lines, path)
+
+
+def test_gitignore_discovery_prunes_ignored_directories(tmp_path: Path) -> None:
+    """Gitignore discovery skips .git/, excluded and already-ignored directories."""
+    from lexibrarian.ignore import load_gitignore_specs
+
+    (tmp_path / ".gitignore").write_text("build/\n")
+    for sub in (".git", "node_modules/pkg", "build", "src/pkg"):
+        (tmp_path / sub).mkdir(parents=True)
+        (tmp_path / sub / ".gitignore").write_text("*.tmp\n")
+
+    exclude = pathspec.PathSpec.from_lines("gitignore", ["node_modules/"])
+    specs = load_gitignore_specs(tmp_path, exclude=exclude)
+
+    assert [directory for directory, _ in specs] == [tmp_path, tmp_path / "src" / "pkg"]
+
+
+def test_gitignore_parsing_skips_comments_and_crlf(tmp_path: Path) -> None:
+    """Comments are never decoded and CRLF line endings parse like LF."""
+    from lexibrarian.ignore import load_gitignore_specs
+
+    (tmp_path / ".gitignore").write_bytes(b"# caf\xe9 (latin-1)\r\n\r\n*.log\r\n!keep.log\r\n")
+
+    [(directory, spec)] = load_gitignore_specs(tmp_path)
+
+    assert directory == tmp_path
+    assert spec.match_file("debug.log")
+    assert not spec.match_file("keep.log")
+
+
+def test_is_ignored_accepts_plain_strings(tmp_path: Path) -> None:
+    """String paths give the same verdicts as Path objects."""
+    spec = pathspec.PathSpec.from_lines("gitignore", ["*.log"])
+    matcher = IgnoreMatcher(tmp_path, spec, [])
+
+    assert matcher.is_ignored(str(tmp_path / "debug.log"))
+    assert not matcher.is_ignored(str(tmp_path / "src" / "main.py"))
+
+
+def test_gitignore_scoping_by_directory(tmp_path: Path) -> None:
+    """Each .gitignore applies to its own subtree only, including one above root."""
+    root = tmp_path / "project"
+    empty = pathspec.PathSpec.from_lines("gitignore", [])
+    specs = [
+        (tmp_path, pathspec.PathSpec.from_lines("gitignore", ["*.bak"])),
+        (root / "a", pathspec.PathSpec.from_lines("gitignore", ["*.log"])),
+        (root / "a" / "b", pathspec.PathSpec.from_lines("gitignore", ["*.tmp"])),
+        (root / "c", pathspec.PathSpec.from_lines("gitignore", ["*.py"])),
+    ]
+    matcher = IgnoreMatcher(root, empty, specs)
+
+    assert matcher.is_ignored(root / "a" / "b" / "x.tmp")
+    assert matcher.is_ignored(root / "a" / "b" / "x.log")
+    assert not matcher.is_ignored(root / "a" / "x.tmp")
+    assert not matcher.is_ignored(root / "ab" / "x.log")
+    assert not matcher.is_ignored(root / "a" / "x.py")
+    assert matcher.is_ignored(root / "c" / "d" / "x.py")
+    assert matcher.is_ignored(root / "x.bak")
+    assert not matcher.should_descend(root / "a" / "b" / "cache.tmp")
+
+
+def test_verdicts_are_cached_until_cleared(tmp_path: Path) -> None:
+    """Repeated checks reuse the cached verdict; clear_cache() forgets it."""
+    spec = pathspec.PathSpec.from_lines("gitignore", ["*.log"])
+    matcher = IgnoreMatcher(tmp_path, spec, [])
+    target = tmp_path / "debug.log"
+
+    assert matcher.is_ignored(target)
+    assert matcher.should_descend(tmp_path / "src")
+    matcher.config_spec = pathspec.PathSpec.from_lines("gitignore", [])
+    matcher._config_match = lambda _path: False
+    assert matcher.is_ignored(str(target))
+
+    matcher.clear_cache()
+    assert not matcher.is_ignored(target)
+
+
+def test_cache_is_bounded(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """The least recently used verdict is evicted once the cache is full."""
+    import lexibrarian.ignore.matcher as matcher_module
+
+    monkeypatch.setattr(matcher_module, "_IGNORE_CACHE_SIZE", 2)
+    matcher = IgnoreMatcher(tmp_path, pathspec.PathSpec.from_lines("gitignore", []), [])
+    for name in ("a", "b", "a", "c"):
+        matcher.is_ignored(tmp_path / name)
+
+    assert list(matcher._ignored_cache) == [str(tmp_path / "a"), str(tmp_path / "c")]
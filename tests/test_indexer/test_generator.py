@@ -49,6 +49,16 @@ class TestGenerateAIndexFiles:
         assert entry.description == "Python source (3 lines)"
         assert entry.entry_type == "file"
 
+    def test_line_count_spans_chunks_and_unterminated_last_line(self, tmp_path: Path) -> None:
+        src = tmp_path / "src"
+        src.mkdir()
+        # Longer than one read chunk, undecodable bytes, no trailing newline
+        body = b"x = 1\n" * 20000 + b"# \xff\xfe"
+        (src / "big.py").write_bytes(body)
+        result = generate_aindex(src, tmp_path, _matcher(tmp_path), _BINARY_EXTS)
+        entry = next(e for e in result.entries if e.name == "big.py")
+        assert entry.description == "Python source (20001 lines)"
+
     def test_binary_file_description(self, tmp_path: Path) -> None:
         src = tmp_path / "src"
         src.mkdir()
@@ -236,6 +246,20 @@ class TestGenerateAIndexMetadata:
         r2 = generate_aindex(src, tmp_path, _matcher(tmp_path), _BINARY_EXTS)
         assert r1.metadata.source_hash != r2.metadata.source_hash
 
+    def test_source_hash_matches_joined_listing(self, tmp_path: Path) -> None:
+        """The batched digest equals SHA-256 of the newline-joined sorted names."""
+        import hashlib
+
+        src = tmp_path / "src"
+        src.mkdir()
+        # More names than one hashing batch
+        names = [f"m{i:04d}.py" for i in range(2500)]
+        for name in names:
+            (src / name).touch()
+        result = generate_aindex(src, tmp_path, _matcher(tmp_path), _BINARY_EXTS)
+        expected = hashlib.sha256("\n".join(sorted(names)).encode("utf-8")).hexdigest()
+        assert result.metadata.source_hash == expected
+
 
 def _create_design_file(tmp_path: Path, rel_source: str, description: str) -> None:
     """Helper: create a minimal design file at the .lexibrary mirror path."""
@@ -2,10 +2,17 @@
 
 from __future__ import annotations
 
+import logging
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
+from typing import Any
 from unittest.mock import MagicMock
 
+import pytest
+
 from lexibrarian.config.schema import LexibraryConfig
+from lexibrarian.indexer import orchestrator
 from lexibrarian.indexer.orchestrator import IndexStats, index_directory, index_recursive
 
 
@@ -254,3 +261,139 @@ class TestIndexRecursive:
         b_idx = order.index("b")
         a_idx = order.index("a")
         assert c_idx < b_idx < a_idx, "Should process c before b before a"
+
+    def test_symlinks_to_lexibrary_skipped_other_symlinks_followed(self, tmp_path: Path) -> None:
+        project_root = _setup_project(tmp_path)
+        src = project_root / "src"
+        src.mkdir()
+        (src / "main.py").write_text("x\n", encoding="utf-8")
+        (project_root / "mirror").symlink_to(project_root / ".lexibrary")
+        (project_root / "linked").symlink_to(src)
+
+        names: list[str] = []
+        index_recursive(
+            project_root,
+            project_root,
+            LexibraryConfig(),
+            progress_callback=lambda current, total, name: names.append(name),
+        )
+
+        assert "mirror" not in names
+        assert "linked" in names
+        assert "src" in names
+
+    def test_discovery_order_is_deterministic(self, tmp_path: Path) -> None:
+        """Directories come deepest-first, in name order within each depth."""
+        project_root = _setup_project(tmp_path)
+        for sub in ("b/y/z", "a/x", "B2"):
+            (project_root / sub).mkdir(parents=True)
+
+        names: list[str] = []
+        index_recursive(
+            project_root,
+            project_root,
+            LexibraryConfig(),
+            progress_callback=lambda current, total, name: names.append(name),
+        )
+
+        assert names == ["z", "x", "y", "a", "b", "B2", project_root.name]
+
+    def test_wide_level_indexed_in_parallel(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A depth level wide enough for the process pool indexes every directory."""
+        # Use the pool even on single-core machines
+        monkeypatch.setattr(orchestrator, "_MAX_INDEX_WORKERS", 2)
+        project_root = _setup_project(tmp_path)
+        pkgs = [f"pkg{i:02d}" for i in range(20)]
+        for name in pkgs:
+            (project_root / name).mkdir()
+            (project_root / name / "mod.py").write_text("x\n", encoding="utf-8")
+
+        names: list[str] = []
+        stats = index_recursive(
+            project_root,
+            project_root,
+            LexibraryConfig(),
+            progress_callback=lambda current, total, name: names.append(name),
+        )
+
+        assert names == [*pkgs, project_root.name]
+        assert stats.directories_indexed == 21
+        assert stats.files_found == 20
+        assert stats.errors == 0
+        for name in pkgs:
+            assert (project_root / ".lexibrary" / name / ".aindex").exists()
+
+    def test_broken_pool_falls_back_to_in_process(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Directories left when a pool worker dies are indexed in-process."""
+
+        class _BreakingExecutor:
+            def map(
+                self, fn: Callable[..., Any], *iterables: Iterable[Any], chunksize: int = 1
+            ) -> Iterator[Any]:
+                for i, args in enumerate(zip(*iterables, strict=True)):
+                    if i == 5:
+                        raise BrokenProcessPool("worker died")
+                    yield fn(*args)
+
+            def shutdown(self) -> None:
+                pass
+
+        monkeypatch.setattr(orchestrator, "_MAX_INDEX_WORKERS", 2)
+        monkeypatch.setattr(orchestrator, "_make_index_executor", _BreakingExecutor)
+        project_root = _setup_project(tmp_path)
+        pkgs = [f"pkg{i:02d}" for i in range(20)]
+        for name in pkgs:
+            (project_root / name).mkdir()
+
+        names: list[str] = []
+        stats = index_recursive(
+            project_root,
+            project_root,
+            LexibraryConfig(),
+            progress_callback=lambda current, total, name: names.append(name),
+        )
+
+        assert names == [*pkgs, project_root.name]
+        assert stats.directories_indexed == 21
+        assert stats.errors == 0
+
+    def test_worker_failure_is_logged(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """A directory that fails to index is counted and its traceback logged."""
+        project_root = _setup_project(tmp_path)
+        (project_root / "src").mkdir()
+        monkeypatch.setattr(
+            orchestrator, "index_directory", MagicMock(side_effect=RuntimeError("boom"))
+        )
+
+        with caplog.at_level(logging.ERROR, logger="lexibrarian.indexer.orchestrator"):
+            stats = index_recursive(project_root, project_root, LexibraryConfig())
+
+        assert stats.errors == 2
+        assert "Failed to index" in caplog.text
+        assert "boom" in caplog.text
+
+    def test_child_aindexes_not_reparsed_within_a_run(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Parents reuse the models just written for their children."""
+        from lexibrarian.indexer import generator
+
+        project_root = _setup_project(tmp_path)
+        (project_root / "a" / "b" / "c").mkdir(parents=True)
+        (project_root / "a" / "b" / "c" / "file.py").write_text("x\n", encoding="utf-8")
+        parse = MagicMock(side_effect=generator.parse_aindex)
+        monkeypatch.setattr(generator, "parse_aindex", parse)
+
+        index_recursive(project_root, project_root, LexibraryConfig())
+
+        parsed = {call.args[0] for call in parse.call_args_list}
+        for rel in ("a", "a/b", "a/b/c"):
+            assert project_root / ".lexibrary" / rel / ".aindex" not in parsed
+        b_aindex = (project_root / ".lexibrary" / "a" / "b" / ".aindex").read_text(encoding="utf-8")
+        assert "Contains 1 files" in b_aindex
@@ -202,6 +202,27 @@ class TestDetectAgentEnvironments:
         result = detect_agent_environments(tmp_path)
         assert result == []
 
+    def test_marker_of_wrong_kind_not_detected(self, tmp_path: Path) -> None:
+        (tmp_path / ".cursor").write_text("", encoding="utf-8")
+        (tmp_path / "AGENTS.md").mkdir()
+        result = detect_agent_environments(tmp_path)
+        assert result == []
+
+    def test_case_variant_follows_filesystem(self, tmp_path: Path) -> None:
+        (tmp_path / "claude.md").touch()
+        result = detect_agent_environments(tmp_path)
+        # Detected exactly when the filesystem itself resolves CLAUDE.md
+        assert ("claude" in result) == (tmp_path / "CLAUDE.md").is_file()
+
+    def test_case_variant_detected_on_case_insensitive_fs(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        (tmp_path / "agents.md").touch()
+        # Simulate a case-insensitive filesystem resolving AGENTS.md
+        monkeypatch.setattr(Path, "is_file", lambda self: self.name.casefold() == "agents.md")
+        result = detect_agent_environments(tmp_path)
+        assert result == ["codex"]
+
 
 # -----------------------------------------------------------------------
 # check_existing_agent_rules
@@ -243,6 +264,17 @@ class TestCheckExistingAgentRules:
         result = check_existing_agent_rules(tmp_path, "codex")
         assert result == str(rules)
 
+    def test_marker_found_in_non_utf8_file(self, tmp_path: Path) -> None:
+        rules = tmp_path / "CLAUDE.md"
+        rules.write_bytes(b"# caf\xe9\n<!-- lexibrarian: managed -->\n")
+        result = check_existing_agent_rules(tmp_path, "claude")
+        assert result == str(rules)
+
+    def test_rules_directory_is_skipped(self, tmp_path: Path) -> None:
+        (tmp_path / ".cursor" / "rules").mkdir(parents=True)
+        result = check_existing_agent_rules(tmp_path, "cursor")
+        assert result is None
+
 
 # -----------------------------------------------------------------------
 # detect_llm_providers
@@ -294,6 +294,14 @@ def test_skeleton_creates_gitignore_with_iwh_pattern(tmp_path: Path) -> None:
     assert IWH_GITIGNORE_PATTERN in content
 
 
+def test_skeleton_gitignores_lexibrary_caches(tmp_path: Path) -> None:
+    """create_lexibrary_skeleton gitignores local JSON caches under .lexibrary/."""
+    create_lexibrary_skeleton(tmp_path)
+
+    lines = (tmp_path / ".gitignore").read_text().splitlines()
+    assert ".lexibrary/.*.json" in lines
+
+
 def test_skeleton_appends_iwh_to_existing_gitignore(tmp_path: Path) -> None:
     """create_lexibrary_skeleton appends IWH pattern to existing .gitignore."""
     gitignore_path = tmp_path / ".gitignore"
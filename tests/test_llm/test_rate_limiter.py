@@ -77,3 +77,43 @@ async def test_custom_rpm() -> None:
     """Custom RPM should set the correct interval."""
     limiter = RateLimiter(requests_per_minute=120)
     assert abs(limiter._interval - 0.5) < 0.001
+
+
+@pytest.mark.asyncio
+async def test_token_budget_within_capacity_is_immediate() -> None:
+    """Calls whose tokens fit in the bucket are limited by RPM only."""
+    limiter = RateLimiter(requests_per_minute=6000, tokens_per_minute=6000)
+    start = time.monotonic()
+    await limiter.acquire(3000)
+    await limiter.acquire(2900)
+    assert time.monotonic() - start < 0.1
+
+
+@pytest.mark.asyncio
+async def test_token_budget_exhaustion_waits_for_refill() -> None:
+    """Once the token bucket is drained, callers wait for it to refill."""
+    limiter = RateLimiter(requests_per_minute=6000, tokens_per_minute=600)  # 10 tokens/s
+    await limiter.acquire(600)
+    start = time.monotonic()
+    await limiter.acquire(5)
+    elapsed = time.monotonic() - start
+    assert elapsed >= 0.5 * 0.9
+
+
+@pytest.mark.asyncio
+async def test_oversized_token_request_is_capped_at_capacity() -> None:
+    """A call costing more than one minute of budget does not block forever."""
+    limiter = RateLimiter(requests_per_minute=6000, tokens_per_minute=600)
+    start = time.monotonic()
+    await limiter.acquire(10_000)
+    assert time.monotonic() - start < 0.1
+
+
+@pytest.mark.asyncio
+async def test_tokens_ignored_without_tpm_limit() -> None:
+    """Without a tokens-per-minute limit, token counts never cause waits."""
+    limiter = RateLimiter(requests_per_minute=6000)
+    start = time.monotonic()
+    for _ in range(3):
+        await limiter.acquire(1_000_000)
+    assert time.monotonic() - start < 0.1
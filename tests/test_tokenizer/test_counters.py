@@ -35,6 +35,12 @@ class TestApproximateCounter:
         counter = ApproximateCounter()
         assert counter.count_file(f) == counter.count(content)
 
+    def test_count_batch(self) -> None:
+        """Batch counting should match per-text counting, in order."""
+        counter = ApproximateCounter()
+        texts = ["a" * 100, "", "abcdefgh"]
+        assert counter.count_batch(texts) == [counter.count(t) for t in texts]
+
     def test_name(self) -> None:
         """Name should identify the backend."""
         counter = ApproximateCounter()
@@ -61,6 +67,12 @@ class TestTiktokenCounter:
         counter = TiktokenCounter()
         assert counter.count_file(f) == counter.count(content)
 
+    def test_count_batch(self) -> None:
+        """Batch counting should match per-text counting, in order."""
+        counter = TiktokenCounter()
+        texts = ["Hello, world!", "", "def f(x):\n    return x\n"]
+        assert counter.count_batch(texts) == [counter.count(t) for t in texts]
+
     def test_encoding_name(self) -> None:
         """Name should contain 'tiktoken'."""
         counter = TiktokenCounter()
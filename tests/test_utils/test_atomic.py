@@ -89,3 +89,10 @@ def test_atomic_write_respects_encoding(tmp_path: Path) -> None:
 
     atomic_write(target, content, encoding="latin-1")
     assert target.read_bytes() == content.encode("latin-1")
+
+
+def test_atomic_write_accepts_bytes(tmp_path: Path) -> None:
+    """atomic_write should write bytes content unchanged."""
+    target = tmp_path / "data.bin"
+    atomic_write(target, b"\x00\xffraw")
+    assert target.read_bytes() == b"\x00\xffraw"
@@ -0,0 +1,81 @@
+"""Tests for the git CLI wrappers."""
+
+from __future__ import annotations
+
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from lexibrarian.utils.git import changed_files_since, dirty_files, head_commit
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(["git", "-C", str(repo), *args], check=True, capture_output=True)
+
+
+def _init_repo(tmp_path: Path) -> Path:
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "config", "user.email", "test@example.com")
+    _git(tmp_path, "config", "user.name", "Test")
+    (tmp_path / "a.py").write_text("a = 1\n")
+    (tmp_path / "b.py").write_text("b = 1\n")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-q", "-m", "initial")
+    return tmp_path
+
+
+def test_head_commit_outside_repo_is_none(tmp_path: Path) -> None:
+    assert head_commit(tmp_path) is None
+    assert dirty_files(tmp_path) is None
+    assert changed_files_since(tmp_path, "HEAD") is None
+
+
+def test_head_commit_returns_sha(tmp_path: Path) -> None:
+    repo = _init_repo(tmp_path)
+    sha = head_commit(repo)
+    assert sha is not None
+    assert len(sha) == 40
+
+
+def test_changed_files_since_includes_committed_dirty_and_untracked(tmp_path: Path) -> None:
+    repo = _init_repo(tmp_path)
+    base = head_commit(repo)
+    assert base is not None
+
+    (repo / "a.py").write_text("a = 2\n")
+    _git(repo, "commit", "-q", "-am", "change a")
+    (repo / "b.py").write_text("b = 2\n")  # uncommitted
+    (repo / "c.py").write_text("c = 1\n")  # untracked
+
+    assert changed_files_since(repo, base) == ["a.py", "b.py", "c.py"]
+    assert dirty_files(repo) == ["b.py"]
+
+
+def test_changed_files_since_excludes_gitignored(tmp_path: Path) -> None:
+    repo = _init_repo(tmp_path)
+    base = head_commit(repo)
+    assert base is not None
+    (repo / ".gitignore").write_text("*.log\n")
+    (repo / "debug.log").write_text("noise\n")
+
+    assert changed_files_since(repo, base) == [".gitignore"]
+
+
+def test_changed_files_since_is_relative_to_subdirectory(tmp_path: Path) -> None:
+    repo = _init_repo(tmp_path)
+    base = head_commit(repo)
+    assert base is not None
+    (repo / "pkg").mkdir()
+    (repo / "pkg" / "x.py").write_text("x = 1\n")
+    (repo / "a.py").write_text("a = 2\n")
+
+    assert changed_files_since(repo / "pkg", base) == ["x.py"]
+
+
+def test_changed_files_since_unknown_commit_is_none(tmp_path: Path) -> None:
+    repo = _init_repo(tmp_path)
+    assert changed_files_since(repo, "0" * 40) is None
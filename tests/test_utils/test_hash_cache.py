@@ -0,0 +1,104 @@
+"""Tests for the stat-keyed hash cache."""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+from lexibrarian.utils.hash_cache import HashCache
+from lexibrarian.utils.hashing import hash_file
+
+
+def _age(path: Path, seconds: float = 60.0) -> None:
+    """Push a file's mtime into the past, outside the racy window."""
+    past = time.time() - seconds
+    os.utime(path, (past, past))
+
+
+def test_get_hash_matches_hash_file(tmp_path: Path) -> None:
+    source = tmp_path / "a.py"
+    source.write_text("x = 1\n")
+    cache = HashCache(tmp_path / "cache.json")
+
+    assert cache.get_hash("a.py", source) == hash_file(source)
+
+
+def test_unchanged_file_is_not_rehashed(tmp_path: Path) -> None:
+    source = tmp_path / "a.py"
+    source.write_text("x = 1\n")
+    _age(source)
+    cache = HashCache(tmp_path / "cache.json")
+    first = cache.get_hash("a.py", source)
+
+    with patch("lexibrarian.utils.hash_cache.hash_file") as mock_hash:
+        assert cache.get_hash("a.py", source) == first
+        mock_hash.assert_not_called()
+
+
+def test_modified_file_is_rehashed(tmp_path: Path) -> None:
+    source = tmp_path / "a.py"
+    source.write_text("x = 1\n")
+    _age(source, 120)
+    cache = HashCache(tmp_path / "cache.json")
+    first = cache.get_hash("a.py", source)
+
+    source.write_text("x = 2\n")
+    _age(source)
+    assert cache.get_hash("a.py", source) != first
+
+
+def test_recently_modified_file_is_not_cached(tmp_path: Path) -> None:
+    source = tmp_path / "a.py"
+    source.write_text("x = 1\n")
+    cache_path = tmp_path / "cache.json"
+    cache = HashCache(cache_path)
+    cache.get_hash("a.py", source)
+    cache.save()
+
+    assert not cache_path.exists()
+
+
+def test_save_load_roundtrip(tmp_path: Path) -> None:
+    source = tmp_path / "a.py"
+    source.write_text("x = 1\n")
+    _age(source)
+    cache_path = tmp_path / "cache.json"
+    cache = HashCache(cache_path)
+    digest = cache.get_hash("a.py", source)
+    cache.save()
+
+    reloaded = HashCache(cache_path)
+    reloaded.load()
+    with patch("lexibrarian.utils.hash_cache.hash_file") as mock_hash:
+        assert reloaded.get_hash("a.py", source) == digest
+        mock_hash.assert_not_called()
+
+
+def test_corrupted_cache_starts_fresh(tmp_path: Path) -> None:
+    cache_path = tmp_path / "cache.json"
+    cache_path.write_text("{not json")
+    source = tmp_path / "a.py"
+    source.write_text("x = 1\n")
+
+    cache = HashCache(cache_path)
+    cache.load()
+    assert cache.get_hash("a.py", source) == hash_file(source)
+
+
+def test_prune_removes_dead_keys(tmp_path: Path) -> None:
+    cache_path = tmp_path / "cache.json"
+    for name in ("a.py", "b.py"):
+        (tmp_path / name).write_text(name)
+        _age(tmp_path / name)
+    cache = HashCache(cache_path)
+    cache.get_hash("a.py", tmp_path / "a.py")
+    cache.get_hash("b.py", tmp_path / "b.py")
+
+    cache.prune({"a.py"})
+    cache.save()
+
+    data = json.loads(cache_path.read_text())
+    assert set(data["files"]) == {"a.py"}
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import hashlib
 from pathlib import Path
 
 from lexibrarian.utils.hashing import hash_file
@@ -49,7 +50,7 @@ def test_hash_file_chunks_large_file(tmp_path: Path) -> None:
     """hash_file should handle large files with chunked reading."""
     file_path = tmp_path / "large.bin"
 
-    # Write more than default chunk size (8192 bytes)
+    # Write several chunks with a partial final chunk
     large_content = b"x" * 20000
     file_path.write_bytes(large_content)
 
@@ -58,3 +59,26 @@ def test_hash_file_chunks_large_file(tmp_path: Path) -> None:
     # Should produce a hash
     assert len(hash_result) == 64
     assert hash_result.isalnum()
+
+
+def test_hash_file_matches_hashlib_across_buffer_boundary(tmp_path: Path) -> None:
+    """Streaming hash equals a one-shot hash for files larger than the buffer."""
+    file_path = tmp_path / "big.bin"
+    content = bytes(range(256)) * 1500 + b"tail"  # > 256 KiB, not buffer-aligned
+    file_path.write_bytes(content)
+
+    assert hash_file(file_path) == hashlib.sha256(content).hexdigest()
+    assert hash_file(file_path, chunk_size=1000) == hashlib.sha256(content).hexdigest()
+
+
+def test_hash_file_matches_file_digest(tmp_path: Path) -> None:
+    """hash_file agrees with hashlib.file_digest, including for empty files."""
+    empty = tmp_path / "empty.bin"
+    empty.write_bytes(b"")
+    data = tmp_path / "data.bin"
+    data.write_bytes(bytes(range(256)) * 3000)
+
+    for path in (empty, data):
+        with open(path, "rb") as f:
+            expected = hashlib.file_digest(f, "sha256").hexdigest()
+        assert hash_file(path) == expected
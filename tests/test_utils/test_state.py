@@ -0,0 +1,33 @@
+"""Tests for persistent library state."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from lexibrarian.utils.state import LibraryState, load_state, save_state, state_path
+
+
+def test_load_missing_state_is_empty(tmp_path: Path) -> None:
+    assert load_state(tmp_path) == LibraryState()
+
+
+def test_save_load_roundtrip(tmp_path: Path) -> None:
+    (tmp_path / ".lexibrary").mkdir()
+    state = LibraryState(indexed_head="abc123", dirty_files=["src/a.py"], config_fingerprint="f")
+    save_state(tmp_path, state)
+
+    assert load_state(tmp_path) == state
+
+
+def test_corrupted_state_is_empty(tmp_path: Path) -> None:
+    (tmp_path / ".lexibrary").mkdir()
+    state_path(tmp_path).write_text("[not, an, object]")
+
+    assert load_state(tmp_path) == LibraryState()
+
+
+def test_unknown_version_is_empty(tmp_path: Path) -> None:
+    (tmp_path / ".lexibrary").mkdir()
+    state_path(tmp_path).write_text('{"version": 99, "indexed_head": "abc"}')
+
+    assert load_state(tmp_path) == LibraryState()
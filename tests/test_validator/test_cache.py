@@ -0,0 +1,202 @@
+"""Tests for the fingerprint-keyed validation report cache."""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from lexibrarian.validator import AVAILABLE_CHECKS, validate_library
+from lexibrarian.validator.cache import (
+    CACHE_FILENAME,
+    library_fingerprint,
+    load_cached_report,
+    save_cached_report,
+)
+from lexibrarian.validator.report import ValidationIssue, ValidationReport
+
+needs_git = pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(["git", "-C", str(repo), *args], check=True, capture_output=True)
+
+
+def _git_project(tmp_path: Path) -> Path:
+    """Create a committed project with a source file and an empty library."""
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "config", "user.email", "test@example.com")
+    _git(tmp_path, "config", "user.name", "Test")
+    (tmp_path / ".lexibrary").mkdir()
+    (tmp_path / ".lexibrary" / "config.yaml").write_text("scope_root: .\n")
+    (tmp_path / "main.py").write_text("x = 1\n")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-q", "-m", "initial")
+    return tmp_path
+
+
+def _bump_mtime(path: Path) -> None:
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def _issue(check: str, severity: str = "warning") -> ValidationIssue:
+    return ValidationIssue(
+        severity=severity,  # type: ignore[arg-type]
+        check=check,
+        message="msg",
+        artifact="a.md",
+    )
+
+
+# ---------------------------------------------------------------------------
+# Fingerprint
+# ---------------------------------------------------------------------------
+
+
+def test_fingerprint_outside_git_is_none(tmp_path: Path) -> None:
+    (tmp_path / ".lexibrary").mkdir()
+    assert library_fingerprint(tmp_path, tmp_path / ".lexibrary") is None
+
+
+@needs_git
+def test_fingerprint_is_stable(tmp_path: Path) -> None:
+    project = _git_project(tmp_path)
+    lexibrary_dir = project / ".lexibrary"
+    assert library_fingerprint(project, lexibrary_dir) == library_fingerprint(
+        project, lexibrary_dir
+    )
+
+
+@needs_git
+def test_fingerprint_changes_with_source_edits(tmp_path: Path) -> None:
+    project = _git_project(tmp_path)
+    lexibrary_dir = project / ".lexibrary"
+    before = library_fingerprint(project, lexibrary_dir)
+
+    (project / "main.py").write_text("x = 2\n")
+    after_edit = library_fingerprint(project, lexibrary_dir)
+    assert after_edit != before
+
+    # A further edit to an already-dirty file is still detected
+    _bump_mtime(project / "main.py")
+    assert library_fingerprint(project, lexibrary_dir) != after_edit
+
+
+@needs_git
+def test_fingerprint_changes_with_library_edits(tmp_path: Path) -> None:
+    project = _git_project(tmp_path)
+    lexibrary_dir = project / ".lexibrary"
+    before = library_fingerprint(project, lexibrary_dir)
+
+    (lexibrary_dir / "main.py.md").write_text("design\n")
+    assert library_fingerprint(project, lexibrary_dir) != before
+
+
+@needs_git
+def test_fingerprint_ignores_sidecar_caches(tmp_path: Path) -> None:
+    project = _git_project(tmp_path)
+    lexibrary_dir = project / ".lexibrary"
+    before = library_fingerprint(project, lexibrary_dir)
+
+    (lexibrary_dir / ".status_cache.json").write_text("{}")
+    (lexibrary_dir / CACHE_FILENAME).write_text("{}")
+    (lexibrary_dir / ".llm_cache" / "ab").mkdir(parents=True)
+    (lexibrary_dir / ".llm_cache" / "ab" / "abcd.json").write_text("{}")
+    assert library_fingerprint(project, lexibrary_dir) == before
+
+
+# ---------------------------------------------------------------------------
+# Load / save
+# ---------------------------------------------------------------------------
+
+
+def test_roundtrip_filters_to_requested_checks(tmp_path: Path) -> None:
+    report = ValidationReport(issues=[_issue("hash_freshness"), _issue("file_existence", "error")])
+    save_cached_report(tmp_path, "fp", {"hash_freshness", "file_existence"}, report)
+
+    cached = load_cached_report(tmp_path, "fp", {"file_existence"})
+    assert cached is not None
+    assert [i.check for i in cached.issues] == ["file_existence"]
+
+
+def test_fingerprint_mismatch_misses(tmp_path: Path) -> None:
+    save_cached_report(tmp_path, "fp", {"hash_freshness"}, ValidationReport())
+    assert load_cached_report(tmp_path, "other", {"hash_freshness"}) is None
+
+
+def test_narrower_cached_run_misses(tmp_path: Path) -> None:
+    save_cached_report(tmp_path, "fp", {"hash_freshness"}, ValidationReport())
+    assert load_cached_report(tmp_path, "fp", {"hash_freshness", "file_existence"}) is None
+
+
+def test_corrupted_cache_misses(tmp_path: Path) -> None:
+    (tmp_path / CACHE_FILENAME).write_text("not json")
+    assert load_cached_report(tmp_path, "fp", set()) is None
+
+
+# ---------------------------------------------------------------------------
+# validate_library(use_cache=True)
+# ---------------------------------------------------------------------------
+
+
+@needs_git
+def test_validate_library_reuses_cached_report(tmp_path: Path) -> None:
+    project = _git_project(tmp_path)
+    lexibrary_dir = project / ".lexibrary"
+    (lexibrary_dir / "concepts").mkdir()
+    (lexibrary_dir / "concepts" / "Broken.md").write_text("no frontmatter\n")
+
+    full = validate_library(project, lexibrary_dir, use_cache=True)
+    assert full.summary.error_count > 0
+    assert (lexibrary_dir / CACHE_FILENAME).exists()
+
+    calls: list[str] = []
+
+    def _record(project_root: Path, lexibrary_dir: Path) -> list[ValidationIssue]:
+        calls.append("ran")
+        return []
+
+    recording = {name: (_record, sev) for name, (_fn, sev) in AVAILABLE_CHECKS.items()}
+    with patch.dict(AVAILABLE_CHECKS, recording):
+        # A full run covers the warning-level subset, so nothing is re-run
+        cached = validate_library(project, lexibrary_dir, severity_filter="warning", use_cache=True)
+        assert calls == []
+        assert cached.issues == [i for i in full.issues if i.severity != "info"]
+
+        # Any library change invalidates the cached report
+        (lexibrary_dir / "concepts" / "Broken.md").write_text("still broken\n")
+        validate_library(project, lexibrary_dir, severity_filter="warning", use_cache=True)
+        assert calls
+
+
+@needs_git
+def test_new_directory_reported_despite_cache(tmp_path: Path) -> None:
+    """aindex_coverage runs live, so a directory git cannot see is still reported."""
+    project = _git_project(tmp_path)
+    lexibrary_dir = project / ".lexibrary"
+    validate_library(project, lexibrary_dir, use_cache=True)
+
+    (project / "newpkg").mkdir()
+    cached = validate_library(project, lexibrary_dir, use_cache=True)
+    fresh = validate_library(project, lexibrary_dir, use_cache=False)
+
+    assert "Directory not indexed: newpkg" in [i.message for i in cached.issues]
+    assert cached.issues == fresh.issues
+
+
+@needs_git
+def test_uncached_checks_not_stored(tmp_path: Path) -> None:
+    """The stored report omits aindex_coverage issues and check names."""
+    project = _git_project(tmp_path)
+    lexibrary_dir = project / ".lexibrary"
+    validate_library(project, lexibrary_dir, use_cache=True)
+
+    data = json.loads((lexibrary_dir / CACHE_FILENAME).read_text(encoding="utf-8"))
+    assert "aindex_coverage" not in data["checks"]
+    assert all(i["check"] != "aindex_coverage" for i in data["report"]["issues"])